@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+"""
+    Snake Game - Batch
+
+    Plays many headless AI only games across processes, for tuning the ai.
+
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv2, see LICENSE for more details.
+"""
+
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from copy import deepcopy
+from csv import writer as csv_writer
+from json import load as json_load
+from logging import disable as logging_disable, INFO
+from os import cpu_count, makedirs, path
+from statistics import fmean, median
+
+
+# Columns of the results file, one row per snake per game
+RESULT_COLUMNS = ("config", "run", "seed", "snake", "score", "survival_ticks", "survival_ms", "game_ticks")
+
+# The headless game of this worker process
+_game = None
+
+
+def _init_worker() -> None:
+    """_init_worker
+
+    Load a headless app and game once per worker process
+    """
+
+    # pylint: disable=global-statement
+    global _game
+
+    from pkg.app import App
+    from pkg.games.snake_game import SnakeGame
+
+    # Keep the logs to warnings, tens of thousands of ai decisions get logged otherwise
+    logging_disable(INFO)
+
+    app = App([SnakeGame], headless=True)
+    _game = app.load_headless_game(SnakeGame)
+    _game.base_gameplay = deepcopy(_game.game_config["settings"]["gameplay"])
+
+
+def _play(name: str, run: int, seed: int, n_ticks: int, gameplay: dict, ai_settings: dict) -> list[tuple]:
+    """_play
+
+    Play one game with a config
+
+    Returns:
+        [list]: Rows of RESULT_COLUMNS for every snake of the game
+    """
+
+    # Every config starts from the game_config.json settings, AI only
+    settings = _game.game_config["settings"]
+    settings["gameplay"] = deepcopy(_game.base_gameplay)
+    settings["gameplay"].update(gameplay)
+    settings["gameplay"]["human_player"] = False
+
+    scores = _game.simulate(n_ticks, seed=seed, ai_settings=ai_settings)
+
+    step_ms = _game.tick_clock.step_ms
+    game_ticks = _game.tick_clock.tick
+
+    rows = []
+    for snake_id, survival in _game.entity_survival.items():
+        score = scores.get(snake_id, {}).get("score", 0)
+        ticks = survival["ticks"]
+        rows.append((name, run, seed, survival["name"], score, ticks, ticks * step_ms, game_ticks))
+
+    return rows
+
+
+def load_configs(configs_path: str = None) -> list[dict]:
+    """load_configs
+
+    A configs file is a json list of {"name", "gameplay", "ai"} objects, gameplay
+    holding GameConfig gameplay settings (grid_size excluded) and ai DecisionBox settings.
+
+    Returns:
+        [list]: The configs to play, the game_config.json settings alone without a file
+    """
+
+    if configs_path is None:
+        return [{"name": "default", "gameplay": {}, "ai": {}}]
+
+    with open(configs_path, encoding="utf8") as json_data_file:
+        configs = json_load(json_data_file)
+
+    for index, config in enumerate(configs):
+        config.setdefault("name", f"config_{index}")
+        config.setdefault("gameplay", {})
+        config.setdefault("ai", {})
+
+    return configs
+
+
+def write_results(results_path: str, rows: list[tuple]) -> None:
+    """write_results
+
+    Args:
+        results_path (str): csv file to write
+        rows (list): Rows of RESULT_COLUMNS
+    """
+
+    directory = path.dirname(results_path)
+    if directory:
+        makedirs(directory, exist_ok=True)
+
+    with open(results_path, "w", newline="", encoding="utf8") as csv_file:
+        csv = csv_writer(csv_file)
+        csv.writerow(RESULT_COLUMNS)
+        csv.writerows(rows)
+
+
+def summarize(rows: list[tuple]) -> list[str]:
+    """summarize
+
+    Returns:
+        [list]: A line of score/survival stats per config
+    """
+
+    by_config: dict[str, list[tuple]] = {}
+    for row in rows:
+        by_config.setdefault(row[0], []).append(row)
+
+    lines = []
+    for name, config_rows in by_config.items():
+        scores = [row[4] for row in config_rows]
+        survival = [row[6] for row in config_rows]
+        games = len({row[1] for row in config_rows})
+        lines.append(
+            f"{name}: games:{games} snakes:{len(config_rows)}"
+            f" score mean:{fmean(scores):.1f} median:{median(scores)} max:{max(scores)}"
+            f" survival_ms mean:{fmean(survival):.0f} median:{median(survival):.0f}"
+        )
+
+    return lines
+
+
+def main():
+    """main
+
+    The batch runner startup
+    """
+
+    parser = ArgumentParser(description="Play headless AI only snake games in parallel and collect the results.")
+    parser.add_argument("--configs", help="json list of {name, gameplay, ai} settings to play, defaults to game_config.json alone")
+    parser.add_argument("--runs", type=int, default=10, help="games per config (default: 10)")
+    parser.add_argument("--ticks", type=int, default=30000, help="max ticks per game (default: 30000)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of run 0, run n is seed + n for every config (default: 0)")
+    parser.add_argument("--workers", type=int, default=cpu_count(), help="worker processes (default: cpu count)")
+    parser.add_argument("--out", default="logs/batch_results.csv", help="csv file to write (default: logs/batch_results.csv)")
+    args = parser.parse_args()
+
+    configs = load_configs(args.configs)
+
+    rows = []
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as executor:
+        futures = [
+            executor.submit(_play, config["name"], run, args.seed + run, args.ticks, config["gameplay"], config["ai"])
+            for config in configs
+            for run in range(args.runs)
+        ]
+
+        for done, future in enumerate(as_completed(futures), 1):
+            rows.extend(future.result())
+            print(f"\rgames: {done}/{len(futures)}", end="", flush=True)
+
+    print()
+
+    # Same order every time, whatever order the games finished in
+    rows.sort(key=lambda row: (row[0], row[1], row[3]))
+    write_results(args.out, rows)
+
+    for line in summarize(rows):
+        print(line)
+
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
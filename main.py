@@ -14,62 +14,37 @@ __author__ = "Nicholas Murphy"
 __version__ = '1.0.3-alpha'
 
 
-from functools import wraps
-from io import StringIO
+from argparse import ArgumentParser
 from sys import exit as sys_exit
 
-from cProfile import Profile
-from pstats import Stats
-from pygame import (
-    display as pygame_display,
-    quit as pygame_quit,
-    image as pygame_image,
-)
+from pkg.startup_trace import StartupTrace
 
-from pkg.app import App
-from pkg.games.snake_game import SnakeGame
 
+def main():
+    """main
 
-# profiling decorator
-def profiling():
-    """Profiler
-
-    decorator for game processing optimization
+    The main app startup
     """
 
-    def _profiling(function_param):
-        @wraps(function_param)
-        def __profiling(*rgs, **kwargs):
-            profile = Profile()
-            profile.enable()
-
-            result = function_param(*rgs, **kwargs)
-
-            profile.disable()
-
-            # save readable stats into file
-            string_io = StringIO()
-            profile_stats = Stats(profile, stream=string_io).sort_stats("tottime")
-
-            # skip strip_dirs() if you want to see full path's
-            profile_stats.print_stats()
+    parser = ArgumentParser(description="It's snake.")
+    parser.add_argument("--startup-trace", action="store_true", help="write the import and init times up to the first game frame to logs/startup_trace.txt")
+    parser.add_argument("--defer-audio", action="store_true", help="open the window before the audio mixer, the mixer starts with the first sound")
+    args = parser.parse_args()
 
-            with open("logs/profile.txt", "w+", encoding="utf8") as output_file:
-                output_file.write(string_io.getvalue())
+    # Imported here so the startup trace can time them
+    startup_trace = StartupTrace(enabled=args.startup_trace)
+    startup_trace.trace_imports()
 
-            return result
+    from pygame import (
+        display as pygame_display,
+        quit as pygame_quit,
+        image as pygame_image,
+    )
 
-        return __profiling
+    from pkg.app import App
+    from pkg.games.snake_game import SnakeGame
 
-    return _profiling
-
-
-@profiling()
-def main():
-    """main
-
-    The main app startup
-    """
+    startup_trace.mark("imports done")
 
     # Import and set the window icon
     icon = pygame_image.load("_internal/assets/icons/favicon.ico")
@@ -79,7 +54,7 @@ def main():
     game_module_list = [SnakeGame]
 
     # Initilize the base game with the game options
-    app = App(game_module_list)
+    app = App(game_module_list, defer_audio=args.defer_audio, startup_trace=startup_trace)
 
     # Run the loaded game from the app platform
     app.run()
@@ -19,10 +19,8 @@ from logging import (
     debug as logging_debug,
     info as logging_info,
 )
-import numpy as np
 from os import path, getcwd
 from pathlib import Path
-from statistics import mean
 
 from pygame import (
     draw as pygame_draw,
@@ -35,14 +33,14 @@ from pygame import (
     get_init as pygame_get_init,
     time as pygame_time,
     mixer as pygame_mixer,
-    sndarray as pygame_sndarray,
     Surface,
     DOUBLEBUF,
     FULLSCREEN,
+    NOEVENT,
     USEREVENT,
 )
 from pygame.constants import (
-    QUIT, KEYDOWN, K_ESCAPE, MOUSEBUTTONDOWN,
+    QUIT, KEYDOWN, K_ESCAPE, K_F9, MOUSEBUTTONDOWN,
     MOUSEBUTTONUP, WINDOWFOCUSGAINED, WINDOWFOCUSLOST, USEREVENT
 )
 
@@ -52,7 +50,10 @@ from pkg.constants.app_constants import (
     COLOR_PURPLE,
     CONFIG_APP_FILE_NAME,
     DEFAULT_APP_CONFIG,
+    IDLE_DELAY_MS,
     LOG_FILE_NAME,
+    PROFILE_FILE_PATH,
+    STARTUP_TRACE_FILE_PATH,
     MENU_PAUSE,
     MOUSE_DOWN_MAP,
     REGULAR_FONT,
@@ -63,6 +64,14 @@ from pkg.constants.app_constants import (
 )
 from pkg.menus.menus import Menu
 from pkg.app_config import AppConfig
+from pkg.fps_counter import FpsCounter
+from pkg.headless import HeadlessSurface, use_dummy_drivers
+from pkg.profiler import Profiler
+from pkg.renderer import Renderer
+from pkg.sound_bank import SoundBank
+from pkg.startup_trace import StartupTrace
+from pkg.voices import VoiceManager
+from pkg.text_cache import TextCache
 
 
 # Define custom events
@@ -96,31 +105,61 @@ class App():
     Base app structure.
     """
 
-    def __init__(self, game_list: list):
+    def __init__(self, game_list: list, headless: bool = False, defer_audio: bool = False, startup_trace: StartupTrace = None):
+        """App initilizer
+
+        Args:
+            game_list (list): Game classes to choose from
+            headless (bool, optional): Run without a display or audio device. Defaults to False.
+            defer_audio (bool, optional): Start the mixer on the first sound instead of before the window. Defaults to False.
+            startup_trace (StartupTrace, optional): Times the init steps up to the first frame. Defaults to None (not timed).
+        """
+
+        # Run without a display or audio device (simulations/servers)
+        self.headless = headless
+        if self.headless:
+            use_dummy_drivers()
+
+        self.startup_trace = startup_trace or StartupTrace()
+
+        # Sound effects of the app and games, loaded once per file
+        self.sound_bank = SoundBank()
+
+        # Sound effect playback, set up along with the mixer
+        self.voices = VoiceManager()
+
         # setup mixer to avoid sound lag
-        self.set_up_audio_mixer()
+        with self.startup_trace.step("app: audio mixer"):
+            if defer_audio and not self.headless:
+                self._set_up_without_mixer()
+            else:
+                self.set_up_audio_mixer()
 
         # Menu settings
         self.menu = Menu(self)
         self.pause_menu_options = {}
 
         # App fonts
-        try:
-            self.app_font = freetype.Font(
-                file=REGULAR_FONT,
-                size=REGULAR_FONT_SIZE,
+        with self.startup_trace.step("app: fonts"):
+            try:
+                self.app_font = freetype.Font(
+                    file=REGULAR_FONT,
+                    size=REGULAR_FONT_SIZE,
+                )
+            except:
+                self.app_font = pygame_freetype.SysFont(pygame_font.get_default_font(), REGULAR_FONT_SIZE)
+
+        with self.startup_trace.step("app: loading screen"):
+            self.screen = pygame_display.set_mode(
+                (640, 360),
+                DOUBLEBUF,
+                16,
             )
-        except:
-            self.app_font = pygame_freetype.SysFont(pygame_font.get_default_font(), REGULAR_FONT_SIZE)
 
-        self.screen = pygame_display.set_mode(
-            (640, 360),
-            DOUBLEBUF,
-            16,
-        )
+            # Initial app window settings
+            self._display_loading_screen(self.screen)
 
-        # Initial app window settings
-        self._display_loading_screen(self.screen)
+        self.startup_trace.mark("loading screen shown")
 
         # App config file
         self.app_config_file_path = path.join(path.dirname(__file__), CONFIG_APP_FILE_NAME)
@@ -158,40 +197,29 @@ class App():
         self.game = None
         self.running = True
         self.fps = self.app_config["settings"]["display"]["fps"]
-        self.fps_list = []
         self.clock = None
         self.title = self.app_config["settings"]["display"]["window_title"]
         self.screen = None
+        self.profiler = Profiler(enabled=self.app_config["settings"]["debug"]["profiler"])
+        self.renderer = Renderer(headless=self.headless, profiler=self.profiler)
+        self.text_cache = TextCache()
+        self.fps_counter = FpsCounter(self)
         self.debug_screen = None
         self.alpha_screen = None
         self.background_0 = None
         self.keybinding_switch = (False, None)
         self.focus_pause = False
 
-        # Sound settings
-        if self.is_audio:
-            try:
-                self.menu_sounds = [
-                    pygame_mixer.Sound(SOUND_UI_HOVER), # hover
-                    pygame_mixer.Sound(SOUND_UI_FORWARD), # forward
-                    pygame_mixer.Sound(SOUND_UI_BACKWARD), # backward
-                ]
-            except FileNotFoundError:
-                # default fallback sound
-                size = 44100
-                sounds = []
-                for num in range(3):
-                    sound_arr = np.random.randint(-32768, 32767, size=size*2)
-                    sound_arr = sound_arr.reshape(size, 2)
-                    default_sound = pygame_sndarray.make_sound(sound_arr)
-                    sounds.append(default_sound)
-                self.menu_sounds = [
-                    pygame_mixer.Sound(sounds[0]), # hover
-                    pygame_mixer.Sound(sounds[1]), # forward
-                    pygame_mixer.Sound(sounds[2]), # backward
-                ]
-        else:
-            self.menu_sounds = [None, None, None]
+        # When the last event came in, idle frame pacing waits for a quiet spell
+        self.last_event_ms = 0
+
+        # Sound effect volumes
+        self.voices.set_volumes(self.app_config["settings"]["sound"])
+
+        # Sound settings, a deferred mixer loads them with the first menu sound
+        self.menu_sounds = None
+        if self._is_audio:
+            self._load_menu_sounds()
 
         self.ui_sound_options = {}
         self.pause_game_music = False
@@ -224,6 +252,10 @@ class App():
         _display_loading_screen does stuff
         """
 
+        # Nothing to show without a display
+        if self.headless:
+            return
+
         self.screen.fill(COLOR_BLACK)
 
         text_str = "Loading. . ."
@@ -256,41 +288,133 @@ class App():
         self.clock = pygame_time.Clock()
 
         # Game window settings
-        self.set_window_settings()
+        with self.startup_trace.step("app: window"):
+            self.set_window_settings()
 
         # Choose game to play
         self.choose_game_loop()
 
+        profiler = self.profiler
+
         # App loop
         while self.running:
-            # Send event NEXT every time music tracks ends
-            pygame_mixer.music.set_endevent(NEXT)
+            # The frame is the work, waiting on the clock after it is not
+            with profiler.span("frame"):
+                # Send event NEXT every time music tracks ends
+                pygame_mixer.music.set_endevent(NEXT)
 
-            chosen_menu = None
+                chosen_menu = None
+                is_game_frame = False
+
+                # Go into gameplay loop if not in a menu
+                if self.menu.menu_option is None:
+                    # Gameplay logic/drawing this turn/tick
+                    with profiler.span("play_loop"):
+                        self.game.play_loop()
+                    is_game_frame = True
+
+                else:
+                    # Show which ever menu option that has been chosen
+                    with profiler.span("menu"):
+                        # Menus only draw (and mark the screen) when entered or changed
+                        chosen_menu = self.menu.menu_options.get(self.menu.menu_option)()
+
+                # The game loop FPS counter
+                is_fps_display_shown = self.app_config["settings"]["display"]["fps_display"]
+                if is_fps_display_shown:
+                    with profiler.span("fps_display"):
+                        self.fps_counter_display()
+
+                # System/window events to be checked
+                with profiler.span("event_checks"):
+                    self.event_checks(chosen_menu)
+                    pygame_event.clear()
+
+                # Display the changed parts of the game screen
+                with profiler.span("present"):
+                    self.renderer.present()
+
+            # Startup is over once the game's first frame is up, the menus come before it
+            if self.startup_trace.enabled:
+                self.startup_trace.mark("first menu frame shown")
+                if is_game_frame:
+                    self.startup_trace.mark("first game frame shown")
+                    self._finish_startup_trace()
 
-            # Go into gameplay loop if not in a menu
-            if self.menu.menu_option is None:
-                # Gameplay logic/drawing this turn/tick
-                self.game.play_loop()
+            # The game loop clocktarget FPS
+            with profiler.span("clock_wait"):
+                self.frame_wait()
 
-            else:
-                # Show which ever menu option that has been chosen
-                chosen_menu = self.menu.menu_options.get(self.menu.menu_option)()
+        # Quit before the game was ever played, save what was traced
+        if self.startup_trace.enabled:
+            self._finish_startup_trace()
 
-            # The game loop FPS counter
-            is_fps_display_shown = self.app_config["settings"]["display"]["fps_display"]
-            if is_fps_display_shown:
-                self.fps_counter_display()
+        # Leave the frame profile of the session behind
+        if profiler.enabled:
+            profiler.dump(PROFILE_FILE_PATH)
 
-            # System/window events to be checked
-            self.event_checks(chosen_menu)
-            pygame_event.clear()
 
-            # Display the game screen
-            pygame_display.flip()
+    def _finish_startup_trace(self) -> None:
+        """_finish_startup_trace
 
-            # The game loop clocktarget FPS
-            self.clock.tick(self.fps)
+        Save the startup trace, then stop tracing
+        """
+
+        trace = self.startup_trace
+        trace.stop_imports()
+        trace.enabled = False
+
+        trace.dump(STARTUP_TRACE_FILE_PATH)
+
+
+    @property
+    def is_audio(self) -> bool:
+        """is_audio
+
+        Returns:
+            [bool]: If sounds can be played, the first ask starts a deferred mixer
+        """
+
+        if self._is_audio is None:
+            with self.startup_trace.step("app: audio mixer (deferred)"):
+                self.set_up_audio_mixer()
+
+        return self._is_audio
+
+
+    @is_audio.setter
+    def is_audio(self, is_audio: bool) -> None:
+        self._is_audio = is_audio
+
+
+    def _set_up_without_mixer(self) -> None:
+        """_set_up_without_mixer
+
+        Start what the window needs and leave the mixer (and opening the
+        audio device) for the first time is_audio is asked
+        """
+
+        pygame_display.init()
+        pygame_font.init()
+        pygame_freetype.init()
+
+        # Starts the timer pygame.init would have, get_ticks is 0 without it
+        pygame_time.wait(0)
+
+        self._is_audio = None
+
+
+    def _load_menu_sounds(self) -> None:
+        """_load_menu_sounds
+
+        _load_menu_sounds does stuff
+        """
+
+        self.menu_sounds = self.sound_bank.preload([
+            SOUND_UI_HOVER, # hover
+            SOUND_UI_FORWARD, # forward
+            SOUND_UI_BACKWARD, # backward
+        ])
 
 
     def set_up_audio_mixer(self):
@@ -300,6 +424,15 @@ class App():
         set_up_audio_mixer does stuff
         """
 
+        # The mixer is never started without an audio device
+        if self.headless:
+            if not pygame_get_init():
+                pygame_init()
+            pygame_mixer.quit()
+            self.is_audio = False
+            self.voices.setup()
+            return
+
         if not pygame_get_init():
             # setup mixer to avoid sound lag
             pygame_mixer.pre_init(44100, -16, 2, 2048)
@@ -323,6 +456,9 @@ class App():
             except pygame_error:
                 pass
 
+        # Channels of the (re)started mixer
+        self.voices.setup()
+
 
     def set_window_settings(self) -> None:
         """
@@ -345,6 +481,11 @@ class App():
             16,
         )
         self.screen.set_alpha(None)
+
+        # Skip blitting when there is nothing to look at
+        if self.headless:
+            self.screen = HeadlessSurface((self.screen_width, self.screen_height))
+
         self.debug_screen = Surface((self.screen_width, self.screen_height))
         self.debug_screen.set_colorkey(COLOR_BLACK)
         self.background_0 = Surface((self.screen_width, self.screen_height))
@@ -356,10 +497,14 @@ class App():
 
         self.alpha_screen.fill([0,0,0,0])
         pygame_display.set_caption(self.title)
-        self.screen.fill(background_colour)
+
+        # Only push the changed parts of the screen to the display
+        self.renderer.full_update_ratio = self.app_config["settings"]["display"]["dirty_rect_threshold"]
+        self.renderer.set_screen(self.screen)
+        self.renderer.fill(background_colour)
 
         # Show game window
-        pygame_display.flip()
+        self.renderer.present()
 
 
     def set_game_settings(self) -> None:
@@ -369,7 +514,8 @@ class App():
         """
 
         # Instantiate the Game Obj
-        self.game = self.game_pkg(self, self.alpha_screen, self.screen)
+        with self.startup_trace.step("game: init"):
+            self.game = self.game_pkg(self, self.alpha_screen, self.screen)
 
         # Instatiate options dict's
         self.ui_sound_options = {
@@ -384,31 +530,45 @@ class App():
         }
 
 
-    def fps_counter_display(self) -> None:
-        """fps_counter_display
+    def load_headless_game(self, game_pkg: type):
+        """load_headless_game
 
-        fps_counter_display for the game
+        Set up the window and game obj without going through the game menus
+
+        Args:
+            game_pkg ([type]): The game class to load
+
+        Returns:
+            [BaseGame]: The loaded game obj
         """
 
-        fps = str(int(self.clock.get_fps()))[0:3].rjust(3, "0")
+        # Game loop clock
+        self.clock = pygame_time.Clock()
+
+        # Game window settings
+        self.set_window_settings()
+
+        # Load the game
+        self._load_game(game_pkg)
+        self.set_game_settings()
 
-        _ = self.menu.render_text(f"now:{fps}", 1.6, 12.2, relative_from="right")
+        return self.game
 
-        self.fps_list.append(int(fps))
 
-        # Keep the fps list limited to 100 most recient samples
-        if len(self.fps_list) > 200:
-            self.fps_list.pop(0)
+    def fps_counter_display(self) -> None:
+        """fps_counter_display
 
-        # Average FPS
-        avg_fps = str(round(mean(self.fps_list)))[0:3].rjust(3, "0")
-        _ = self.menu.render_text(f"avg:{avg_fps}", 2.6, 12.2, relative_from="right")
+        fps_counter_display for the game
+        """
 
-        # High and low FPS
-        high_fps = str(max(self.fps_list)).rjust(3, "0")
-        low_fps = str(min(self.fps_list)).rjust(3, "0")
-        self.menu.render_text(f"H:{high_fps}", 3.7, 9, relative_from="right")
-        self.menu.render_text(f"L:{low_fps}", 4.7, 8.8, relative_from="right")
+        # Time the last frame took, waiting on the clock included
+        self.fps_counter.update(self.clock.get_time())
+
+        # Top right under the game bar
+        self.fps_counter.draw((
+            self.game.screen_size[0] - self.fps_counter.width - 4,
+            int(self.app_font.size * 1.6),
+        ))
 
 
     def event_checks(self, current_menu: int) -> None:
@@ -425,17 +585,53 @@ class App():
             #   MOUSEBUTTONUP, MOUSEBUTTONDOWN, MOUSEHOVER
             decision_func = self.event_options.get(event.type)
             if decision_func:
+                self.last_event_ms = pygame_time.get_ticks()
                 decision_func(event=event, menu=current_menu)
 
 
+    def frame_wait(self) -> None:
+        """frame_wait
+
+        Wait out the rest of the frame at the fps target. In a menu or with
+        the window unfocused, once no event came in for IDLE_DELAY_MS, frames
+        come at idle_fps instead, the wait cut short by the next event so
+        input goes back to the full rate right away.
+        """
+
+        display_config = self.app_config["settings"]["display"]
+
+        is_idle = (
+            display_config["adaptive_fps"]
+            and (self.menu.menu_option is not None or self.focus_pause)
+            and pygame_time.get_ticks() - self.last_event_ms > IDLE_DELAY_MS
+        )
+
+        if not is_idle:
+            self.clock.tick(self.fps)
+            return
+
+        # Sleep until an event comes in or it's time for the next idle frame
+        event = pygame_event.wait(int(1000 / max(1, display_config["idle_fps"])))
+        if event.type != NOEVENT:
+            # Put it back for the next frame's event checks
+            pygame_event.post(event)
+
+        # Still tick the clock, the fps display reads the frame time from it
+        self.clock.tick()
+
+
     def settings_checks(self) -> None:
         """settings_checks
 
         settings_checks does stuff
         """
+        # Frame profiler on/off
+        self.profiler.set_enabled(self.app_config["settings"]["debug"]["profiler"])
+
         # Start/Restart the game music
         if self.is_audio:
             self.set_up_audio_mixer()
+            self.voices.set_volumes(self.app_config["settings"]["sound"])
             is_playing = pygame_mixer.music.get_busy()
             if self.app_config["settings"]["sound"]["music"] and not is_playing:
                 pygame_mixer.music.load(self.game.playlist[self.game.current_track])
@@ -518,6 +714,14 @@ class App():
             self.change_keybinding(self.keybinding_switch[1], kwargs["event"].unicode)
             self.keybinding_switch = (False, None)
 
+        # Pressed F9 to write out the frame profile so far (also mid game)
+        elif kwargs["event"].key == K_F9 and self.profiler.enabled:
+            self.profiler.dump(PROFILE_FILE_PATH)
+
+        # Gameplay input goes to the game
+        elif self.game and self.menu.menu_option is None:
+            self.game.key_down(kwargs["event"].key)
+
 
     def mouse_down(self, **kwargs) -> None:
         """mouse_down
@@ -602,10 +806,11 @@ class App():
             num ([int]): [description]
         """
 
-        menu_sound = self.menu_sounds[num]
         if self.is_audio:
-            menu_sound.set_volume(float(self.app_config["settings"]["sound"]["menu_volume"])/1.5)
-            pygame_mixer.Sound.play(menu_sound)
+            if self.menu_sounds is None:
+                self._load_menu_sounds()
+
+            self.voices.play(self.menu_sounds[num], 1 / 1.5, group="menu")
 
 
     def choose_game_loop(self) -> None:
@@ -617,9 +822,8 @@ class App():
 
         # Choose Game loop
         while not self.game_pkg and self.running:
-            # Send event NEXT every time music tracks ends
-            if self.is_audio:
-                pygame_mixer.music.set_endevent(NEXT)
+            # Send event NEXT every time music tracks ends (asking is_audio here would start a deferred mixer)
+            pygame_mixer.music.set_endevent(NEXT)
 
             # Gameplay logic this turn/tick
             menu = self._choose_game()
@@ -629,10 +833,11 @@ class App():
             pygame_event.clear()
 
             # Display the game screen
-            pygame_display.flip()
+            self.renderer.present()
+            self.startup_trace.mark("choose game screen shown")
 
             # The game loop clocktarget FPS
-            self.clock.tick(self.fps)
+            self.frame_wait()
 
         # Complete final game settings
         if self.game_pkg:
@@ -689,6 +894,9 @@ class App():
             self.menu.menu.append((button, self._load_game, 0, game))
             index += 1
 
+        # Drawn once, pushed once
+        self.renderer.mark_all()
+
         return self.menu.menu
 
 
@@ -25,16 +25,30 @@ class DisplayConfig(TypedDict):
     fullscreen: bool
     resolution: str
     window_title: str
+    dirty_rect_threshold: float
+    adaptive_fps: bool
+    idle_fps: int
 
 
 class DebugConfig(TypedDict):
     log_level: str
+    debug_mode: bool
+    profiler: bool
+
+
+class EngineConfig(TypedDict):
+    # "phased" or "serial", collisions are checked in a different order per mode (see TickScheduler)
+    scheduler: str
+    tick_rate: int
+    max_ticks_per_frame: int
+    seed: int | None
 
 
 class SettingsConfig(TypedDict):
     sound: SoundConfig
     display: DisplayConfig
     debug: DebugConfig
+    engine: EngineConfig
 
 
 class AppConfig(TypedDict):
@@ -9,6 +9,7 @@
     :license: GPLv3, see LICENSE for more details.
 """
 
+from random import Random
 from typing import TypedDict
 
 from pygame import (
@@ -22,6 +23,8 @@ from pygame import (
 )
 
 from .app import App
+from .game_clock import GameClock
+from .scheduler import TickScheduler
 
 
 class BaseGame():
@@ -56,6 +59,9 @@ class BaseGame():
         # Game screens
         self.screen = screen
         self.alpha_screen = alpha_screen
+
+        # Dirty rect tracking of what gets drawn to the screen
+        self.renderer = app.renderer
         game_width = self.app.screen_width - (self.app.screen_width % self.grid_size) - self.grid_size
         game_height = self.app.screen_height - (self.app.screen_height % self.grid_size) - self.grid_size
         game_top = self.game_bar_height
@@ -65,3 +71,28 @@ class BaseGame():
         # Game object containers
         self.sprite_group = sprite.RenderUpdates()
 
+        # Per-tick entity action scheduler
+        engine_config = self.app.app_config["settings"]["engine"]
+        self.scheduler = TickScheduler(mode=engine_config["scheduler"])
+
+        # Fixed timestep clock all game logic runs on
+        self.tick_clock = GameClock(
+            tick_rate=engine_config["tick_rate"],
+            max_ticks_per_frame=engine_config["max_ticks_per_frame"],
+        )
+
+        # Game logic randomness, reseeded each game so seeded runs replay exactly
+        self.seed = engine_config["seed"]
+        self.random = Random(self.seed)
+
+
+    def key_down(self, key: int) -> None:
+        """key_down
+
+        A key pressed during gameplay, games taking keyboard input override this
+
+        Args:
+            key (int): pygame key code pressed
+        """
+
+        pass
@@ -14,6 +14,11 @@
 # filenames
 CONFIG_APP_FILE_NAME = "app_config.json"
 LOG_FILE_NAME = "output.log"
+PROFILE_FILE_PATH = "logs/profile.txt"
+STARTUP_TRACE_FILE_PATH = "logs/startup_trace.txt"
+
+# Frame pacing, time without events before an idle menu/unfocused window drops to idle_fps
+IDLE_DELAY_MS = 500
 
 # Font
 REGULAR_FONT = "_internal/assets/fonts/PressStart2P-Regular.ttf"
@@ -72,11 +77,21 @@ DEFAULT_APP_CONFIG = {
             "fps_display": False,
             "fullscreen": False,
             "resolution": "1280x720",
-            "window_title": "Game Platform - "
+            "window_title": "Game Platform - ",
+            "dirty_rect_threshold": 0.5,
+            "adaptive_fps": True,
+            "idle_fps": 10
         },
         "debug": {
             "log_level": "debug",
-            "debug_mode": False
+            "debug_mode": False,
+            "profiler": False
+        },
+        "engine": {
+            "scheduler": "phased",
+            "tick_rate": 250,
+            "max_ticks_per_frame": 10,
+            "seed": None
         }
     }
 }
\ No newline at end of file
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+
+"""
+    FPS Counter
+
+
+    Rolling frame time stats and the on screen fps display
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from bisect import bisect_left
+from collections import deque
+from itertools import accumulate
+from math import ceil
+from typing import TYPE_CHECKING
+
+from pygame import (
+    draw,
+    freetype,
+    Surface,
+)
+
+from pkg.constants.app_constants import (
+    COLOR_BLACK,
+    COLOR_GREY,
+    COLOR_GREY_DARK,
+    COLOR_RED,
+    COLOR_WHITE,
+)
+
+if TYPE_CHECKING:
+    from pkg.app import App
+
+
+class FrameTimes():
+    """FrameTimes
+
+    The last capacity frame times in a ring buffer. Adding a frame updates
+    the running sum, a histogram of 0.5ms bins and monotonic min/max
+    windows, so mean, min and max are O(1) and percentiles a walk over the
+    histogram instead of a sort of the samples.
+    """
+
+    def __init__(self, capacity: int = 240):
+        """FrameTimes initilizer
+
+        Args:
+            capacity (int, optional): Number of frames kept. Defaults to 240.
+        """
+
+        self.capacity = capacity
+
+        # Frame times in ms, slot the next frame goes in and frames kept
+        self.times = [0.0] * capacity
+        self.slot = 0
+        self.count = 0
+
+        # Frames added since the start, numbers the frames for the min/max windows
+        self.added = 0
+        self.total = 0.0
+
+        # Frames per bin, the last bin takes everything past the histogram
+        self.histogram = [0] * FrameTimes.BINS
+
+        # (frame number, ms) with increasing ms (min window) and decreasing ms (max window)
+        self.min_window: deque[tuple[int, float]] = deque()
+        self.max_window: deque[tuple[int, float]] = deque()
+
+
+    def __len__(self) -> int:
+        return self.count
+
+
+    def add(self, frame_ms: float) -> None:
+        """add
+
+        Args:
+            frame_ms (float): How long the frame took
+        """
+
+        # Drop the frame falling out of the ring
+        if self.count == self.capacity:
+            dropped = self.times[self.slot]
+            self.total -= dropped
+            self.histogram[self._bin(dropped)] -= 1
+        else:
+            self.count += 1
+
+        self.times[self.slot] = frame_ms
+        self.slot = (self.slot + 1) % self.capacity
+        self.total += frame_ms
+        self.histogram[self._bin(frame_ms)] += 1
+
+        frame = self.added
+        self.added += 1
+
+        # Frames older than the ring leave the windows
+        oldest = self.added - self.count
+        while self.min_window and self.min_window[0][0] < oldest:
+            self.min_window.popleft()
+        while self.max_window and self.max_window[0][0] < oldest:
+            self.max_window.popleft()
+
+        while self.min_window and self.min_window[-1][1] >= frame_ms:
+            self.min_window.pop()
+        self.min_window.append((frame, frame_ms))
+
+        while self.max_window and self.max_window[-1][1] <= frame_ms:
+            self.max_window.pop()
+        self.max_window.append((frame, frame_ms))
+
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+    @property
+    def min(self) -> float:
+        return self.min_window[0][1] if self.count else 0.0
+
+
+    @property
+    def max(self) -> float:
+        return self.max_window[0][1] if self.count else 0.0
+
+
+    def percentile(self, percent: float) -> float:
+        """percentile
+
+        Args:
+            percent (float): 0 to 100
+
+        Returns:
+            [float]: Upper edge of the histogram bin the percentile falls in (in ms)
+        """
+
+        if not self.count:
+            return 0.0
+
+        rank = max(1, ceil(self.count * percent / 100))
+        index = bisect_left(list(accumulate(self.histogram)), rank)
+
+        return min((index + 1) * FrameTimes.BIN_MS, self.max)
+
+
+    def recent(self, count: int) -> list[float]:
+        """recent
+
+        Returns:
+            [list]: Up to count of the latest frame times, oldest first
+        """
+
+        count = min(count, self.count)
+
+        return [self.times[(self.slot - count + offset) % self.capacity] for offset in range(count)]
+
+
+    @staticmethod
+    def _bin(frame_ms: float) -> int:
+        return min(int(frame_ms / FrameTimes.BIN_MS), FrameTimes.BINS - 1)
+
+
+    # Histogram bins, 0.5ms wide up to 200ms
+    BIN_MS = 0.5
+    BINS = 400
+
+
+class FpsCounter():
+    """FpsCounter
+
+    Fps numbers and a frame time graph drawn to a cached surface. The
+    surface is only redrawn refresh_ms apart, every other frame it's one blit.
+    """
+
+    def __init__(self, app: "App", refresh_ms: int = 250, width: int = 160, graph_height: int = 40):
+        """FpsCounter initilizer
+
+        Args:
+            app (App): The app, for it's clock, font and renderer
+            refresh_ms (int, optional): Time between redraws of the display. Defaults to 250.
+            width (int, optional): Width of the display, one graph column per frame. Defaults to 160.
+            graph_height (int, optional): Height of the frame time graph. Defaults to 40.
+        """
+
+        self.app = app
+        self.refresh_ms = refresh_ms
+        self.width = width
+        self.graph_height = graph_height
+        self.frame_times = FrameTimes()
+
+        # Time since the display was last redrawn
+        self.since_refresh = refresh_ms
+
+        self.text_size = 8
+        self.line_height = self.text_size + 4
+        # Opaque, it's blitted over the same spot every frame of a still menu
+        self.surface = Surface((width, self.line_height * 3 + graph_height + 4))
+
+
+    def update(self, frame_ms: float) -> None:
+        """update
+
+        Args:
+            frame_ms (float): How long the last frame took
+        """
+
+        self.frame_times.add(frame_ms)
+        self.since_refresh += frame_ms
+
+
+    def draw(self, position: tuple) -> None:
+        """draw
+
+        Args:
+            position (tuple): Top left of the display on the screen
+        """
+
+        if self.since_refresh >= self.refresh_ms:
+            self.since_refresh = 0
+            self._redraw()
+
+        self.app.renderer.blit(self.surface, position)
+
+
+    def _redraw(self) -> None:
+        """_redraw
+
+        Draw the numbers and the graph onto the cached surface
+        """
+
+        frame_times = self.frame_times
+        surface = self.surface
+        font: freetype.Font = self.app.app_font
+
+        surface.fill(COLOR_BLACK)
+
+        def fps(frame_ms: float) -> int:
+            return min(int(1000 / frame_ms), 999) if frame_ms > 0 else 999
+
+        lines = (
+            f"now:{fps(frame_times.recent(1)[0] if len(frame_times) else 0):03} avg:{fps(frame_times.mean):03}",
+            f"H:{fps(frame_times.min):03} L:{fps(frame_times.max):03}",
+            f"p99:{frame_times.percentile(99):5.1f}ms",
+        )
+        for index, line in enumerate(lines):
+            self.app.text_cache.render_glyphs_to(surface, (2, 2 + index * self.line_height), font, line, COLOR_WHITE, size=self.text_size)
+
+        # Frame time graph, the grey line is the target frame time
+        graph_top = self.line_height * 3 + 2
+        graph_bottom = graph_top + self.graph_height
+        target_ms = 1000 / self.app.fps if self.app.fps else frame_times.mean
+        scale_ms = max(target_ms * 2, frame_times.max, 1.0)
+
+        draw.rect(surface, COLOR_GREY_DARK, (0, graph_top, self.width, self.graph_height), 1)
+        target_y = graph_bottom - int(target_ms / scale_ms * self.graph_height)
+        draw.line(surface, COLOR_GREY, (0, target_y), (self.width - 1, target_y))
+
+        recent = frame_times.recent(self.width)
+        x_start = self.width - len(recent)
+        for column, frame_ms in enumerate(recent):
+            height = min(int(frame_ms / scale_ms * self.graph_height), self.graph_height)
+            color = COLOR_RED if frame_ms > target_ms * 1.5 else COLOR_WHITE
+            draw.line(surface, color, (x_start + column, graph_bottom - 1), (x_start + column, graph_bottom - 1 - height))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+"""
+    Game Clock
+
+
+    Fixed timestep tick clock the game logic runs on
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from time import perf_counter
+
+
+class GameClock():
+    """GameClock
+
+    Monotonic tick counter for the game logic. Real time is collected in an
+    accumulator and paid out as whole fixed length ticks, so logic runs at
+    tick_rate no matter the render FPS and game time only depends on the
+    number of ticks played.
+    """
+
+    def __init__(self, tick_rate: int = 250, max_ticks_per_frame: int = 10):
+        """GameClock initilizer
+
+        Args:
+            tick_rate (int): Logic ticks per second. Defaults to 250.
+            max_ticks_per_frame (int): Most ticks paid out per frame, extra time is dropped. Defaults to 10.
+        """
+
+        self.tick_rate = max(1, int(tick_rate))
+        self.step_ms = 1000 / self.tick_rate
+        self.max_ticks_per_frame = max(1, int(max_ticks_per_frame))
+
+        # Number of ticks played
+        self.tick = 0
+
+        # Real time (ms) not yet paid out as ticks
+        self.accumulator = 0.0
+
+        # Real time of the last advance, None when not running
+        self.last_real = None
+
+
+    @property
+    def time_ms(self) -> float:
+        """time_ms
+
+        Returns:
+            [float]: Game time in milliseconds
+        """
+
+        return self.tick * self.step_ms
+
+
+    def reset(self) -> None:
+        """reset
+
+        Back to tick 0.
+        """
+
+        self.tick = 0
+        self.resync()
+
+
+    def resync(self) -> None:
+        """resync
+
+        Forget the real time that passed since the last advance (like while paused).
+        """
+
+        self.accumulator = 0.0
+        self.last_real = None
+
+
+    def advance(self) -> int:
+        """advance
+
+        Collect the real time since the last advance.
+
+        Returns:
+            [int]: Number of ticks to play this frame
+        """
+
+        now = perf_counter()
+        if self.last_real is None:
+            self.last_real = now
+            return 0
+
+        self.accumulator += (now - self.last_real) * 1000
+        self.last_real = now
+
+        ticks = int(self.accumulator // self.step_ms)
+        if ticks > self.max_ticks_per_frame:
+            # Too far behind to catch up, drop the extra time
+            ticks = self.max_ticks_per_frame
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.step_ms
+
+        return ticks
+
+
+    def step(self) -> None:
+        """step
+
+        Play a single tick.
+        """
+
+        self.tick += 1
+
@@ -12,3 +12,4 @@
 from .ai import *
 from .node import *
 from .helpers import *
+from .pathfinding import *
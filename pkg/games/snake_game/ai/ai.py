@@ -12,17 +12,11 @@
 
 
 from math import hypot as math_hypot
-from datetime import datetime, timedelta
-from inspect import currentframe, getframeinfo
 from logging import(
     debug as logging_debug,
-    warning as logging_warning,
 )
 from typing import TYPE_CHECKING
 
-from pygame import Rect
-from pygame.sprite import spritecollide
-
 from pkg.games.snake_game.ai.node import Node
 from pkg.games.snake_game.ai.helpers import astar, obj_pos_to_node
 from pkg.games.snake_game.constants import (
@@ -66,6 +60,7 @@ class DecisionBox:
         self.a_star_use_difficulty = 1
         self.a_star_situational_backup_difficulty = 2
         self.diagonal_sight_use_difficulty = 1
+        self.a_star_search_budget = 1500
         self.number_open_lines = 4
         self.default_node = Node(x=-1, y=-1, walkable=False)
 
@@ -88,7 +83,8 @@ class DecisionBox:
         self.ai_difficulty = ai_difficulty or self.ai_difficulty
 
         # Use intent algorithm depending on ai_difficulty to decide what direction to move
-        direction = self.situational_intent(ai_entity, target)
+        with self.game.app.profiler.span("ai.decide_direction"):
+            direction = self.situational_intent(ai_entity, target)
 
         logging_debug(f"Got Direction: {direction}")
 
@@ -145,8 +141,13 @@ class DecisionBox:
         intent = None
         logging_debug(ai_entity.secondary_target)
         if ai_entity.secondary_target == None:
+            # Step along the shared distance field when it has a way to the target
+            step_intent = self._next_step_intent(ai_entity)
+            if step_intent is not None:
+                intent = step_intent
+
             # down, or up  Intent
-            if ai_entity.position[Y] < target[POS_IDX][Y]:
+            elif ai_entity.position[Y] < target[POS_IDX][Y]:
                 intent = DOWN
 
             elif ai_entity.position[Y] > target[POS_IDX][Y]:
@@ -161,7 +162,7 @@ class DecisionBox:
 
         else:
             # Go for secondary target within timeframe
-            if datetime.now() <= ai_entity.since_secondary_target + timedelta(seconds=self.time_to_chase_target):
+            if self.game.tick_clock.time_ms <= ai_entity.since_secondary_target + self.time_to_chase_target * 1000:
                 # down, or up  Intent
                 if ai_entity.position[Y] < ai_entity.secondary_target[POS_IDX][Y]:
                     intent = DOWN
@@ -198,6 +199,22 @@ class DecisionBox:
         return intent
 
 
+    def _next_step_intent(self, ai_entity: "Entity") -> int | None:
+        """_next_step_intent
+
+        Returns:
+            [int]: Direction of the entity's next step towards it's target, None without one
+        """
+
+        next_step = getattr(ai_entity, "next_step", None)
+        if next_step is None:
+            return None
+
+        cell_x, cell_y = self.game.grid.cell_of(ai_entity.position)
+
+        return self.STEP_DIRECTIONS.get((next_step[X] - cell_x, next_step[Y] - cell_y))
+
+
     def astar_intent(self, ai_entity, target) -> int:
         """astar_intent
 
@@ -235,7 +252,13 @@ class DecisionBox:
 
         if ai_entity.path == [] or not next_node.walkable:
             # Get the path to target via astar pathfinding algorithm
-            ai_entity.path = astar(self.game, start_node, end_node)
+            ai_entity.path = astar(
+                self.game,
+                start_node,
+                end_node,
+                max_expanded=self.a_star_search_budget,
+                allow_partial=True,
+            )
 
 
         # TO-DO: Validate on difficulty check if the next move will trap self by checking the next a_star ai_entity.path
@@ -276,7 +299,7 @@ class DecisionBox:
         start_node = obj_pos_to_node(self.game, ai_entity.target[POS_IDX])
         end_node = obj_pos_to_node(self.game, next_target[POS_IDX])
 
-        return True if astar(self.game, start_node, end_node) else False
+        return True if astar(self.game, start_node, end_node, max_expanded=self.a_star_search_budget) else False
 
 
     def check_intent(self, ai_entity: "Entity", intent: int) -> int:
@@ -291,85 +314,22 @@ class DecisionBox:
         """
 
         logging_debug(f"Checking intent: {intent}")
-        # Loop to check intent
         self._reset_sight_lines(ai_entity)
-        for obj in self.game.sprite_group:
-            # Ignore the target object
-            if ai_entity.target[NAME] in obj.name:
-                continue
-
-            # Check if object obstructs ai_entity (and isn't self)
-            if obj != ai_entity:
-                logging_debug("Object checking")
-                intent = self._obj_check_intent(obj, ai_entity, intent)
-
-            # Check if object's children if any (even if self) obstructs ai_entity
-            if obj.children:
-                try:
-                    logging_debug("child checking")
-                    for child in obj.children:
-                        intent = self._obj_check_intent(child, ai_entity, intent)
-
-                except RuntimeError as error:
-                    if error == "deque mutated during iteration":
-                        pass
-
-                    else:
-                        frameinfo = getframeinfo(currentframe())
-                        logging_warning(f"{frameinfo.filename}::{frameinfo.lineno}: WARNING: {error}")
-
-        return intent
-
-
-    def _obj_check_intent(self, other_object: "Entity", ai_entity: "Entity", intent: int) -> int:
-        """_obj_check_intent
 
-        Args:
-            other_object ([Entity]): [description]
-            ai_entity ([Entity]): [description]
-            intent ([int]): [description]
-
-        Returns:
-            [int]: [description]
-        """
-
-        self._verify_sight_lines(other_object, ai_entity, intent)
+        # What every sight line runs into, in one look at the grid
+        blocked = self.game.sight.first_blocked(ai_entity.position, ai_entity.sight_mod)
+        self._verify_sight_lines(blocked, ai_entity, intent)
 
         # No directions could be found so reduce entity sight and check again
-        if self.number_open_lines <= 0:
-            ai_entity.prev_sight_mod = ai_entity.sight_mod
-            ai_entity.sight_mod = ai_entity.sight_mod - 1
-            ai_entity.sight = ai_entity.sight_mod * self.game.grid_size
+        if self.number_open_lines <= 0 and ai_entity.sight_mod > 1:
             logging_debug("Reducing sight and re-verifying")
-            for line in ai_entity.sight_lines:
-                line.open = True
-                line.draw()
-
-            for diag_line in ai_entity.sight_lines_diag:
-                line.open = True
-                line.draw()
-
-            self._verify_sight_lines(other_object, ai_entity, intent)
-
-            ai_entity.sight_mod = ai_entity.prev_sight_mod
-            ai_entity.sight = ai_entity.sight_mod * self.game.grid_size
-            for line in ai_entity.sight_lines:
-                line.draw()
-
-            for diag_line in ai_entity.sight_lines_diag:
-                line.draw()
+            self._reset_sight_lines(ai_entity)
+            blocked = self.game.sight.first_blocked(ai_entity.position, ai_entity.sight_mod - 1)
+            self._verify_sight_lines(blocked, ai_entity, intent)
 
         return self._get_intent(intent, ai_entity)
 
 
-    def _verify_diagonal_line_collisions(self, ai_entity, other_object):
-        for diag_line in ai_entity.sight_lines_diag:
-            # Check the sight lines for a open direction
-            if Rect.colliderect(other_object.rect, diag_line.rect):
-                logging_debug(f"It sees the collision between {other_object.id} and self on diagonal line {DIRECTION_MAP[diag_line.direction]}")
-                diag_line.open = False
-
-
     def _calculate_num_current_open_lines(self, ai_entity):
         self.number_open_lines = 0
         for line in ai_entity.sight_lines:
@@ -377,7 +337,7 @@ class DecisionBox:
                 self.number_open_lines += 1
 
 
-    def _line_collision_check(self, line, ai_entity, other_object) -> bool:
+    def _line_collision_check(self, line, ai_entity, blocked_cell) -> bool:
         """_line_collision_check
 
         Returns:
@@ -385,20 +345,22 @@ class DecisionBox:
         """
 
         # Check the sight lines for a open direction
-        if Rect.colliderect(other_object.rect, line.rect):
-            logging_debug(f"It sees the collision between {other_object.id} and self on cardinal line {DIRECTION_MAP[line.direction]}")
-            # if not "segment" in other_object.id:
-            logging_debug(f"cardinal line collision {other_object.id} and {line.direction}")
-            # Will Ai see and use portals?
-            if "teleportal" in other_object.name and self.ai_difficulty >= self.portal_use_difficulty:
-                line.open = self._decide_portal(other_object, ai_entity)
-                return True
+        if blocked_cell is None:
+            return False
 
-            line.open = False
-            self.number_open_lines = self.number_open_lines - 1
-            return True
+        logging_debug(f"It sees a collision at {blocked_cell} on cardinal line {DIRECTION_MAP[line.direction]}")
 
-        return False
+        # Will Ai see and use portals?
+        if self.ai_difficulty >= self.portal_use_difficulty:
+            position = (blocked_cell[X] * self.game.grid_size, blocked_cell[Y] * self.game.grid_size)
+            for other_object in self.game.spatial_hash.occupants(position):
+                if "teleportal" in other_object.name:
+                    line.open = self._decide_portal(other_object, ai_entity)
+                    return True
+
+        line.open = False
+        self.number_open_lines = self.number_open_lines - 1
+        return True
 
 
     def _line_screen_edge_check(self, line, ai_entity) -> bool:
@@ -479,21 +441,6 @@ class DecisionBox:
         return False
 
 
-    def _line_other_parents_child_collision_check(self, line, other_object):
-        """_line_other_parents_child_collision_check
-
-        Returns:
-            [bool]: [description]
-        """
-
-        if other_object.parent is None or spritecollide(line, other_object.parent.children, False) == []: return False
-
-        line.open = False
-        self.number_open_lines = self.number_open_lines - 1
-        logging_debug(f"Line {line.direction} definitely has some sort of collision with child obj's")
-        return True
-
-
     def _line_diagonal_verification_check(self, line, ai_entity, intent) -> bool:
         """_line_diagonal_verification_check
 
@@ -534,11 +481,11 @@ class DecisionBox:
         return False
 
 
-    def _verify_sight_lines(self, other_object: "Entity", ai_entity: "Entity", intent: int) -> None:
+    def _verify_sight_lines(self, blocked: dict, ai_entity: "Entity", intent: int) -> None:
         """verify_sight_lines
 
         Args:
-            other_object ([Entity]): [description]
+            blocked ([dict]): direction -> first blocked cell on that sight line (or None)
             ai_entity ([Entity]): [description]
             intent ([int]): [description]
 
@@ -546,8 +493,11 @@ class DecisionBox:
             [None]: [description]
         """
 
-        # Check the diagonal lines for collisions
-        self._verify_diagonal_line_collisions(ai_entity, other_object)
+        # Anything in a diagonal line's cell closes it
+        for diag_line in ai_entity.sight_lines_diag:
+            if blocked[diag_line.direction] is not None:
+                logging_debug(f"It sees a collision on diagonal line {DIRECTION_MAP[diag_line.direction]}")
+                diag_line.open = False
 
         # Figure the current number of open lines
         self._calculate_num_current_open_lines(ai_entity)
@@ -563,9 +513,7 @@ class DecisionBox:
             if self._line_screen_edge_check(line, ai_entity): continue
 
             # Check the sight lines for collisions
-            if self._line_collision_check(line, ai_entity, other_object): continue
-
-            if self._line_other_parents_child_collision_check(line, other_object): continue
+            if self._line_collision_check(line, ai_entity, blocked[line.direction]): continue
 
             # Verify with diagonal sight lines if available
             if self._line_diagonal_verification_check(line, ai_entity, intent): continue
@@ -658,3 +606,7 @@ class DecisionBox:
                 return False
 
         return False
+
+
+    # (x, y) cell step -> direction of moving that way
+    STEP_DIRECTIONS = {(0, -1): UP, (1, 0): RIGHT, (0, 1): DOWN, (-1, 0): LEFT}
@@ -1,5 +1,3 @@
-import heapq
-
 from .node import Node
 
 from pkg.games.snake_game.constants import (
@@ -33,36 +31,6 @@ def get_neighbors(game, node):
 
 
 # Define the A* pathfinding algorithm
-def astar(game, start, end):
-    # initilize the open and closed lists
-    open_list = [start]
-    closed_list = []
-
-    while open_list:
-        # Get the node with the lowest f value
-        current_node = heapq.heappop(open_list)
-        closed_list.append(current_node)
-
-        if current_node == end:
-            path = []
-            while current_node:
-                if current_node == start: break
-                path.append((current_node.x, current_node.y))
-                current_node = current_node.parent
-            return path[::-1]  # Reverse the path
-
-        for neighbor in get_neighbors(game, current_node):
-            if not neighbor.walkable or neighbor in closed_list:
-                continue
-
-            tentative_g = current_node.g + 1
-            if neighbor not in open_list or tentative_g < neighbor.g:
-                neighbor.g = tentative_g
-                neighbor.h = heuristic(neighbor, end)
-                neighbor.f = neighbor.g + neighbor.h
-                neighbor.parent = current_node
-
-                if neighbor not in open_list:
-                    heapq.heappush(open_list, neighbor)
-
-    return []  # No path found
\ No newline at end of file
+def astar(game, start, end, max_expanded=None, allow_partial=False):
+    # Search with the game's path finder so the grid nodes are never mutated
+    return game.path_finder.search(start, end, max_expanded=max_expanded, allow_partial=allow_partial)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+"""
+    Pathfinding
+
+
+    A* search over the game grid that never mutates the grid's nodes
+
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING
+
+from .node import Node
+
+if TYPE_CHECKING:
+    from pkg.games.snake_game.game import SnakeGame
+
+
+class PathFinder:
+    """PathFinder
+
+    A* engine for the game grid. Search state lives in flat per-cell arrays
+    stamped with a per-search generation number, so nothing has to be reset
+    between searches and the shared walkability grid is only ever read.
+    """
+
+    def __init__(self, game: "SnakeGame"):
+        self.game = game
+
+        # Current search number, stamps which array entries belong to the running search
+        self.generation = 0
+
+        # Number of nodes expanded by the last search
+        self.expanded = 0
+
+        # If the last search ran out of budget before reaching the end node
+        self.exhausted = False
+
+        self.width = 0
+        self.height = 0
+        self._allocate(game.grid_width, game.grid_height)
+
+
+    def _allocate(self, width: int, height: int) -> None:
+        """_allocate
+
+        (Re)build the per-cell search arrays for a grid of width x height cells.
+        """
+
+        self.width = width
+        self.height = height
+        size = width * height
+
+        # Cost from the start node
+        self.g_score = [0] * size
+
+        # Index of the cell the best known route came from
+        self.came_from = [-1] * size
+
+        # Generation the g_score/came_from entries were written in (open or closed)
+        self.seen = [0] * size
+
+        # Generation the cell was closed in
+        self.closed = [0] * size
+
+        self.generation = 0
+
+
+    def search(self, start: Node, end: Node, max_expanded: int = None, allow_partial: bool = False) -> list:
+        """search
+
+        Args:
+            start (Node): Node to search from, doesn't need to be walkable
+            end (Node): Node to search to
+            max_expanded (int, optional): Max number of nodes to expand before giving up. Defaults to None (no limit).
+            allow_partial (bool, optional): When the budget runs out return the path to the node found
+                closest to end instead of no path. Defaults to False.
+
+        Returns:
+            [list]: (x, y) grid positions from the step after start up to and including end,
+                empty if there is no (allowed) path
+        """
+
+        with self.game.app.profiler.span("ai.astar"):
+            return self._search(start, end, max_expanded, allow_partial)
+
+
+    def _search(self, start: Node, end: Node, max_expanded: int, allow_partial: bool) -> list:
+        """_search
+
+        The A* search itself, see search
+        """
+
+        if self.width != self.game.grid_width or self.height != self.game.grid_height:
+            self._allocate(self.game.grid_width, self.game.grid_height)
+
+        width = self.width
+        height = self.height
+        g_score = self.g_score
+        came_from = self.came_from
+        seen = self.seen
+        closed = self.closed
+
+        # Flat occupancy of the walkability grid, 0 is walkable
+        blocked = self.game.grid.cells
+
+        # New search, invalidates everything written by previous searches
+        self.generation += 1
+        generation = self.generation
+        self.expanded = 0
+        self.exhausted = False
+
+        end_x = end.x
+        end_y = end.y
+        start_index = start.x * height + start.y
+        end_index = end_x * height + end_y
+
+        g_score[start_index] = 0
+        came_from[start_index] = -1
+        seen[start_index] = generation
+
+        best_index = start_index
+        best_h = abs(start.x - end_x) + abs(start.y - end_y)
+
+        # Open set entries are (f, h, insertion count, cell index), stale entries are skipped when popped
+        count = 0
+        open_heap = [(best_h, best_h, count, start_index)]
+
+        while open_heap:
+            # Get the node with the lowest f value
+            current_index = heappop(open_heap)[3]
+            if closed[current_index] == generation:
+                continue
+
+            closed[current_index] = generation
+
+            if current_index == end_index:
+                return self._build_path(current_index)
+
+            if max_expanded is not None and self.expanded >= max_expanded:
+                self.exhausted = True
+                break
+
+            self.expanded += 1
+
+            current_x, current_y = divmod(current_index, height)
+            tentative_g = g_score[current_index] + 1
+
+            for neighbor_x, neighbor_y in (
+                (current_x - 1, current_y),
+                (current_x + 1, current_y),
+                (current_x, current_y - 1),
+                (current_x, current_y + 1),
+            ):
+                if neighbor_x < 0 or neighbor_x >= width or neighbor_y < 0 or neighbor_y >= height:
+                    continue
+
+                neighbor_index = neighbor_x * height + neighbor_y
+                if closed[neighbor_index] == generation:
+                    continue
+
+                if seen[neighbor_index] == generation and tentative_g >= g_score[neighbor_index]:
+                    continue
+
+                if blocked[neighbor_index]:
+                    continue
+
+                seen[neighbor_index] = generation
+                g_score[neighbor_index] = tentative_g
+                came_from[neighbor_index] = current_index
+
+                h_score = abs(neighbor_x - end_x) + abs(neighbor_y - end_y)
+                if h_score < best_h:
+                    best_h = h_score
+                    best_index = neighbor_index
+
+                count += 1
+                heappush(open_heap, (tentative_g + h_score, h_score, count, neighbor_index))
+
+        if allow_partial and best_index != start_index:
+            return self._build_path(best_index)
+
+        return []  # No path found
+
+
+    def _build_path(self, index: int) -> list:
+        """_build_path
+
+        Returns:
+            [list]: (x, y) grid positions from the step after the start node up to index
+        """
+
+        height = self.height
+        came_from = self.came_from
+
+        path = []
+        while came_from[index] != -1:
+            path.append(divmod(index, height))
+            index = came_from[index]
+
+        return path[::-1]  # Reverse the path
@@ -43,6 +43,9 @@ SPRITE_SHEET_SNAKE_ENEMY = "_internal/assets/sprites/snake/snake_enemy-sheet.png
 SPRITE_SHEET_FOOD = "_internal/assets/sprites/food/food-sheet.png"
 SPIRTE_SHEET_TELEPORTAL = "_internal/assets/sprites/tele_portal/tele_portal-sheet.png"
 
+# Sliced and scaled sprites kept between launches
+SPRITE_CACHE_DIR = "cache/sprites"
+
 # Directions
 UP = 0
 RIGHT = 1
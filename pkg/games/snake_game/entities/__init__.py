@@ -12,4 +12,4 @@
 from .snake import *
 from .food import *
 from .tele_portal import *
-from .entity import Entity, Line
\ No newline at end of file
+from .entity import Entity, Line, seed_display_names
\ No newline at end of file
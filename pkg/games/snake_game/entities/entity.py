@@ -10,18 +10,15 @@
 """
 
 
-from datetime import datetime
 from gc import collect as gc_collect
 from logging import (
     debug as logging_debug,
     warning as logging_warning,
     info as logging_info,
 )
-from random import randrange
 from typing import Deque, TYPE_CHECKING
-from uuid import uuid4
+from uuid import UUID
 
-from faker import Faker
 import pygame
 from pygame import (
     BLEND_ADD,
@@ -30,14 +27,11 @@ from pygame import (
     Color as pygame_Color,
     Surface,
     SRCALPHA,
-    mixer,
     Rect,
     draw as pygame_draw,
 )
 from pygame.sprite import Sprite
 
-from pkg.games.snake_game.ai.helpers import obj_pos_to_node
-
 from pkg.games.snake_game.constants import (
     COLOR_BLACK,
     MENU_GAME_OVER,
@@ -51,6 +45,7 @@ from pkg.games.snake_game.constants import (
     RIGHT_DOWN,
     DOWN_LEFT,
     LEFT_UP,
+    SOUND_SNAKE_DEATH,
     WIDTH,
     HEIGHT,
     TOP,
@@ -62,7 +57,32 @@ if TYPE_CHECKING:
     from pkg.games.snake_game.game import SnakeGame
 
 
-FAKE = Faker()
+# Random entity names, made on first use, faker is slow to import and set up
+_fake = None
+
+
+def _display_names():
+    """_display_names
+
+    Returns:
+        [Faker]: The random entity name maker, imported and made the first time it's asked for
+    """
+
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker()
+
+    return _fake
+
+
+def seed_display_names(seed) -> None:
+    """seed_display_names
+
+    Seed the random entity names so seeded games replay with the same names
+    """
+
+    _display_names().seed_instance(seed)
 
 
 class Entity(Sprite):
@@ -78,10 +98,10 @@ class Entity(Sprite):
         self.game = game
 
         # Random name for this entity
-        self.display_name = FAKE.first_name()
+        self.display_name = _display_names().first_name()
 
-        # Unique identifier
-        self.id = name + str(uuid4())
+        # Unique identifier (drawn from the game's randomness so seeded games replay)
+        self.id = name + str(UUID(int=self.game.random.getrandbits(128), version=4))
 
         # The entity state starts at alive
         self.state = Entity.ALIVE
@@ -104,6 +124,9 @@ class Entity(Sprite):
         # Score this entity has accumulated
         self.score = 0
 
+        # Game tick the entity last died on, None while it hasn't
+        self.death_tick = None
+
         # How big entity is
         self.size = self.game.grid_size
 
@@ -127,7 +150,7 @@ class Entity(Sprite):
         # 1 = 100%, 0 = 0%, speed can't be greater than 1
         self.speed_mod = 0
         self.base_speed = 30
-        self.time_last_moved = datetime.now()
+        self.time_last_moved = self.game.tick_clock.time_ms
 
         # Where entity was looking = (Up = 0, Right = 1, Down = 2, Left = 3)
         self.prev_direction = DOWN
@@ -141,11 +164,13 @@ class Entity(Sprite):
         self.prev_sight_mod = self.sight_mod
         self.sight = self.sight_mod * self.game.grid_size
 
+        # Sound bank paths held by the entity, released when it's removed
+        self.sound_paths: list[str] = []
+
         # Default death sound
         if self.game.app.is_audio:
-            self.sound_death = mixer.Sound("_internal/assets/sounds/8bitretro_soundpack/MISC-NOISE-BIT_CRUSH/Retro_8-Bit_Game-Misc_Noise_06.wav")
+            self.sound_death = self.hold_sound(SOUND_SNAKE_DEATH)
             self.sound_mod = 4.5
-            self.sound_death_volume = float(self.game.app.app_config["settings"]["sound"]["effect_volume"])/self.sound_mod
 
         # Sight lines
         self.sight_lines = [
@@ -164,7 +189,7 @@ class Entity(Sprite):
         # Pathfinding variable
         self.target = None
         self.secondary_target = None
-        self.since_secondary_target = datetime.now()
+        self.since_secondary_target = self.game.tick_clock.time_ms
 
         # children list
         self.children: Deque[Entity] = Deque()
@@ -193,7 +218,7 @@ class Entity(Sprite):
         if obj.state == Entity.ALIVE and (updated_refresh[ENTITY] or updated_refresh[CHILD]):
 
             # Render the entity based on it's image and position
-            self.game.screen.blit(self.image, self.position)
+            self.game.renderer.blit(self.image, self.position)
 
             # Render the entity's sight lines
             for line in self.sight_lines:
@@ -207,6 +232,33 @@ class Entity(Sprite):
                 child.draw(updated_refresh)
 
 
+    def hold_sound(self, sound_path: str) -> pygame.mixer.Sound | None:
+        """hold_sound
+
+        Args:
+            sound_path (str): Sound file the entity plays
+
+        Returns:
+            [Sound]: The shared sound from the sound bank, held until release_sounds
+        """
+
+        self.sound_paths.append(sound_path)
+
+        return self.game.app.sound_bank.acquire(sound_path)
+
+
+    def release_sounds(self) -> None:
+        """release_sounds
+
+        Let go of every sound the entity holds, when it's removed from the game
+        """
+
+        for sound_path in self.sound_paths:
+            self.game.app.sound_bank.release(sound_path)
+
+        self.sound_paths = []
+
+
     def refresh_draw(self) -> None:
         """refresh_draw
 
@@ -216,9 +268,9 @@ class Entity(Sprite):
         # render if alive
         if self.state == Entity.ALIVE:
             # Clear screen where self was
-            # self.game.screen.fill(COLOR_BLACK, (self.rect.x, self.rect.y, self.rect.width, self.rect.height))
+            # self.game.renderer.fill(COLOR_BLACK, (self.rect.x, self.rect.y, self.rect.width, self.rect.height))
             # Render the entity based on it's parameters
-            self.game.screen.blit(self.image, self.position)
+            self.game.renderer.blit(self.image, self.position)
 
             # Re-draw each child if there are any
             for child in self.children:
@@ -233,10 +285,7 @@ class Entity(Sprite):
 
         # Play interacting_obj death sound
         if self.game.app.is_audio:
-            sound = interacting_obj.sound_death
-            interacting_obj.sound_death_volume = float(self.game.app.app_config["settings"]["sound"]["effect_volume"])/self.sound_mod
-            sound.set_volume(interacting_obj.sound_death_volume)
-            mixer.Sound.play(sound)
+            self.game.app.voices.play(interacting_obj.sound_death, 1 / self.sound_mod)
 
         # Loose the game if interacting_obj is the player
         if interacting_obj.is_player:
@@ -254,13 +303,11 @@ class Entity(Sprite):
 
         if self.is_killable:
             logging_info((f"{self.display_name}: {death_reason}"))
+            self.death_tick = self.game.tick_clock.tick
 
             # Play death sound
             if self.game.app.is_audio:
-                sound = self.sound_death
-                self.sound_death_volume = float(self.game.app.app_config["settings"]["sound"]["effect_volume"])/self.sound_mod
-                sound.set_volume(self.sound_death_volume)
-                mixer.Sound.play(sound)
+                self.game.app.voices.play(self.sound_death, 1 / self.sound_mod)
 
             # Loose the game if self is the player
             if self.is_player:
@@ -271,22 +318,25 @@ class Entity(Sprite):
 
             # "remove" the entity from the game
             if "snake" in self.name:
-                self.game.screen.fill(COLOR_BLACK, (self.rect.x, self.rect.y, self.rect.width, self.rect.height))
+                self.game.renderer.fill(COLOR_BLACK, (self.rect.x, self.rect.y, self.rect.width, self.rect.height))
 
                 self.game.sprite_group.remove(self)
 
+                self.game.spatial_hash.remove(self)
+
+                # Free the head's grid cell for pathfinding and sight
+                self.game.grid.set_walkable(self.position, True)
+
                 self.sight_lines_diag = None
 
                 self.sight_lines = None
 
-                if self.children:
-                    for child in self.children:
-                        self.game.screen.fill(COLOR_BLACK, (child.rect.x, child.rect.y, child.rect.width, child.rect.height))
-                        child.die(f"Parent {self.id} died")
-                        child.kill()
+                # Take the tail off the board
+                self.body.clear()
                 self.children = None
 
                 self.kill()
+                self.release_sounds()
 
             # input("press enter to continue from death")
 
@@ -304,32 +354,15 @@ class Entity(Sprite):
         collision_checks does stuff
         """
 
-        # Collision check for all entities
-        for obj in self.game.sprite_group.sprites():
-            # Make sure not checking collision with dead obj's
-            if not self.state == Entity.ALIVE or not obj.state == Entity.ALIVE:
-                continue
-
-            collision = False
-
-            # Allow for early termination of checks
-            while not collision:
-                # Skip collision checks if not updated
-                if not updated: break
-
-                # Make sure not checking collision with self
-                if self != obj:
-                    # Screen edge collision check
-                    collision = self.check_edge_collision()
+        # Skip collision checks if not updated or dead
+        if not updated or not self.state == Entity.ALIVE:
+            return
 
-                    # Collision check between self and other obj
-                    collision = self.check_obj_collision(obj)
+        # Screen edge collision check
+        self.check_edge_collision()
 
-                # Collision check between self and obj's children even if self is obj
-                collision = self.check_child_collision(obj)
-
-                # Always exit the while loop at the end
-                break
+        # Collision check between self and everything sharing self's grid cell
+        self.check_cell_collision()
 
 
     def check_edge_collision(self) -> bool:
@@ -346,6 +379,8 @@ class Entity(Sprite):
             else:
                 # Set new location
                 self.position = (self.game.screen_size[LEFT], self.position[Y])
+                self.rect.topleft = self.position
+                self.game.spatial_hash.move(self)
 
             return True
 
@@ -357,6 +392,8 @@ class Entity(Sprite):
             else:
                 # Set new location
                 self.position = (self.position[X], self.game.screen_size[TOP])
+                self.rect.topleft = self.position
+                self.game.spatial_hash.move(self)
 
             return True
 
@@ -368,6 +405,8 @@ class Entity(Sprite):
             else:
                 # Set new location
                 self.position = (self.game.screen_size[WIDTH] - self.size, self.position[Y])
+                self.rect.topleft = self.position
+                self.game.spatial_hash.move(self)
 
             return True
 
@@ -379,20 +418,32 @@ class Entity(Sprite):
             else:
                 # Set new location
                 self.position = (self.position[X], self.game.screen_size[HEIGHT])
+                self.rect.topleft = self.position
+                self.game.spatial_hash.move(self)
 
             return True
 
         return False
 
 
-    def check_obj_collision(self, obj: "Entity") -> bool:
-        """check_obj_collision
+    def check_cell_collision(self) -> bool:
+        """check_cell_collision
 
-        Check for self to other obj collision/interaction
+        Check for self to other obj (or other obj's child) collision/interaction
+        by looking up the occupants of self's grid cell
         """
 
-        # Collision check between self and other obj
-        if self.rect.colliderect(obj):
+        collision = False
+
+        for obj in self.game.spatial_hash.occupants(self.position):
+            # Stop once self didn't survive an interaction
+            if not self.state == Entity.ALIVE:
+                break
+
+            # Make sure not checking collision with self or dead obj's
+            if obj is self or not obj.state == Entity.ALIVE:
+                continue
+
             if self.secondary_target == obj.position:
                 self.secondary_target = None
 
@@ -401,94 +452,70 @@ class Entity(Sprite):
             # Do obj's interaction method
             obj.interact(self)
 
-            return True
-
-        return False
-
-
-    def check_child_collision(self, obj: "Entity") -> bool:
-        """check_child_collision
-
-        Check for self to other obj's child collision/interaction
-        """
-
-        # Collision check between self and other obj's child
-        if obj.children:
-            for child in obj.children:
-                try:
-                    if Rect.colliderect(self.rect, child.rect):
-                        if self.secondary_target == child.position:
-                            self.secondary_target = None
-
-                        logging_debug(f"----{self.id} Interacting with child 1 {child.id}-----")
-
-                        child.interact(self)
+            collision = True
 
-                        return True
-                except RuntimeError as e:
-                    logging_warning(f"Error: {e}")
-        return False
+        return collision
 
 
-    def set_random_spawn(self, x_mod=1, y_mod=1, mod_walkability=True) -> None:
+    def set_random_spawn(self, x_mod=1, y_mod=1, mod_walkability=True) -> bool:
         """set_random_spawn
 
-        Check for a random spawn location and if it's taken already
-        """
-
-        # Spawn location found or not
-        found_spawn = False
-
-        while not found_spawn:
-            # Where the entity is to be spawned at (x, y) position
-            pos_x = self.game.screen_size[WIDTH] - randrange(
-                self.size * x_mod, self.game.screen_size[WIDTH] - self.size * x_mod, self.size
-            )
-
-            pos_y = self.game.screen_size[HEIGHT] - randrange(
-                self.size * y_mod, self.game.screen_size[HEIGHT] - self.game.screen_size[TOP] - self.size * y_mod, self.size
-            )
+        Move to a random free cell at least x_mod/y_mod cells in from the edges
+        of the board (and below the game bar)
 
-            # Check if the chosen random spawn location is taken
-            taken = False
-            for obj in self.game.sprite_group:
-                if obj != self: # don't check self
-                    if (pos_x, pos_y) == obj.position:
-                        taken = True
-                        break
-
-                    elif obj.children:
-                        for child in obj.children:
-                            if child != self: # don't check self
-                                if (pos_x, pos_y) == child.position:
-                                    taken = True
-
-                                    break
-
-                    if taken == True:
-                        break
+        Returns:
+            [bool]: If a free cell was found, False when the region is full
+        """
 
-            if taken == True:
-                continue
+        # The spawn region in cells
+        x_start = x_mod + 1
+        x_end = self.game.screen_size[WIDTH] // self.size - x_mod + 1
+        y_start = self.game.screen_size[TOP] // self.size + y_mod + 1
+        y_end = self.game.screen_size[HEIGHT] // self.size - y_mod + 1
 
-            found_spawn = True
+        cell = self.game.spatial_hash.free_cells.allocate(self.game.random, x_start, y_start, x_end, y_end)
+        if cell is None:
+            logging_warning(f"{self.display_name}: board full, no free cell to spawn {self.name} in")
+            return False
 
         # Save the current position as previous
         self.prev_position = self.position
 
         # change position
-        self.position = (pos_x, pos_y)
+        self.position = (cell[X] * self.size, cell[Y] * self.size)
 
         if mod_walkability:
             # Mark previous grid position as walkable for pathfinding
-            obj_pos_to_node(self.game, self.prev_position).walkable = True
+            self.game.grid.set_walkable(self.prev_position, True)
 
             # Mark grid position as unwalkable for pathfinding
-            obj_pos_to_node(self.game, self.position).walkable = False
+            self.game.grid.set_walkable(self.position, False)
 
         # place hitbox at position
         self.rect.topleft = self.position
 
+        # Register the new position for collisions
+        self.game.spatial_hash.move(self)
+
+        return True
+
+
+    def despawn(self, mod_walkability=True) -> None:
+        """despawn
+
+        Take the entity off the board, it stops colliding and blocking paths
+        where it was until it's spawned again
+        """
+
+        self.is_spawned = False
+
+        # Stop registering the position for collisions
+        self.game.spatial_hash.remove(self)
+
+        if mod_walkability:
+            # Mark grid position as walkable for pathfinding
+            self.game.grid.set_walkable(self.position, True)
+
 
     def spawn(self) -> bool:
         """spawn
@@ -497,11 +524,12 @@ class Entity(Sprite):
         """
 
         if not self.state == Entity.ALIVE:
-            # Find the spawn location
-            self.set_random_spawn()
+            # Find the spawn location, stays unspawned when the board is full
+            if not self.set_random_spawn():
+                return False
 
             # Set the entity to be alive
-            obj.state = Entity.ALIVE
+            self.state = Entity.ALIVE
 
             # Spawn all the entities children if there are any
             if self.children:
@@ -573,16 +601,9 @@ class Line(Sprite):
             LEFT_UP: lambda *args: self.draw_left_up(*args),
         }
 
-        # Choose the screen to draw to
-        chosen_screen = self.entity.game.screen if self.is_visible else self.entity.game.alpha_screen
-
         # Set the rectangle representing the sightline
-        self.rect = pygame_draw.rect(
-            chosen_screen,
-            self.color,
-            (self.position, (self.width, self.height)),
-            0
-        )
+        self.rect = Rect(self.position, (self.width, self.height))
+        self._draw_rect()
 
 
     def draw(self) -> None:
@@ -591,22 +612,29 @@ class Line(Sprite):
         draw does stuff
         """
 
-        # Choose the screen to draw to
-        chosen_screen = self.entity.game.screen if self.is_visible else self.entity.game.alpha_screen
-
         # Clear previous frame obj's location
-        chosen_screen.fill(COLOR_BLACK, (self.rect.x, self.rect.y, self.rect.width, self.rect.height))
+        self._draw_rect(COLOR_BLACK)
 
         # determine entity's sightline position
         self.line_options.get(self.direction)()
 
         # Draw the rectangle representing the sightline
-        self.rect = pygame_draw.rect(
-            chosen_screen,
-            self.color,
-            (self.position, (self.width, self.height)),
-            0
-        )
+        self.rect = Rect(self.position, (self.width, self.height))
+        self._draw_rect()
+
+
+    def _draw_rect(self, color: tuple = None) -> None:
+        """_draw_rect
+
+        Fill the sightline's rect, queued with the rest of the frame when visible.
+        """
+
+        color = self.color if color is None else color
+
+        if self.is_visible:
+            self.entity.game.renderer.fill(color, self.rect)
+        else:
+            pygame_draw.rect(self.entity.game.alpha_screen, color, self.rect, 0)
 
 
     def draw_up(self) -> None:
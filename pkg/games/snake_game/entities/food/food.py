@@ -9,11 +9,10 @@
     :license: GPLv3, see LICENSE for more details.
 """
 
-from random import randrange
 from typing import TYPE_CHECKING
 
 from pkg.games.snake_game.constants import (
-    SOUND_FOOD_PICKUP_IDX,
+    SOUND_FOOD_PICKUP,
     TOP,
     ENTITY,
     CHILD,
@@ -60,9 +59,8 @@ class Food(Entity):
 
         # Death sound
         if self.game.app.is_audio:
-            self.sound_death = self.game.sounds[SOUND_FOOD_PICKUP_IDX]
+            self.sound_death = self.hold_sound(SOUND_FOOD_PICKUP)
             self.sound_mod = 1.5
-            self.sound_death_volume = float(self.game.app.app_config["settings"]["sound"]["effect_volume"])/self.sound_mod
 
 
     def update(self) -> bool:
@@ -84,7 +82,18 @@ class Food(Entity):
         if self.state == Entity.ALIVE and (updated_refresh[ENTITY] or updated_refresh[CHILD]):
 
             # Render the entity based on it's parameters
-            self.game.screen.blit(self.image, self.position)
+            self.game.renderer.blit(self.image, self.position)
+
+
+    def refresh_draw(self) -> None:
+        """refresh_draw
+
+        refresh_draw does stuff
+        """
+
+        # Nothing to draw while off the board
+        if self.is_spawned:
+            super().refresh_draw()
 
 
     def spawn(self) -> tuple[bool, bool]:
@@ -94,7 +103,11 @@ class Food(Entity):
         """
 
         if not self.is_spawned:
-            self.set_random_spawn(5, 5, mod_walkability=False)
+            # Board full, stay off it and try again next tick
+            if not self.set_random_spawn(5, 5, mod_walkability=False):
+                self.despawn(mod_walkability=False)
+                return False, False
+
             self.is_spawned = True
             self.state = Entity.ALIVE
 
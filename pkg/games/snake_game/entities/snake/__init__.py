@@ -10,3 +10,4 @@
 """
 
 from .snake import *
+from .snake_body import *
@@ -10,24 +10,18 @@
 """
 
 from math import hypot as math_hypot
-from typing import Deque, TYPE_CHECKING
-from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
-from pygame import key as pygame_key
-
-from pkg.games.snake_game.ai.helpers import obj_pos_to_node
 from pkg.games.snake_game.entities.entity import Entity
+from pkg.games.snake_game.entities.snake.snake_body import SnakeBody
 from pkg.games.snake_game.constants import (
-    COLOR_BLACK,
-    INPUT_KEY_MAP,
-    SOUND_SNAKE_DEATH_IDX,
+    SOUND_SNAKE_DEATH,
     POS_IDX,
     DIST_FROM_SELF_IDX,
     ENTITY,
     CHILD,
     X,
     Y,
-    UP,
     DOWN,
     LEFT,
     RIGHT,
@@ -56,8 +50,8 @@ class Snake(Entity):
         # Where the snake was located
         # self.prev_position = (0, 0)
 
-        # Where the snake is started located
-        self.set_random_spawn(10, 10)
+        # Where the snake is started located, stays unspawned when the board is full
+        self.is_spawned = self.set_random_spawn(10, 10)
 
         # How big snake parts are
         self.size = self.game.grid_size
@@ -85,9 +79,8 @@ class Snake(Entity):
 
         # Snake death sound
         if self.game.app.is_audio:
-            self.sound_death = self.game.sounds[SOUND_SNAKE_DEATH_IDX]
+            self.sound_death = self.hold_sound(SOUND_SNAKE_DEATH)
             self.sound_mod = 4.5
-            self.sound_death_volume = float(self.game.app.app_config["settings"]["sound"]["effect_volume"])/self.sound_mod
 
         # Interact sound
         # if self.game.app.is_audio:
@@ -100,16 +93,14 @@ class Snake(Entity):
         self.path = []
         self.target_type = "food"
 
+        # (x, y) cell one step closer to the target, None when the target can't be reached
+        self.next_step = None
+
         # Number of starting tail segments
         self.num_tails = 5
 
-        # Initilize starting tails
-        self.children: Deque[TailSegment] = Deque()
-        for pos in range(self.num_tails+1):
-            if pos == 0:
-                self.children.append(TailSegment(self, self.game, self.direction, player=self.is_player))
-            else:
-                self.children.append(TailSegment(self, self.game, self.direction, player=self.is_player))
+        # Starting tails, laid down one per move
+        self.body = SnakeBody(self, pending=self.num_tails+1)
 
 
     def aquire_primary_target(self, target_name: str) -> None:
@@ -126,7 +117,7 @@ class Snake(Entity):
             ai_difficulty=self.ai_difficulty,
         )
 
-        self.since_secondary_target = datetime.now()
+        self.since_secondary_target = self.game.tick_clock.time_ms
 
 
     def get_target(self, from_obj_pos, target_name):
@@ -135,6 +126,25 @@ class Snake(Entity):
         get_target does stuff
         """
 
+        # Food is looked up in the distance field shared by all the snakes
+        self.next_step = None
+        if target_name == self.target_type:
+            step = self.game.food_distances().next_step(*self.game.grid.cell_of(from_obj_pos))
+            if step is not None:
+                self.next_step, target_cell, steps = step
+
+                return ((target_cell[X] * self.size, target_cell[Y] * self.size), steps * self.size, target_name)
+
+        # Nothing reachable, go for the closest one as the crow flies
+        return self._closest_target(from_obj_pos, target_name)
+
+
+    def _closest_target(self, from_obj_pos, target_name):
+        """_closest_target
+
+        _closest_target does stuff
+        """
+
         # Set variables pre loop
         primary_target = (None, 10000)
 
@@ -183,15 +193,24 @@ class Snake(Entity):
             for line in self.sight_lines_diag:
                 line.draw()
 
+            # The tail redraws the segments that moved or got drawn over
+            if updated_refresh[ENTITY]:
+                self.body.draw()
+
             # Render the entity's obj based on it's parameters
-            self.game.screen.blit(self.image, self.position)
+            self.game.renderer.blit(self.image, self.position)
 
-            if updated_refresh[ENTITY] and len(self.children) > 0:
-                # Only move/render the last child to front of the train
-                self.children[-1].draw()
 
-                # Change the new last child's image to the tail
-                self.children[-1].make_end_img()
+    def refresh_draw(self) -> None:
+        """refresh_draw
+
+        refresh_draw does stuff
+        """
+
+        if self.state == Entity.ALIVE:
+            self.body.refresh_draw()
+
+        super().refresh_draw()
 
 
     def grow(self, eaten_obj: Entity) -> None:
@@ -202,23 +221,10 @@ class Snake(Entity):
         grow does stuff
         """
 
-        # Add a new tail segment
+        # Add new tail segments
         if self.state == Entity.ALIVE:
-            new_tails = Deque()
-
-            for _ in range(eaten_obj.growth):
-                tail = TailSegment(
-                    self,
-                    self.game,
-                    self.direction,
-                    player=self.is_player,
-                )
-
-                new_tails.append(tail)
-
-                self.num_tails += 1
-
-            self.children = self.children + new_tails
+            self.body.grow(eaten_obj.growth)
+            self.num_tails += eaten_obj.growth
 
 
     def choose_direction(self) -> None:
@@ -232,21 +238,11 @@ class Snake(Entity):
         if self.state == Entity.ALIVE:
             # Check if Ai or player controls this entity
             if self.is_player:
-                key = pygame_key.get_pressed()
-                config = self.game.game_config["settings"]["keybindings"]
-                # pylint: disable=access-member-before-definition
-                if key[INPUT_KEY_MAP[config["move_up"]]] and self.direction != 0 and self.prev_direction != 2:
-                    # pylint: disable=access-member-before-definition
-                    self.direction = 0
-
-                elif key[INPUT_KEY_MAP[config["move_down"]]] and self.direction != 2 and self.prev_direction != 0:
-                    self.direction = 2
-
-                elif key[INPUT_KEY_MAP[config["move_left"]]] and self.direction != 3 and self.prev_direction != 1:
-                    self.direction = 3
-
-                elif key[INPUT_KEY_MAP[config["move_right"]]] and self.direction != 1 and self.prev_direction != 3:
-                    self.direction = 1
+                # Take the next queued turn once the last one has been moved
+                if self.direction == self.prev_direction:
+                    direction = self.game.player_input.next_direction(self.id, self.direction, self.prev_direction)
+                    if direction is not None:
+                        self.direction = direction
 
             else:
                 # Ai makes it's decision and move together
@@ -261,9 +257,9 @@ class Snake(Entity):
         move does stuff
         """
 
-        move_cooldown_timer = self.time_last_moved + timedelta(milliseconds=self.base_speed/self.speed_mod)
+        move_cooldown_timer = self.time_last_moved + self.base_speed/self.speed_mod
 
-        if datetime.now() >= move_cooldown_timer and self.state == Entity.ALIVE:
+        if self.game.tick_clock.time_ms >= move_cooldown_timer and self.state == Entity.ALIVE:
             if not self.is_player:
                 # Ai makes it's decision for what direction to move
                 self.aquire_primary_target(self.target_type)
@@ -303,223 +299,31 @@ class Snake(Entity):
             # Don't update if entity has not actually moved
             if self.prev_position != self.position:
                 # Mark previous grid position as walkable for pathfinding
-                obj_pos_to_node(self.game, self.prev_position).walkable = True
+                self.game.grid.set_walkable(self.prev_position, True)
 
                 # Mark grid position as unwalkable for pathfinding
-                obj_pos_to_node(self.game, self.position).walkable = False
+                self.game.grid.set_walkable(self.position, False)
 
                 # Set current position for hitbox
                 self.rect.topleft = self.position
 
+                # Register the new position for collisions
+                self.game.spatial_hash.move(self)
+
+                # The tail follows where the head was
+                self.body.advance(self.prev_position, self.direction, self.child_prev_direction)
+
                 # Set the new last moved time
-                self.time_last_moved = datetime.now()
+                self.time_last_moved = self.game.tick_clock.time_ms
 
                 # Entity updated
                 return True
 
             # Set the new last moved time
-            self.time_last_moved = datetime.now()
+            self.time_last_moved = self.game.tick_clock.time_ms
 
             # Entity didn't update
             return False
 
         # Entity didn't update
         return False
-
-
-class TailSegment(Entity):
-    """TailSegment
-
-    Tail Segment for the snake
-    """
-
-    def __init__(self, parent: Snake, game: "SnakeGame", direction: int, player: bool = False):
-        # Name for this type of object
-        self.name = "tail-segment_"
-
-        # Initilize parent init
-        super().__init__(game, self.name)
-
-        # The game obj
-        self.game = game
-
-        # The entity state, defaults to alive
-        self.state = Entity.ALIVE
-
-        # Parent of this child
-        self.parent = parent
-
-        # Is this a entity part of the player obj?
-        self.is_player = player
-
-        # Determines if entity can be killed
-        self.is_killable = False
-
-        # No Sight lines for tail segments
-        self.sight_lines = []
-
-        # Direction the snake was heading in
-        self.direction = direction
-
-        # Entity's visual representation
-        self.img_index = 2
-        self.image = self.parent.sprite_images[self.img_index]
-
-        # Entity is a rectangle object
-        self.rect = self.image.get_rect(topleft=self.position)
-
-        # Mark grid position as unwalkable for pathfinding
-        obj_pos_to_node(self.game, self.position).walkable = False
-
-        # self.obj_color = self.parent.obj_color
-
-
-    def draw(self, *kwargs) -> None:
-        """
-        draw
-
-        draw does stuff
-        """
-
-        # render if alive
-        if self.state == Entity.ALIVE:
-            # Clear previous frame obj's location
-            self.game.screen.fill(COLOR_BLACK, (self.position[X], self.position[Y], self.rect.width, self.rect.height))
-
-            # Save current position as last position
-            self.prev_position = self.position
-
-            # located where the parent obj was last
-            self.position = self.parent.prev_position
-            self.rect.topleft = self.position
-
-            # Mark previous grid position as walkable for pathfinding
-            obj_pos_to_node(self.game, self.prev_position).walkable = True
-
-            # Mark grid position as unwalkable for pathfinding
-            obj_pos_to_node(self.game, self.position).walkable = False
-
-            # Choose the right image for this segment
-            self.choose_img()
-
-            # Tint the sprite with a color
-            # self.tint(self.obj_color)
-
-            # Render the tail segment based on it's parameters
-            self.game.screen.blit(self.image, self.position)
-
-            # Move the child to the front of the list
-            self.parent.children.rotate()
-
-
-    def choose_img(self) -> None:
-        """choose_img
-        """
-
-        # Moving up
-        if self.parent.direction == UP:
-            self.direction = UP
-            if self.parent.child_prev_direction == self.parent.direction:
-                self.img_index = 0
-            elif self.parent.child_prev_direction == RIGHT:
-                self.img_index = 5
-            elif self.parent.child_prev_direction == LEFT:
-                self.img_index = 4
-
-        # Moving down
-        elif self.parent.direction == DOWN:
-            self.direction = DOWN
-            if self.parent.child_prev_direction == self.parent.direction:
-                self.img_index = 0
-            elif self.parent.child_prev_direction == RIGHT:
-                self.img_index = 2
-            elif self.parent.child_prev_direction == LEFT:
-                self.img_index = 3
-
-        # Moving left
-        elif self.parent.direction == LEFT:
-            self.direction = LEFT
-            if self.parent.child_prev_direction == self.parent.direction:
-                self.img_index = 1
-            elif self.parent.child_prev_direction == UP:
-                self.img_index = 2
-            elif self.parent.child_prev_direction == DOWN:
-                self.img_index = 5
-
-        # Moving right
-        elif self.parent.direction == RIGHT:
-            self.direction = RIGHT
-            if self.parent.child_prev_direction == self.parent.direction:
-                self.img_index = 1
-            elif self.parent.child_prev_direction == UP:
-                self.img_index = 3
-            elif self.parent.child_prev_direction == DOWN:
-                self.img_index = 4
-
-        else:
-            self.img_index = self.img_index
-
-        self.image = self.parent.sprite_images[self.img_index]
-
-
-    def make_end_img(self) -> None:
-        """make_end_img
-        """
-
-        ahead_img_index = self.parent.children[-2].img_index
-        ahead_direction = self.parent.children[-2].direction
-
-       # Moving up
-        if ahead_direction == UP:
-            # left to up is still tail heading left
-            if ahead_img_index == 5:
-                self.img_index = 8
-            # right to up is still tail heading right
-            elif ahead_img_index == 4:
-                self.img_index = 9
-            else:
-                self.img_index = 6
-
-        # Moving down
-        elif ahead_direction == DOWN:
-            # left to down is still tail heading left
-            if ahead_img_index == 2:
-                self.img_index = 8
-            # right to down is still tail heading right
-            elif ahead_img_index == 3:
-                self.img_index = 9
-            else:
-                self.img_index = 7
-
-        # Moving left
-        elif ahead_direction == LEFT:
-            # top to left is still tail heading down
-            if ahead_img_index == 5:
-                self.img_index = 7
-            # bottom to left is still tail heading up
-            elif ahead_img_index == 2:
-                self.img_index = 6
-            else:
-                self.img_index = 9
-
-        # Moving right
-        elif ahead_direction == RIGHT:
-            # top to right is still tail heading down
-            if ahead_img_index == 4:
-                self.img_index = 7
-            # bottom to right is still tail heading up
-            elif ahead_img_index == 3:
-                self.img_index = 6
-            else:
-                self.img_index = 8
-
-        else:
-            self.img_index = self.img_index
-
-        self.image = self.parent.sprite_images[self.img_index]
-
-        # Tint the sprite with a color
-        # self.tint(self.obj_color)
-
-        # Render the tail segment based on it's parameters
-        self.game.screen.blit(self.image, self.position)
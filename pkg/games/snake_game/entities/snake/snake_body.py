@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+
+"""
+    Snake Body
+
+    The tail segments of a snake
+
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pygame import Rect
+
+from pkg.games.snake_game.entities.entity import Entity
+from pkg.games.snake_game.constants import (
+    COLOR_BLACK,
+    UP,
+    DOWN,
+    LEFT,
+    RIGHT,
+)
+
+if TYPE_CHECKING:
+    from pkg.games.snake_game.entities.snake.snake import Snake
+
+
+class SnakeBody():
+    """SnakeBody
+
+    Tail of a snake kept as a ring buffer of segment positions plus per
+    segment image index and direction arrays. Index 0 is the segment right
+    behind the head and index length - 1 the end of the tail.
+
+    Growing only adds to the number of pending segments, the end of the tail
+    then stays put for that many moves while the front keeps being laid down.
+    The body is registered in the spatial hash once for every cell it covers.
+
+    A move only changes the front and the end of the tail, so those are
+    drawn along with any segment something else drew over since the last
+    draw (sight lines, food, the head), as the renderer logged it.
+    """
+
+    def __init__(self, snake: "Snake", pending: int = 0, capacity: int = 16):
+        """SnakeBody initilizer
+
+        Args:
+            snake (Snake): The snake the body belongs to
+            pending (int, optional): Number of segments still to be laid down. Defaults to 0.
+            capacity (int, optional): Starting size of the arrays. Defaults to 16.
+        """
+
+        self.snake = snake
+        self.game = snake.game
+        self.size = snake.game.grid_size
+
+        # Names used by collisions and the ai, a body counts as the snake's tail
+        self.name = "tail-segment_"
+        self.id = self.name + snake.id
+        self.display_name = snake.display_name
+        self.state = Entity.ALIVE
+
+        # Ring buffer of segments, front is the array slot of segment 0
+        self.capacity = max(1, capacity)
+        self.xs = np.zeros(self.capacity, dtype=np.int32)
+        self.ys = np.zeros(self.capacity, dtype=np.int32)
+        self.img_indexes = np.zeros(self.capacity, dtype=np.uint8)
+        self.directions = np.zeros(self.capacity, dtype=np.int8)
+        self.front = 0
+        self.length = 0
+
+        # Segments to add before the end of the tail starts following again
+        self.pending = pending
+
+        # Cells left since the last draw and if the front/end need a redraw
+        self.vacated: list[tuple[int, int]] = []
+        self.moved = False
+
+        # Renderer painted_count as of the last draw, what's drawn after may cover segments
+        self.painted_seen = self.game.renderer.painted_count
+
+
+    def __len__(self) -> int:
+        return self.length
+
+
+    @property
+    def position(self) -> tuple[int, int]:
+        """position
+
+        Returns:
+            [tuple]: Position of the front segment, (-1, -1) without segments
+        """
+
+        if not self.length:
+            return (-1, -1)
+
+        return self.segment_position(0)
+
+
+    def segment_position(self, index: int) -> tuple[int, int]:
+        """segment_position
+
+        Returns:
+            [tuple]: (x, y) pixel position of segment index
+        """
+
+        slot = (self.front + index) % self.capacity
+
+        return int(self.xs[slot]), int(self.ys[slot])
+
+
+    def grow(self, amount: int) -> None:
+        """grow
+
+        Args:
+            amount (int): Number of segments to add
+        """
+
+        self.pending += amount
+
+
+    def advance(self, position: tuple, direction: int, prev_direction: int) -> None:
+        """advance
+
+        Lay a segment down where the head was and drop the end of the tail
+        unless the body is still growing.
+
+        Args:
+            position (tuple): (x, y) pixel position the head moved from
+            direction (int): Direction the head moved in
+            prev_direction (int): Direction the head moved in the move before
+        """
+
+        if self.pending:
+            self.pending -= 1
+
+        elif self.length:
+            self.length -= 1
+            vacated = self.segment_position(self.length)
+
+            # Mark previous grid position as walkable for pathfinding, unless the head just moved into it
+            if vacated != self.snake.position:
+                self.game.grid.set_walkable(vacated, True)
+            self.game.spatial_hash.discard(self, vacated)
+            self.vacated.append(vacated)
+
+        if self.length == self.capacity:
+            self._reallocate(self.capacity * 2)
+
+        self.front = (self.front - 1) % self.capacity
+        self.xs[self.front] = position[0]
+        self.ys[self.front] = position[1]
+        self.directions[self.front] = direction
+        self.img_indexes[self.front] = self._segment_img_index(direction, prev_direction)
+        self.length += 1
+
+        # Mark grid position as unwalkable for pathfinding
+        self.game.grid.set_walkable(position, False)
+        self.game.spatial_hash.add(self, position)
+
+        # The new last segment becomes the end of the tail
+        if self.length > 1:
+            end = (self.front + self.length - 1) % self.capacity
+            ahead = (self.front + self.length - 2) % self.capacity
+            self.img_indexes[end] = self._end_img_index(self.directions[ahead], self.img_indexes[ahead])
+
+        self.moved = True
+
+
+    def draw(self) -> None:
+        """draw
+
+        Clear the cells the body left and draw the segments that changed
+        """
+
+        renderer = self.game.renderer
+
+        # What got drawn since the last draw, the body's own draws aren't in it
+        painted = renderer.painted_since(self.painted_seen)
+
+        for cell in self.vacated:
+            renderer.fill(COLOR_BLACK, (cell, (self.size, self.size)))
+        self.vacated = []
+
+        if self.length:
+            if painted is None:
+                indexes = range(self.length)
+
+            else:
+                indexes = self._covered(painted)
+                if self.moved:
+                    indexes.update((0, self.length - 1))
+                indexes = sorted(indexes)
+
+            for index in indexes:
+                self._blit_segment(index)
+
+        self.moved = False
+        self.painted_seen = renderer.painted_count
+
+
+    def refresh_draw(self) -> None:
+        """refresh_draw
+
+        Draw every segment
+        """
+
+        for index in range(self.length):
+            self._blit_segment(index)
+
+        self.painted_seen = self.game.renderer.painted_count
+
+
+    def clear(self) -> None:
+        """clear
+
+        Take every segment off the screen, the grid and the spatial hash
+        """
+
+        for index in range(self.length):
+            position = self.segment_position(index)
+            self.game.renderer.fill(COLOR_BLACK, (position, (self.size, self.size)))
+            self.game.grid.set_walkable(position, True)
+            self.game.spatial_hash.discard(self, position)
+
+        self.length = 0
+        self.pending = 0
+        self.vacated = []
+        self.moved = False
+        self.state = Entity.DEAD
+
+
+    def interact(self, interacting_obj: Entity) -> None:
+        """interact
+
+        Running into the body is running into the snake
+        """
+
+        self.snake.interact(interacting_obj)
+
+
+    def _covered(self, painted: list[Rect]) -> set[int]:
+        """_covered
+
+        Returns:
+            [set]: Indexes of the segments any of the painted areas overlap
+        """
+
+        covered = set()
+        if not painted:
+            return covered
+
+        slots = (self.front + np.arange(self.length)) % self.capacity
+        xs = self.xs[slots]
+        ys = self.ys[slots]
+
+        # Most areas are nowhere near the body
+        left = int(xs.min())
+        top = int(ys.min())
+        right = int(xs.max()) + self.size
+        bottom = int(ys.max()) + self.size
+
+        for rect in painted:
+            if rect.right <= left or rect.left >= right or rect.bottom <= top or rect.top >= bottom:
+                continue
+
+            hits = (xs < rect.right) & (xs + self.size > rect.left) & (ys < rect.bottom) & (ys + self.size > rect.top)
+            covered.update(np.flatnonzero(hits).tolist())
+
+        return covered
+
+
+    def _blit_segment(self, index: int) -> None:
+        """_blit_segment
+
+        Draw segment index with it's sprite
+        """
+
+        slot = (self.front + index) % self.capacity
+        image = self.snake.sprite_images[self.img_indexes[slot]]
+        self.game.renderer.blit(image, (int(self.xs[slot]), int(self.ys[slot])))
+
+
+    def _reallocate(self, capacity: int) -> None:
+        """_reallocate
+
+        Copy the segments into arrays of a new capacity, front moved to slot 0
+        """
+
+        order = (self.front + np.arange(self.length)) % self.capacity
+
+        for name in ("xs", "ys", "img_indexes", "directions"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.length] = old[order]
+            setattr(self, name, new)
+
+        self.capacity = capacity
+        self.front = 0
+
+
+    @staticmethod
+    def _segment_img_index(direction: int, prev_direction: int) -> int:
+        """_segment_img_index
+
+        Returns:
+            [int]: Sprite of a segment laid down moving direction after prev_direction
+        """
+
+        # Moving up
+        if direction == UP:
+            if prev_direction == RIGHT:
+                return 5
+            elif prev_direction == LEFT:
+                return 4
+            return 0
+
+        # Moving down
+        elif direction == DOWN:
+            if prev_direction == RIGHT:
+                return 2
+            elif prev_direction == LEFT:
+                return 3
+            return 0
+
+        # Moving left
+        elif direction == LEFT:
+            if prev_direction == UP:
+                return 2
+            elif prev_direction == DOWN:
+                return 5
+            return 1
+
+        # Moving right
+        if prev_direction == UP:
+            return 3
+        elif prev_direction == DOWN:
+            return 4
+        return 1
+
+
+    @staticmethod
+    def _end_img_index(ahead_direction: int, ahead_img_index: int) -> int:
+        """_end_img_index
+
+        Returns:
+            [int]: Sprite of the end of the tail behind a segment
+        """
+
+        # Moving up
+        if ahead_direction == UP:
+            # left to up is still tail heading left
+            if ahead_img_index == 5:
+                return 8
+            # right to up is still tail heading right
+            elif ahead_img_index == 4:
+                return 9
+            return 6
+
+        # Moving down
+        elif ahead_direction == DOWN:
+            # left to down is still tail heading left
+            if ahead_img_index == 2:
+                return 8
+            # right to down is still tail heading right
+            elif ahead_img_index == 3:
+                return 9
+            return 7
+
+        # Moving left
+        elif ahead_direction == LEFT:
+            # top to left is still tail heading down
+            if ahead_img_index == 5:
+                return 7
+            # bottom to left is still tail heading up
+            elif ahead_img_index == 2:
+                return 6
+            return 9
+
+        # Moving right
+        # top to right is still tail heading down
+        if ahead_img_index == 4:
+            return 7
+        # bottom to right is still tail heading up
+        elif ahead_img_index == 3:
+            return 6
+        return 8
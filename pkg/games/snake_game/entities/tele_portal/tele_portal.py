@@ -10,17 +10,13 @@
 """
 
 
-from random import randint, randrange
-from datetime import datetime, timedelta
 from typing import Deque, TYPE_CHECKING
 
-from pygame import mixer
-
 from pkg.games.snake_game.entities import Entity
 
 from pkg.games.snake_game.constants import (
     COLOR_BLACK,
-    SOUND_PORTAL_ENTER_IDX,
+    SOUND_PORTAL_ENTER,
     X,
     Y,
     ENTITY,
@@ -60,8 +56,8 @@ class TelePortal(Entity):
         self.is_spawned = False
 
         # When obj should be spawned
-        now = datetime.now()
-        self.spawn_timer = now + timedelta(seconds=randint(2, 5))
+        now = self.game.tick_clock.time_ms
+        self.spawn_timer = now + self.game.random.randint(2, 5) * 1000
 
         # teleportation portal Sprite images
         self.tele_portal_images = self.game.tele_portal_images
@@ -74,10 +70,8 @@ class TelePortal(Entity):
 
         # Interact sound
         if self.game.app.is_audio:
-            self.sound_interact = self.game.sounds[SOUND_PORTAL_ENTER_IDX]
+            self.sound_interact = self.hold_sound(SOUND_PORTAL_ENTER)
             self.sound_mod = 2.5
-            effect_volume = self.game.app.app_config["settings"]["sound"]["effect_volume"]
-            self.sound_interact_volume = float(effect_volume)/self.sound_mod
 
         # Active trigger
         self.activated = now
@@ -90,10 +84,14 @@ class TelePortal(Entity):
         if not parent:
             self.children.append(TelePortal(game, parent=self))
 
+            # No room for the parent, keep the pair off the board until update spawns it
+            if not self.game.spatial_hash.is_tracked(self):
+                self.children[0].despawn()
+
 
     def update(self) -> tuple[bool, bool]:
         # Verify if teleporter should be spawned
-        now = datetime.now()
+        now = self.game.tick_clock.time_ms
         if not self.is_spawned:
             pass
         elif now < self.spawn_timer:
@@ -103,13 +101,13 @@ class TelePortal(Entity):
         self.is_spawned = True
 
         # Set next spawn time
-        self.spawn_timer = now + timedelta(seconds=randint(10, 25))
+        self.spawn_timer = now + self.game.random.randint(10, 25) * 1000
 
         # Mark previous position
         self.prev_position = self.position
 
         # try to spawn if obj can
-        return self.spawn(), True
+        return self.spawn()
 
 
     def draw(self, updated_refresh: tuple[bool, bool], *kwargs) -> None:
@@ -123,7 +121,7 @@ class TelePortal(Entity):
         if self.state == Entity.ALIVE and (updated_refresh[ENTITY] or updated_refresh[CHILD]):
 
             # Render the teleportal based on it's parameters
-            self.game.screen.blit(self.image, self.position)
+            self.game.renderer.blit(self.image, self.position)
 
             # Draw each child if there are any
             for child in self.children:
@@ -138,9 +136,9 @@ class TelePortal(Entity):
         """
 
         # Clear previous frame obj's location
-        self.game.screen.fill(COLOR_BLACK, (self.position[X], self.position[Y], self.rect.width, self.rect.height))
+        self.game.renderer.fill(COLOR_BLACK, (self.position[X], self.position[Y], self.rect.width, self.rect.height))
 
-        self.set_random_spawn(3, 3)
+        is_placed = self.set_random_spawn(3, 3)
 
         self.state = Entity.ALIVE
 
@@ -148,9 +146,15 @@ class TelePortal(Entity):
 
         if self.children:
             for child in self.children:
-                child.spawn()
+                is_placed = child.spawn()[ENTITY] and is_placed
             updated_child = True
 
+        if not is_placed:
+            # Board full, take the pair off it and try again next tick
+            for portal in (self, *self.children):
+                portal.despawn()
+            return False, False
+
         return True, updated_child
 
 
@@ -167,15 +171,19 @@ class TelePortal(Entity):
         if self.parent:
             # move other_obj to the parent portal
             other_obj.position = (self.parent.position[X]+side_num_x, self.parent.position[Y]+side_num_y)
-            self.parent.activated = datetime.now()
+            self.parent.activated = self.game.tick_clock.time_ms
 
         # Is the parent portal cuz doesn't have a parent
         else:
             # move other_obj to the child portal
             other_obj.position = (self.children[0].position[X]+side_num_x, self.children[0].position[Y]+side_num_y)
-            self.children[0].activated = datetime.now()
+            self.children[0].activated = self.game.tick_clock.time_ms
+
+        self.activated = self.game.tick_clock.time_ms
 
-        self.activated = datetime.now()
+        # Keep other_obj's hitbox and collision cell with it's new position
+        other_obj.rect.topleft = other_obj.position
+        self.game.spatial_hash.move(other_obj)
 
 
     def _determine_side(self, other_obj: Entity) -> tuple[int, int]:
@@ -196,9 +204,9 @@ class TelePortal(Entity):
         interact does stuff
         """
 
-        if self.activated + timedelta(seconds=self.abilty_cooldown) <= datetime.now():
+        if self.activated + self.abilty_cooldown * 1000 <= self.game.tick_clock.time_ms:
             # teleport not on cooldown
-            self.activated = datetime.now()
+            self.activated = self.game.tick_clock.time_ms
 
         else:
             # Teleport on cooldown
@@ -207,11 +215,7 @@ class TelePortal(Entity):
 
         # Play second interacting_obj's interact sound
         if self.game.app.is_audio:
-            sound = self.sound_interact
-            effect_volume = self.game.app.app_config["settings"]["sound"]["effect_volume"]
-            self.sound_interact_volume = float(effect_volume)/self.sound_mod
-            sound.set_volume(self.sound_interact_volume)
-            mixer.Sound.play(sound)
+            self.game.app.voices.play(self.sound_interact, 1 / self.sound_mod)
 
         # Teleport the obj to the paired portal
         self.teleport(interacting_obj)
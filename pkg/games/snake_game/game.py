@@ -13,12 +13,11 @@
 from gc import collect as gc_collect
 from json import dump as json_dump, load as json_load
 from logging import (
+    debug as logging_debug,
     info as logging_info,
 )
-import numpy as np
 from os import path
 from pathlib import Path
-from threading import Thread
 
 from pygame import (
     display as pygame_display,
@@ -27,13 +26,11 @@ from pygame import (
     font as pygame_font,
     freetype as pygame_freetype,
     mixer as pygame_mixer,
-    sndarray as pygame_sndarray,
     sprite,
     Surface,
-    transform,
 )
 
-from .ai import DecisionBox, Node
+from .ai import DecisionBox, PathFinder
 from .constants import (
     COLOR_BLACK,
     COLOR_BLUE,
@@ -47,6 +44,7 @@ from .constants import (
     GAME_TITLE,
     REGULAR_FONT,
     REGULAR_FONT_SIZE,
+    ENTITY,
     MENU_HOME,
     MENU_PAUSE,
     MENU_SETTINGS,
@@ -63,6 +61,7 @@ from .constants import (
     SPRITE_SHEET_SNAKE_ENEMY,
     SPRITE_SHEET_FOOD,
     SPIRTE_SHEET_TELEPORTAL,
+    SPRITE_CACHE_DIR,
     X,
     Y,
     WIDTH,
@@ -73,8 +72,10 @@ from .entities import (
     Food,
     Snake,
     TelePortal,
+    seed_display_names,
 )
-from .graphics.sprite_sheet import SpriteSheet
+from .graphics import SpriteAtlas
+from .grid import DistanceField, SightQuery, SpatialHash, WalkabilityGrid
 from .menus import (
     home_menu,
     pause_menu,
@@ -86,6 +87,7 @@ from .menus import (
 )
 
 from .game_configs import GameConfig, LeaderBoard
+from .player_input import PlayerInput
 
 from pkg.app import App
 from pkg.base_game import BaseGame
@@ -169,76 +171,54 @@ class SnakeGame(BaseGame):
         self.game_music_loop = MUSIC_LOOP
         self.playlist = [self.game_music_loop]
         self.current_track = 0
-        if self.app.is_audio:
-            try:
-                pygame_mixer.music.load(self.game_music_intro)
-                pygame_mixer.music.set_volume(float(self.app.app_config["settings"]["sound"]["music_volume"]))
-
-                # Game Sounds
-                self.sounds = [
-                    pygame_mixer.Sound(SOUND_SNAKE_DEATH),
-                    pygame_mixer.Sound(SOUND_FOOD_PICKUP),
-                    pygame_mixer.Sound(SOUND_PORTAL_ENTER),
-                ]
-            except pygame_error:
-                # default fallback sound
-                size = 44100
-                sounds = []
-                for num in range(3):
-                    sound_arr = np.random.randint(-32768, 32767, size=size*2)
-                    sound_arr = sound_arr.reshape(size, 2)
-                    default_sound = pygame_sndarray.make_sound(sound_arr)
-                    sounds.append(default_sound)
-                self.menu_sounds = [
-                    pygame_mixer.Sound(sounds[0]), # hover
-                    pygame_mixer.Sound(sounds[1]), # forward
-                    pygame_mixer.Sound(sounds[2]), # backward
-                ]
+        with self.app.startup_trace.step("game: sounds"):
+            if self.app.is_audio:
+                try:
+                    pygame_mixer.music.load(self.game_music_intro)
+                    pygame_mixer.music.set_volume(float(self.app.app_config["settings"]["sound"]["music_volume"]))
+
+                except pygame_error:
+                    pass
+
+                # Game Sounds, preloaded so no entity loads one mid game
+                self.sounds = self.app.sound_bank.preload([
+                    SOUND_SNAKE_DEATH,
+                    SOUND_FOOD_PICKUP,
+                    SOUND_PORTAL_ENTER,
+                ])
 
         logging_info("Loading Sounds and Music: Finished")
 
         # Game object containers
         self.sprite_group: sprite.RenderUpdates[Entity] = sprite.RenderUpdates()
         self.entity_final_scores = {}
+        self.entity_survival = {}
 
         logging_info("Loading Sprites: Working")
-        ## Game sprite Sheets
+        ## Game sprite Sheets, sliced once and scaled once per grid size
+        self.sprite_atlas = SpriteAtlas(cache_dir=SPRITE_CACHE_DIR)
+
         # Snake Sprite Images
-        self.snake_sprite_sheet = SpriteSheet(SPRITE_SHEET_SNAKE_PLAYER)
-        self.snake_images = self.snake_sprite_sheet.load_grid_images(
-            (2, 8),
-            (1, 1),
-            (1, 1),
-        )
+        self.sprite_atlas.add_sheet("snake", SPRITE_SHEET_SNAKE_PLAYER, (2, 8), (1, 1), (1, 1))
+        self.snake_images = []
 
         # Snake Enemy Sprite Images
-        self.snake_enemy_sprite_sheet = SpriteSheet(SPRITE_SHEET_SNAKE_ENEMY)
-        self.snake_enemy_images = self.snake_enemy_sprite_sheet.load_grid_images(
-            (2, 8),
-            (1, 1),
-            (1, 1),
-        )
+        self.sprite_atlas.add_sheet("snake_enemy", SPRITE_SHEET_SNAKE_ENEMY, (2, 8), (1, 1), (1, 1))
+        self.snake_enemy_images = []
 
         # Food Sprite images
-        self.food_sprite_sheet = SpriteSheet(SPRITE_SHEET_FOOD)
-        self.food_images = self.food_sprite_sheet.load_grid_images(
-            (1, 1),
-            (1, 1),
-            (1, 1),
-        )
+        self.sprite_atlas.add_sheet("food", SPRITE_SHEET_FOOD, (1, 1), (1, 1), (1, 1))
+        self.food_images = []
 
         # Teleportal Sprite images
-        self.tele_portal_sprite_sheet = SpriteSheet(SPIRTE_SHEET_TELEPORTAL)
-        self.tele_portal_images = self.tele_portal_sprite_sheet.load_grid_images(
-            (1, 1),
-            (1, 1),
-            (1, 1),
-        )
+        self.sprite_atlas.add_sheet("tele_portal", SPIRTE_SHEET_TELEPORTAL, (1, 1), (1, 1), (1, 1))
+        self.tele_portal_images = []
         logging_info("Loading Sprites: Finished")
 
         logging_info("Transforming Sprites: Working")
         # Transform the sprite images relative to grid size
-        self.transform_all_entity_images()
+        with self.app.startup_trace.step("game: sprites"):
+            self.transform_all_entity_images()
         logging_info("Transforming Sprites: Finished")
 
         # AI blackbox
@@ -248,9 +228,26 @@ class SnakeGame(BaseGame):
         # Pathfinding grid of the game space
         self.grid_width = self.screen_size[WIDTH] // self.grid_size + self.grid_size
         self.grid_height = self.screen_size[HEIGHT] // self.grid_size + self.grid_size
-        self.grid = [[Node(x, y) for y in range(self.grid_height)] for x in range(self.grid_width)]
+        self.grid = WalkabilityGrid(self.grid_width, self.grid_height, self.grid_size)
         logging_info("Building pathfinding grid: Finished")
 
+        # A* engine over the pathfinding grid
+        self.path_finder = PathFinder(self)
+
+        # Sight line queries over the pathfinding grid
+        self.sight = SightQuery(self.grid)
+
+        # Distances to the nearest food shared by every ai snake, refreshed at most once a tick
+        self.foods: list[Food] = []
+        self.food_field = DistanceField(self.grid)
+        self.food_field_tick = -1
+
+        # Cell index of the game objects for collisions
+        self.spatial_hash = SpatialHash(self.grid_size)
+
+        # Gameplay key presses queued as turns of the player snakes
+        self.player_input = PlayerInput(self)
+
         logging_info("Building Menus: Working")
         # Set the game menus to the app menu object
         self.app.menu.menu_options[MENU_HOME] = lambda: home_menu(self.app.menu)
@@ -269,41 +266,48 @@ class SnakeGame(BaseGame):
         play does stuff
         """
 
-        # Execute game object actions via parallel threads
-        thread_group: list[Thread] = []
-        for obj in self.sprite_group:
-            if not obj.state == Entity.ALIVE:
-                continue
+        # Redraw the game objects when coming back from a menu
+        if self.app.menu.prev_menu in [MENU_HOME, MENU_PAUSE, MENU_GAME_OVER]:
+            for obj in self.sprite_group:
+                if obj.state == Entity.ALIVE:
+                    obj.refresh_draw()
 
-            if self.app.menu.prev_menu in [MENU_HOME, MENU_PAUSE, MENU_GAME_OVER]:
-                obj.refresh_draw()
+        profiler = self.app.profiler
 
-            thread = Thread(target=self._object_actions, args=(obj,))
-            thread.start()
-            thread_group.append(thread)
+        # Play the fixed logic ticks owed for the real time that passed
+        with profiler.span("game.ticks"):
+            for _ in range(self.tick_clock.advance()):
+                self.play_tick()
 
-        # Wait for threads to finish
-        for thread in thread_group:
-            thread.join()
+        # Draw what's still queued (refreshes on frames without a tick) under the game bar
+        self.renderer.flush()
 
         # Only 1 tick to refresh from pause_menu
         if self.app.menu.prev_menu in [MENU_HOME, MENU_PAUSE]:
             self.app.menu.prev_menu = None
 
+        # Nothing else to render without a display
+        if self.app.headless:
+            return
+
         # show the game bar at top of screen
-        self.game_bar_display()
+        with profiler.span("game.game_bar"):
+            self.game_bar_display()
 
         # if the display should be redone with the debug visuals
         if self.app.app_config["settings"]["debug"]["debug_mode"]:
+            # Where the tick went
+            logging_debug(self.scheduler.timing_report())
 
-            self.screen.fill(COLOR_WHITE)
+            self.renderer.fill(COLOR_WHITE)
 
-            for row in self.grid:
-                for node in row:
-                    if not node.walkable:
-                        draw.rect(self.screen, COLOR_BLACK, (node.x * self.grid_size, node.y * self.grid_size, self.grid_size, self.grid_size))
+            walkable = self.grid.walkable_mask()
+            for x in range(self.grid_width):
+                for y in range(self.grid_height):
+                    if not walkable[x, y]:
+                        draw.rect(self.screen, COLOR_BLACK, (x * self.grid_size, y * self.grid_size, self.grid_size, self.grid_size))
                     else:
-                        draw.rect(self.screen, COLOR_WHITE, (node.x * self.grid_size, node.y * self.grid_size, self.grid_size, self.grid_size), 1)
+                        draw.rect(self.screen, COLOR_WHITE, (x * self.grid_size, y * self.grid_size, self.grid_size, self.grid_size), 1)
 
             for obj in self.sprite_group:
                 if "snake" in obj.name:
@@ -314,20 +318,122 @@ class SnakeGame(BaseGame):
                         draw.rect(self.screen, COLOR_RED, (obj.target[0][0], obj.target[0][1], self.grid_size, self.grid_size))
 
 
-    def _object_actions(self, obj: Entity):
-        """_object_actions
+    def play_tick(self):
+        """play_tick
+
+        One fixed timestep of game logic
+        """
+
+        self.tick_clock.step()
+
+        # Hand the live game objects to the tick scheduler
+        live_objs = [obj for obj in self.sprite_group if obj.state == Entity.ALIVE]
+
+        with self.app.profiler.span("game.tick"):
+            self.scheduler.run(
+                live_objs,
+                self._object_update,
+                self._object_draw,
+                self._object_collision,
+            )
+
+        # Draw everything the entities queued this tick in one go
+        self.renderer.flush()
+
+
+    def _object_update(self, obj: Entity) -> tuple[bool, bool]:
+        """_object_update
 
-        _object_actions does stuff
+        _object_update does stuff
         """
 
         # take obj tick actions
-        is_updated, is_child_updated = obj.update()
+        return obj.update()
+
+
+    def _object_draw(self, obj: Entity, updated_refresh: tuple[bool, bool]) -> None:
+        """_object_draw
+
+        _object_draw does stuff
+        """
 
         # Draw game objects
-        obj.draw((is_updated, is_child_updated))
+        obj.draw(updated_refresh)
+
+
+    def _object_collision(self, obj: Entity, updated_refresh: tuple[bool, bool]) -> None:
+        """_object_collision
+
+        _object_collision does stuff
+        """
 
         # collision of obj to other objects/children-of-other-objs
-        obj.collision_checks(is_updated)
+        obj.collision_checks(updated_refresh[ENTITY])
+
+
+    def food_distances(self) -> DistanceField:
+        """food_distances
+
+        Returns:
+            [DistanceField]: Distances to the nearest spawned food, as of the start of this tick's moves
+        """
+
+        if self.food_field_tick != self.tick_clock.tick:
+            self.food_field_tick = self.tick_clock.tick
+            with self.app.profiler.span("ai.food_field"):
+                self.food_field.update([
+                    self.grid.cell_of(food.position) for food in self.foods if food.is_spawned
+                ])
+
+        return self.food_field
+
+
+    def simulate(self, n_ticks: int, seed: int = None, ai_settings: dict = None) -> dict:
+        """simulate
+
+        Play a fresh game for n_ticks fixed timesteps as fast as the CPU allows.
+        Meant for headless apps, with human_player off for AI only games.
+        How many ticks every snake lived ends up in entity_survival.
+
+        Args:
+            n_ticks (int): Max number of ticks to play
+            seed (int, optional): Seed for the game's randomness. Defaults to None (the configured seed).
+            ai_settings (dict, optional): DecisionBox attribute -> value, like portal_use_difficulty. Defaults to None.
+
+        Returns:
+            [dict]: entity_final_scores at the end of the game
+        """
+
+        if seed is not None:
+            self.seed = seed
+
+        self.start()
+
+        # Tune the ai for this game
+        for knob, value in (ai_settings or {}).items():
+            if not hasattr(self.chosen_ai, knob):
+                raise AttributeError(f"DecisionBox has no setting '{knob}'")
+            setattr(self.chosen_ai, knob, value)
+
+        snakes = [obj for obj in self.sprite_group if "snake" in obj.name]
+
+        for _ in range(n_ticks):
+            self.play_tick()
+
+            # Stop once there are no snakes left alive
+            if not any("snake" in obj.name for obj in self.sprite_group):
+                break
+
+        self.entity_survival = {
+            snake.id: {
+                "is_player": snake.is_player,
+                "name": snake.name + snake.display_name,
+                "ticks": snake.death_tick if snake.death_tick is not None else self.tick_clock.tick,
+            }
+            for snake in snakes
+        }
+
+        return self.entity_final_scores
 
 
     def start(self):
@@ -337,11 +443,16 @@ class SnakeGame(BaseGame):
         """
 
         # Clear previous frame render
-        self.screen.fill(COLOR_BLACK)
+        self.renderer.fill(COLOR_BLACK)
 
         # Start on a clean slate
         self.clean_up()
 
+        # Same seed, same game
+        self.random.seed(self.seed)
+        seed_display_names(self.seed)
+        self.tick_clock.reset()
+
         # Check settings
         self.app.settings_checks()
 
@@ -360,7 +471,9 @@ class SnakeGame(BaseGame):
             raise OSError("1 or more food is required to play")
 
         for _ in range(num_of_food):
-            self.sprite_group.add(Food(self))
+            food = Food(self)
+            self.foods.append(food)
+            self.sprite_group.add(food)
 
         # teleporter objects
         teleporter_mod = self.game_config["settings"]["gameplay"]["teleporter"]
@@ -375,7 +488,13 @@ class SnakeGame(BaseGame):
             if player_snake.speed_mod <= 0:
                 player_snake.speed_mod = 0.6
             player_snake.is_killable = self.game_config["settings"]["gameplay"]["killable_player"]
-            self.sprite_group.add(player_snake)
+
+            # Only snakes that found room on the board join the round
+            if player_snake.is_spawned:
+                self.sprite_group.add(player_snake)
+                self.player_input.add_player(player_snake.id)
+            else:
+                player_snake.release_sounds()
 
         # initilize ai characters
         num_ai = self.game_config["settings"]["gameplay"]["num_ai"]
@@ -385,7 +504,11 @@ class SnakeGame(BaseGame):
             if enemy_snake.speed_mod <= 0:
                 enemy_snake.speed_mod = 0.6
             enemy_snake.is_killable = self.game_config["settings"]["gameplay"]["killable_ai"]
-            self.sprite_group.add(enemy_snake)
+
+            if enemy_snake.is_spawned:
+                self.sprite_group.add(enemy_snake)
+            else:
+                enemy_snake.release_sounds()
 
 
     def clean_up(self):
@@ -411,18 +534,32 @@ class SnakeGame(BaseGame):
 
             for child in obj.children:
                 child.kill()
+                if isinstance(child, Entity):
+                    child.release_sounds()
 
             obj.children = None
 
             obj.kill()
 
+            # The game keeps holding it's preloaded sounds for the next round
+            obj.release_sounds()
+
         self.sprite_group.empty()
 
+        stats = self.app.sound_bank.stats()
+        logging_debug(f"Sound bank after clean up: {stats['sounds']} sounds, {stats['users']} users, {stats['bytes'] / 1024:.0f}KiB")
+
+        # Clear the collision cells
+        self.spatial_hash.clear()
+
         # AI blackbox
         self.chosen_ai = None
 
         # Clear the grid
-        self.grid = [[Node(x, y) for y in range(self.grid_height)] for x in range(self.grid_width)]
+        self.grid.reset()
+        self.player_input.reset()
+        self.foods = []
+        self.food_field_tick = -1
 
         # Free unreferenced memory
         gc_collect()
@@ -443,12 +580,42 @@ class SnakeGame(BaseGame):
         """
 
         # Clear previous frame render
-        self.screen.fill(COLOR_BLACK)
+        self.renderer.fill(COLOR_BLACK)
 
         self.app.menu.prev_menu = self.app.menu.menu_option
         self.app.menu.menu_option = None
         self.app.pause_game_music = True
 
+        # Don't play catch up for the time spent paused
+        self.tick_clock.resync()
+
+        # Turns pressed before pausing are stale
+        self.player_input.clear()
+
+
+    def key_down(self, key: int) -> None:
+        """key_down
+
+        Args:
+            key (int): pygame key code pressed during gameplay
+        """
+
+        self.player_input.key_down(key)
+
+
+    def player_score(self) -> int:
+        """player_score
+
+        Returns:
+            [int]: Score of the human player, 0 until they scored
+        """
+
+        for value in self.entity_final_scores.values():
+            if value["is_player"]:
+                return value["score"]
+
+        return 0
+
 
     def game_bar_display(self):
         """game_bar_display
@@ -459,17 +626,14 @@ class SnakeGame(BaseGame):
 
         # Clear previous frame obj's location with the game bar color
         game_bar_pos = (X, Y, self.screen_size[WIDTH], self.game_bar_height)
-        draw.rect(self.screen, COLOR_GREY_DARK, game_bar_pos)
+        self.renderer.mark(draw.rect(self.screen, COLOR_GREY_DARK, game_bar_pos))
 
         game_bar_pos = (X, self.game_bar_height-2, self.screen_size[WIDTH], 2)
         draw.rect(self.screen, COLOR_GREY, game_bar_pos)
 
-        score = 0
-        for _, value in self.entity_final_scores.items():
-            if value["is_player"]:
-                score = value["score"]
+        score = self.player_score()
 
-        self.app.menu.render_text(f"Score:{score}", .35, -1, color=COLOR_RED, clear_background=False, relative_from="top")
+        self.app.menu.render_text(f"Score:{score}", .35, -1, color=COLOR_RED, clear_background=False, relative_from="top", is_changing=True)
 
 
     def transform_all_entity_images(self):
@@ -478,29 +642,18 @@ class SnakeGame(BaseGame):
         transform_all_entity_images does stuff
         """
 
+        # The entity image lists are filled in place, entities hold on to them
         # Transform the snake's size
-        index = 0
-        for image in self.snake_images:
-            self.snake_images[index] = transform.scale(image, (self.grid_size, self.grid_size))
-            index += 1
+        self.snake_images[:] = self.sprite_atlas.images("snake", self.grid_size)
 
         # Transform the enemy snake's size
-        index = 0
-        for image in self.snake_enemy_images:
-            self.snake_enemy_images[index] = transform.scale(image, (self.grid_size, self.grid_size))
-            index += 1
+        self.snake_enemy_images[:] = self.sprite_atlas.images("snake_enemy", self.grid_size)
 
         # Transform the food's size
-        index = 0
-        for image in self.food_images:
-            self.food_images[index] = transform.scale(image, (self.grid_size, self.grid_size))
-            index += 1
+        self.food_images[:] = self.sprite_atlas.images("food", self.grid_size)
 
         # Transform the teleporters's size
-        index = 0
-        for image in self.tele_portal_images:
-            self.tele_portal_images[index] = transform.scale(image, (self.grid_size, self.grid_size))
-            index += 1
+        self.tele_portal_images[:] = self.sprite_atlas.images("tele_portal", self.grid_size)
 
 
 def is_multiple_of_4(number):
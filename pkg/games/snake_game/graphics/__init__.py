@@ -9,4 +9,5 @@
     :license: GPLv3, see LICENSE for more details.
 """
 
+from .sprite_atlas import *
 from .sprite_sheet import *
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+"""
+    SpriteAtlas
+
+    Sliced sprite sheet frames and their scaled copies per grid size
+
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from json import dumps as json_dumps, loads as json_loads
+from logging import (
+    debug as logging_debug,
+    warning as logging_warning,
+)
+from os import getpid, makedirs, path, replace, stat
+
+from pygame import (
+    image,
+    Surface,
+    transform,
+)
+
+from .sprite_sheet import SpriteSheet
+
+
+class SpriteAtlas():
+    """SpriteAtlas
+
+    Every sprite sheet is sliced into it's frames once, the first time any
+    size of them is asked for. The frames are converted to the display
+    format as they're sliced (SpriteSheet.image_at) and the scaled copies
+    keep that format, so each grid size is scaled once and every later ask
+    for it is a dict lookup. Scaling always starts from the sliced frames,
+    never from an already scaled copy.
+
+    With a cache_dir the scaled frames are also written to disk as raw
+    pixels, keyed by the sheet file's mtime, layout and grid size, and read
+    back on the next launch instead of decoding and scaling the sheet.
+    """
+
+    def __init__(self, cache_dir: str = None):
+        """SpriteAtlas initilizer
+
+        Args:
+            cache_dir (str, optional): Directory of the on disk cache. Defaults to None (no disk cache).
+        """
+
+        self.cache_dir = cache_dir
+
+        # sheet name -> (file, (rows, columns), (margin x, y), (padding x, y))
+        self.sheets: dict[str, tuple] = {}
+
+        # sheet name -> frames at the sheet's size
+        self.frames: dict[str, list[Surface]] = {}
+
+        # (sheet name, grid size) -> frames scaled to grid size x grid size
+        self.scaled: dict[tuple[str, int], list[Surface]] = {}
+
+
+    def add_sheet(self, name: str, filename: str, num_rows_columns: tuple, margin_x_y: tuple = (0, 0), padding_x_y: tuple = (0, 0)) -> None:
+        """add_sheet
+
+        Args:
+            name (str): Name to ask for the frames by
+            filename (str): Sprite sheet image
+            num_rows_columns (tuple): Rows and columns of frames on the sheet
+            margin_x_y (tuple, optional): Space around the frames. Defaults to (0, 0).
+            padding_x_y (tuple, optional): Space between the frames. Defaults to (0, 0).
+        """
+
+        self.sheets[name] = (filename, num_rows_columns, margin_x_y, padding_x_y)
+
+
+    def sliced(self, name: str) -> list[Surface]:
+        """sliced
+
+        Returns:
+            [list]: The frames of the sheet at the sheet's size
+        """
+
+        frames = self.frames.get(name)
+        if frames is None:
+            filename, num_rows_columns, margin_x_y, padding_x_y = self.sheets[name]
+            frames = self.frames[name] = SpriteSheet(filename).load_grid_images(num_rows_columns, margin_x_y, padding_x_y)
+
+        return frames
+
+
+    def images(self, name: str, grid_size: int) -> list[Surface]:
+        """images
+
+        Returns:
+            [list]: The frames of the sheet scaled to grid_size x grid_size, shared, don't modify
+        """
+
+        key = (name, grid_size)
+        images = self.scaled.get(key)
+        if images is not None:
+            return images
+
+        images = self._read_cache(name, grid_size)
+        if images is None:
+            size = (grid_size, grid_size)
+            images = [transform.scale(frame, size) for frame in self.sliced(name)]
+            logging_debug(f"Scaled {len(images)} {name} sprites to {grid_size}px")
+            self._write_cache(name, grid_size, images)
+
+        self.scaled[key] = images
+
+        return images
+
+
+    def _cache_header(self, name: str, grid_size: int) -> dict:
+        """_cache_header
+
+        Returns:
+            [dict]: What a cache file of the sheet at grid_size has to have been made from
+        """
+
+        filename, num_rows_columns, margin_x_y, padding_x_y = self.sheets[name]
+
+        return {
+            "source": filename,
+            "mtime_ns": stat(filename).st_mtime_ns,
+            "layout": [list(num_rows_columns), list(margin_x_y), list(padding_x_y)],
+            "grid_size": grid_size,
+            "format": SpriteAtlas.PIXEL_FORMAT,
+        }
+
+
+    def _cache_path(self, name: str, grid_size: int) -> str:
+        return path.join(self.cache_dir, f"{name}-{grid_size}.bin")
+
+
+    def _read_cache(self, name: str, grid_size: int) -> list[Surface] | None:
+        """_read_cache
+
+        Returns:
+            [list]: The scaled frames from the disk cache, None if there are none for the current sheet file
+        """
+
+        if not self.cache_dir:
+            return None
+
+        try:
+            expected = self._cache_header(name, grid_size)
+            with open(self._cache_path(name, grid_size), "rb") as cache_file:
+                header = json_loads(cache_file.readline())
+                pixels = cache_file.read()
+
+        except (OSError, ValueError):
+            return None
+
+        count = header.pop("count", 0)
+        frame_bytes = grid_size * grid_size * len(SpriteAtlas.PIXEL_FORMAT)
+        if header != expected or len(pixels) != count * frame_bytes:
+            return None
+
+        size = (grid_size, grid_size)
+        images = [
+            image.frombuffer(pixels[index * frame_bytes:(index + 1) * frame_bytes], size, SpriteAtlas.PIXEL_FORMAT).convert()
+            for index in range(count)
+        ]
+        logging_debug(f"Loaded {count} {name} sprites at {grid_size}px from the sprite cache")
+
+        return images
+
+
+    def _write_cache(self, name: str, grid_size: int, images: list[Surface]) -> None:
+        """_write_cache
+
+        Write the scaled frames to the disk cache, a cache that can't be written is skipped
+        """
+
+        if not self.cache_dir:
+            return
+
+        cache_path = self._cache_path(name, grid_size)
+        try:
+            header = self._cache_header(name, grid_size)
+            header["count"] = len(images)
+
+            makedirs(self.cache_dir, exist_ok=True)
+
+            # Written aside and moved in place, other processes only ever see whole files
+            temp_path = f"{cache_path}.{getpid()}.tmp"
+            with open(temp_path, "wb") as cache_file:
+                cache_file.write(json_dumps(header).encode("utf8") + b"\n")
+                for frame in images:
+                    cache_file.write(image.tobytes(frame, SpriteAtlas.PIXEL_FORMAT))
+            replace(temp_path, cache_path)
+
+        except OSError as error:
+            logging_warning(f"Unable to write sprite cache {cache_path}: {error}")
+
+
+    # Pixel layout of the cache files, sprites are opaque
+    PIXEL_FORMAT = "RGB"
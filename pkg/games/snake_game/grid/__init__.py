@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+
+"""
+    Grid
+
+    Cell indexed structures of the game board
+
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from .distance_field import *
+from .free_cells import *
+from .sight_query import *
+from .spatial_hash import *
+from .walkability_grid import *
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+
+"""
+    Distance Field
+
+    Walking distance from every grid cell to the nearest of a set of targets
+
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+
+from heapq import heappop, heappush
+
+from pkg.games.snake_game.grid.walkability_grid import WalkabilityGrid
+
+
+class DistanceField():
+    """DistanceField
+
+    One breadth first search from all target cells at once over the
+    walkability grid gives every free cell its walking distance to the
+    nearest target and which target that is. Any number of entities can
+    then read their target and next step from it in O(1).
+
+    Like the PathFinder the per-cell arrays are flat (index x * height + y)
+    and stamped with a generation number so nothing is cleared between
+    searches. Every snake move changes the grid, so the field is brought up
+    to date about once per tick (SnakeGame.food_distances asks at most once
+    per tick). Instead of searching everything again it's repaired from the
+    cells the grid logged as changed and the targets added or removed: only
+    the cells whose distance went through a cell that got blocked (or a
+    target that's gone) are dropped, then everything around the dropped and
+    freed cells is searched again outwards from its intact neighbors. A full
+    search is only done when the grid's change log doesn't go back far
+    enough, like after a reset.
+    """
+
+    def __init__(self, grid: WalkabilityGrid):
+        """DistanceField initilizer
+
+        Args:
+            grid (WalkabilityGrid): The occupancy to measure distances over
+        """
+
+        self.grid = grid
+
+        # Current search number, stamps which array entries belong to the last search
+        self.generation = 0
+
+        # Grid version and targets the last search was done for
+        self.version = -1
+        self.sources: tuple[tuple[int, int], ...] = ()
+
+        self.width = 0
+        self.height = 0
+        self._allocate(grid.width, grid.height)
+
+
+    def _allocate(self, width: int, height: int) -> None:
+        """_allocate
+
+        (Re)build the per-cell arrays for a grid of width x height cells.
+        """
+
+        self.width = width
+        self.height = height
+        size = width * height
+
+        # Steps to the nearest target
+        self.distance = [0] * size
+
+        # Index of the nearest target cell
+        self.nearest_index = [-1] * size
+
+        # Generation the cell was reached in
+        self.seen = [0] * size
+
+        # Flat indexes of the on grid neighbors of every cell
+        self.neighbors = []
+        for index in range(size):
+            x, y = divmod(index, height)
+            self.neighbors.append(tuple(
+                neighbor_index
+                for neighbor_index, on_grid in (
+                    (index - height, x > 0),
+                    (index + height, x < width - 1),
+                    (index - 1, y > 0),
+                    (index + 1, y < height - 1),
+                )
+                if on_grid
+            ))
+
+        self.generation = 0
+        self.version = -1
+
+
+    def update(self, sources: list[tuple[int, int]]) -> bool:
+        """update
+
+        Args:
+            sources (list): (x, y) cells of the targets
+
+        Returns:
+            [bool]: If the field had to be searched again
+        """
+
+        grid = self.grid
+        sources = tuple(sources)
+        if grid.version == self.version and sources == self.sources:
+            return False
+
+        if self.width != grid.width or self.height != grid.height:
+            self._allocate(grid.width, grid.height)
+
+        # Cells changed since the last search, None when there's nothing to repair
+        changed = grid.changes_since(self.version) if self.generation else None
+
+        prev_sources = self.sources
+        self.version = grid.version
+        self.sources = sources
+
+        if changed is None:
+            self._search()
+        else:
+            self._repair(changed, prev_sources)
+
+        return True
+
+
+    def _search(self) -> None:
+        """_search
+
+        Breadth first search out of every source at once through the free cells
+        """
+
+        width = self.width
+        height = self.height
+        distance = self.distance
+        nearest_index = self.nearest_index
+        seen = self.seen
+        neighbors = self.neighbors
+
+        # Flat occupancy of the walkability grid, 0 is walkable
+        blocked = self.grid.cells
+
+        # New search, invalidates everything written by previous searches
+        self.generation += 1
+        generation = self.generation
+
+        # The targets themselves count even when something stands on them
+        frontier = []
+        for x, y in self.sources:
+            if not (0 <= x < width and 0 <= y < height):
+                continue
+
+            index = x * height + y
+            if seen[index] == generation:
+                continue
+
+            seen[index] = generation
+            distance[index] = 0
+            nearest_index[index] = index
+            frontier.append(index)
+
+        # One ring of cells per step away from the targets
+        next_distance = 0
+        while frontier:
+            next_distance += 1
+            next_frontier = []
+
+            for current_index in frontier:
+                target_index = nearest_index[current_index]
+
+                for neighbor_index in neighbors[current_index]:
+                    if seen[neighbor_index] == generation or blocked[neighbor_index]:
+                        continue
+
+                    seen[neighbor_index] = generation
+                    distance[neighbor_index] = next_distance
+                    nearest_index[neighbor_index] = target_index
+                    next_frontier.append(neighbor_index)
+
+            frontier = next_frontier
+
+
+    def _repair(self, changed: list[int], prev_sources: tuple[tuple[int, int], ...]) -> None:
+        """_repair
+
+        Bring the field of the last search up to date with the changed cells
+        and targets. Ends with the same distances a full search would give,
+        a cell the same distance from two targets may keep the other one as
+        it's nearest.
+
+        Every reached cell that isn't a target keeps a neighbor one step
+        closer to the same nearest target, dropping cells in order of
+        distance that lost theirs finds everything that has to be searched
+        again.
+        """
+
+        height = self.height
+        distance = self.distance
+        nearest_index = self.nearest_index
+        seen = self.seen
+        neighbors = self.neighbors
+        generation = self.generation
+        blocked = self.grid.cells
+
+        sources = self._source_indexes(self.sources)
+        removed_sources = self._source_indexes(prev_sources) - sources
+
+        # Cells that can't keep their distance, (distance, index) closest first
+        drop_heap = []
+        for index in {*changed, *removed_sources}:
+            if seen[index] == generation and index not in sources:
+                heappush(drop_heap, (distance[index], index))
+
+        dropped = []
+        while drop_heap:
+            current_distance, current_index = heappop(drop_heap)
+            if seen[current_index] != generation:
+                continue
+
+            # Free cells still one step behind a reached neighbor with the same target stay
+            target_index = nearest_index[current_index]
+            if not blocked[current_index] and target_index not in removed_sources:
+                if any(
+                    seen[neighbor_index] == generation
+                    and distance[neighbor_index] == current_distance - 1
+                    and nearest_index[neighbor_index] == target_index
+                    for neighbor_index in neighbors[current_index]
+                ):
+                    continue
+
+            seen[current_index] = 0
+            dropped.append(current_index)
+
+            # Cells one step further out may have been going through it
+            for neighbor_index in neighbors[current_index]:
+                if (
+                    seen[neighbor_index] == generation
+                    and distance[neighbor_index] == current_distance + 1
+                    and nearest_index[neighbor_index] == target_index
+                ):
+                    heappush(drop_heap, (current_distance + 1, neighbor_index))
+
+        # Search again from the new targets and the intact neighbors of the dropped and freed cells
+        search_heap = []
+        for index in sources:
+            if seen[index] != generation or distance[index]:
+                seen[index] = generation
+                distance[index] = 0
+                nearest_index[index] = index
+                heappush(search_heap, (0, index))
+
+        for index in (*dropped, *changed):
+            if seen[index] == generation or blocked[index]:
+                continue
+
+            for neighbor_index in neighbors[index]:
+                if seen[neighbor_index] != generation:
+                    continue
+
+                if seen[index] != generation or distance[neighbor_index] + 1 < distance[index]:
+                    seen[index] = generation
+                    distance[index] = distance[neighbor_index] + 1
+                    nearest_index[index] = nearest_index[neighbor_index]
+
+            if seen[index] == generation:
+                heappush(search_heap, (distance[index], index))
+
+        while search_heap:
+            current_distance, current_index = heappop(search_heap)
+            if distance[current_index] != current_distance:
+                continue
+
+            next_distance = current_distance + 1
+            target_index = nearest_index[current_index]
+
+            for neighbor_index in neighbors[current_index]:
+                if blocked[neighbor_index]:
+                    continue
+
+                if seen[neighbor_index] != generation or next_distance < distance[neighbor_index]:
+                    seen[neighbor_index] = generation
+                    distance[neighbor_index] = next_distance
+                    nearest_index[neighbor_index] = target_index
+                    heappush(search_heap, (next_distance, neighbor_index))
+
+
+    def _source_indexes(self, sources: tuple[tuple[int, int], ...]) -> set[int]:
+        """_source_indexes
+
+        Returns:
+            [set]: Flat indexes of the on grid source cells
+        """
+
+        return {
+            x * self.height + y
+            for x, y in sources
+            if 0 <= x < self.width and 0 <= y < self.height
+        }
+
+
+    def next_step(self, x: int, y: int) -> tuple[tuple[int, int], tuple[int, int], int] | None:
+        """next_step
+
+        The (x, y) cell itself may be blocked, like the cell of the snake head asking.
+
+        Returns:
+            [tuple]: (next cell, nearest target cell, steps to the target) going from (x, y)
+                one step closer to the nearest target, None if no target can be reached
+        """
+
+        if not self.sources:
+            return None
+
+        height = self.height
+        distance = self.distance
+        seen = self.seen
+        generation = self.generation
+
+        best_index = -1
+        best_distance = None
+        for neighbor_x, neighbor_y in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)):
+            if not (0 <= neighbor_x < self.width and 0 <= neighbor_y < height):
+                continue
+
+            neighbor_index = neighbor_x * height + neighbor_y
+            if seen[neighbor_index] != generation:
+                continue
+
+            if best_distance is None or distance[neighbor_index] < best_distance:
+                best_index = neighbor_index
+                best_distance = distance[neighbor_index]
+
+        if best_distance is None:
+            return None
+
+        return (
+            divmod(best_index, height),
+            divmod(self.nearest_index[best_index], height),
+            best_distance + 1,
+        )
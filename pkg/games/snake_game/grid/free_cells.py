@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+"""
+    Free Cells
+
+    Constant time lookup of random unoccupied grid cells
+
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+
+from random import Random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pkg.games.snake_game.grid.spatial_hash import SpatialHash
+
+
+class FreeCells():
+    """FreeCells
+
+    The free cells of a rectangular region of the grid. Cells are kept in a
+    list plus a cell -> list slot index so adding, removing (swap with the
+    last cell) and picking a random cell are all O(1).
+    """
+
+    def __init__(self, x_start: int, y_start: int, x_end: int, y_end: int):
+        """FreeCells initilizer
+
+        Args:
+            x_start (int): First cell x of the region
+            y_start (int): First cell y of the region
+            x_end (int): Cell x past the end of the region
+            y_end (int): Cell y past the end of the region
+        """
+
+        self.x_start = x_start
+        self.y_start = y_start
+        self.x_end = x_end
+        self.y_end = y_end
+
+        # The free cells, in no particular order
+        self.cells: list[tuple[int, int]] = []
+
+        # cell -> slot of the cell in cells
+        self.slots: dict[tuple[int, int], int] = {}
+
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+
+    def contains(self, cell: tuple[int, int]) -> bool:
+        """contains
+
+        Returns:
+            [bool]: If the cell is inside the region
+        """
+
+        return self.x_start <= cell[0] < self.x_end and self.y_start <= cell[1] < self.y_end
+
+
+    def add(self, cell: tuple[int, int]) -> None:
+        """add
+
+        Args:
+            cell (tuple): The (x, y) cell that became free
+        """
+
+        if cell in self.slots or not self.contains(cell):
+            return
+
+        self.slots[cell] = len(self.cells)
+        self.cells.append(cell)
+
+
+    def remove(self, cell: tuple[int, int]) -> None:
+        """remove
+
+        Args:
+            cell (tuple): The (x, y) cell that became occupied
+        """
+
+        slot = self.slots.pop(cell, None)
+        if slot is None:
+            return
+
+        # Fill the hole with the last cell
+        last = self.cells.pop()
+        if slot < len(self.cells):
+            self.cells[slot] = last
+            self.slots[last] = slot
+
+
+    def choice(self, random: Random) -> tuple[int, int] | None:
+        """choice
+
+        Args:
+            random (Random): Randomness to pick with
+
+        Returns:
+            [tuple]: A random free (x, y) cell, None if the region is full
+        """
+
+        if not self.cells:
+            return None
+
+        return self.cells[random.randrange(len(self.cells))]
+
+
+class FreeCellAllocator():
+    """FreeCellAllocator
+
+    Keeps a FreeCells per spawn region up to date with the occupancy of a
+    SpatialHash. A region is built from the hash the first time it's asked
+    for and from then on only changes when a cell gains its first occupant
+    or loses its last one.
+    """
+
+    def __init__(self, spatial_hash: "SpatialHash"):
+        """FreeCellAllocator initilizer
+
+        Args:
+            spatial_hash (SpatialHash): The occupancy to follow
+        """
+
+        self.spatial_hash = spatial_hash
+
+        # (x_start, y_start, x_end, y_end) -> free cells of that region
+        self.regions: dict[tuple[int, int, int, int], FreeCells] = {}
+
+
+    def region(self, x_start: int, y_start: int, x_end: int, y_end: int) -> FreeCells:
+        """region
+
+        Returns:
+            [FreeCells]: The free cells of the [x_start, x_end) x [y_start, y_end) region
+        """
+
+        key = (x_start, y_start, x_end, y_end)
+        free_cells = self.regions.get(key)
+        if free_cells is None:
+            free_cells = FreeCells(*key)
+            occupied = self.spatial_hash.cells
+            for x in range(x_start, x_end):
+                for y in range(y_start, y_end):
+                    if (x, y) not in occupied:
+                        free_cells.add((x, y))
+
+            self.regions[key] = free_cells
+
+        return free_cells
+
+
+    def allocate(self, random: Random, x_start: int, y_start: int, x_end: int, y_end: int) -> tuple[int, int] | None:
+        """allocate
+
+        Args:
+            random (Random): Randomness to pick with
+
+        Returns:
+            [tuple]: A random free (x, y) cell of the region, None if the region is full
+        """
+
+        return self.region(x_start, y_start, x_end, y_end).choice(random)
+
+
+    def occupy(self, cell: tuple[int, int]) -> None:
+        """occupy
+
+        Args:
+            cell (tuple): The (x, y) cell that got it's first occupant
+        """
+
+        for free_cells in self.regions.values():
+            free_cells.remove(cell)
+
+
+    def release(self, cell: tuple[int, int]) -> None:
+        """release
+
+        Args:
+            cell (tuple): The (x, y) cell that lost it's last occupant
+        """
+
+        for free_cells in self.regions.values():
+            free_cells.add(cell)
+
+
+    def clear(self) -> None:
+        """clear
+
+        Forget every region, they get rebuilt when asked for again.
+        """
+
+        self.regions.clear()
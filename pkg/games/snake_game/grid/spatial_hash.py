@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+"""
+    Spatial Hash
+
+    Uniform cell index of which entities occupy which grid cell
+
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+
+from typing import TYPE_CHECKING
+
+from pkg.games.snake_game.grid.free_cells import FreeCellAllocator
+from pkg.games.snake_game.constants import (
+    X,
+    Y,
+)
+
+if TYPE_CHECKING:
+    from pkg.games.snake_game.entities.entity import Entity
+
+
+class SpatialHash():
+    """SpatialHash
+
+    Maps grid cells (the same grid_size cells obj_pos_to_node uses) to the
+    entities occupying them so collisions are a lookup of a single cell.
+
+    Entities that take up a single cell use move/remove, entities covering
+    many cells (a snake body) use add/discard for each cell they cover.
+    """
+
+    def __init__(self, cell_size: int):
+        """SpatialHash initilizer
+
+        Args:
+            cell_size (int): Size of a cell in pixels, the game grid_size
+        """
+
+        self.cell_size = cell_size
+
+        # cell -> entities in that cell and how many times they're in it
+        # (dict to keep a deterministic insertion order)
+        self.cells: dict[tuple[int, int], dict["Entity", int]] = {}
+
+        # entity -> cell it's currently registered in
+        self.entity_cells: dict["Entity", tuple[int, int]] = {}
+
+        # Random free cells for spawning, kept in step with cells
+        self.free_cells = FreeCellAllocator(self)
+
+
+    def cell_of(self, position: tuple) -> tuple[int, int]:
+        """cell_of
+
+        Args:
+            position (tuple): (x, y) pixel position
+
+        Returns:
+            [tuple]: The (x, y) grid cell of the position
+        """
+
+        return position[X] // self.cell_size, position[Y] // self.cell_size
+
+
+    def move(self, entity: "Entity", position: tuple = None) -> None:
+        """move
+
+        Register the entity in the cell of position (defaults to entity.position),
+        removing it from the cell it was registered in before.
+
+        Args:
+            entity (Entity): The entity that moved
+            position (tuple, optional): The new (x, y) pixel position. Defaults to None.
+        """
+
+        cell = self.cell_of(entity.position if position is None else position)
+
+        prev_cell = self.entity_cells.get(entity)
+        if prev_cell == cell:
+            return
+
+        if prev_cell is not None:
+            self._discard(entity, prev_cell)
+
+        self._occupants(cell)[entity] = 1
+        self.entity_cells[entity] = cell
+
+
+    def add(self, entity: "Entity", position: tuple) -> None:
+        """add
+
+        Register a multi cell entity in one more cell.
+
+        Args:
+            entity (Entity): The entity covering the cell
+            position (tuple): (x, y) pixel position in the cell
+        """
+
+        occupants = self._occupants(self.cell_of(position))
+        occupants[entity] = occupants.get(entity, 0) + 1
+
+
+    def discard(self, entity: "Entity", position: tuple) -> None:
+        """discard
+
+        Unregister a multi cell entity from a cell it was added to.
+
+        Args:
+            entity (Entity): The entity leaving the cell
+            position (tuple): (x, y) pixel position in the cell
+        """
+
+        cell = self.cell_of(position)
+        occupants = self.cells.get(cell)
+        if occupants is None or entity not in occupants:
+            return
+
+        occupants[entity] -= 1
+        if occupants[entity] <= 0:
+            self._discard(entity, cell)
+
+
+    def remove(self, entity: "Entity") -> None:
+        """remove
+
+        Args:
+            entity (Entity): The entity to no longer track
+        """
+
+        prev_cell = self.entity_cells.pop(entity, None)
+        if prev_cell is not None:
+            self._discard(entity, prev_cell)
+
+
+    def is_tracked(self, entity: "Entity") -> bool:
+        """is_tracked
+
+        Args:
+            entity (Entity): The entity to look for
+
+        Returns:
+            [bool]: If the entity is registered in a cell
+        """
+
+        return entity in self.entity_cells
+
+
+    def occupants(self, position: tuple) -> tuple:
+        """occupants
+
+        Args:
+            position (tuple): (x, y) pixel position
+
+        Returns:
+            [tuple]: Snapshot of the entities in the cell of position
+        """
+
+        cell = self.cells.get(self.cell_of(position))
+
+        return tuple(cell) if cell else ()
+
+
+    def is_occupied(self, position: tuple, ignore: "Entity" = None) -> bool:
+        """is_occupied
+
+        Args:
+            position (tuple): (x, y) pixel position
+            ignore (Entity, optional): Entity that doesn't count as an occupant. Defaults to None.
+
+        Returns:
+            [bool]: If anything other than ignore is in the cell of position
+        """
+
+        cell = self.cells.get(self.cell_of(position))
+        if not cell:
+            return False
+
+        return len(cell) > 1 or ignore not in cell
+
+
+    def clear(self) -> None:
+        """clear
+
+        Forget every tracked entity.
+        """
+
+        self.cells.clear()
+        self.entity_cells.clear()
+        self.free_cells.clear()
+
+
+    def _occupants(self, cell: tuple[int, int]) -> dict["Entity", int]:
+        """_occupants
+
+        Returns:
+            [dict]: The occupants of a cell, created (and the cell taken) if it had none
+        """
+
+        occupants = self.cells.get(cell)
+        if occupants is None:
+            occupants = self.cells[cell] = {}
+            self.free_cells.occupy(cell)
+
+        return occupants
+
+
+    def _discard(self, entity: "Entity", cell: tuple[int, int]) -> None:
+        """_discard
+
+        Remove the entity from a cell, dropping the cell once it's empty.
+        """
+
+        occupants = self.cells.get(cell)
+        if occupants is None:
+            return
+
+        occupants.pop(entity, None)
+        if not occupants:
+            del self.cells[cell]
+            self.free_cells.release(cell)
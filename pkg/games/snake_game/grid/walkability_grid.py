@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+
+"""
+    Walkability Grid
+
+    Array backed pathfinding grid of the game board
+
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+
+import numpy as np
+
+from pkg.games.snake_game.constants import (
+    X,
+    Y,
+)
+
+
+class WalkabilityGrid():
+    """WalkabilityGrid
+
+    Occupancy of every grid cell kept in a uint8 array indexed [x, y].
+    Indexing the grid (grid[x][y]) gives a GridNode view so callers written
+    against the old list of lists of Node objects keep working.
+    """
+
+    def __init__(self, width: int, height: int, cell_size: int):
+        """WalkabilityGrid initilizer
+
+        Args:
+            width (int): Number of cells along x
+            height (int): Number of cells along y
+            cell_size (int): Size of a cell in pixels, the game grid_size
+        """
+
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+
+        # FREE or BLOCKED per cell
+        self.occupancy = np.zeros((width, height), dtype=np.uint8)
+
+        # Flat view of occupancy (index x * height + y) for fast scalar reads
+        self.cells = memoryview(self.occupancy.reshape(-1))
+
+        # Bumped on every change of occupancy
+        self.version = 0
+
+        # Flat indexes (x * height + y) of the cells changed, oldest first, for incremental searches
+        self.changes: list[int] = []
+
+        # Version before the oldest change kept in changes
+        self.changes_start = 0
+
+
+    def __getitem__(self, x: int) -> "GridColumn":
+        return GridColumn(self, x)
+
+
+    def __iter__(self):
+        for x in range(self.width):
+            yield GridColumn(self, x)
+
+
+    def __len__(self) -> int:
+        return self.width
+
+
+    def reset(self) -> None:
+        """reset
+
+        Mark every cell as free.
+        """
+
+        self.occupancy.fill(WalkabilityGrid.FREE)
+        self.version += 1
+
+        # Every cell may have changed
+        self.changes.clear()
+        self.changes_start = self.version
+
+
+    def cell_of(self, position: tuple) -> tuple[int, int]:
+        """cell_of
+
+        Args:
+            position (tuple): (x, y) pixel position
+
+        Returns:
+            [tuple]: The (x, y) grid cell of the position
+        """
+
+        return position[X] // self.cell_size, position[Y] // self.cell_size
+
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """in_bounds
+
+        Returns:
+            [bool]: If the (x, y) cell is on the grid
+        """
+
+        return 0 <= x < self.width and 0 <= y < self.height
+
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """is_walkable
+
+        Returns:
+            [bool]: If the (x, y) cell is free
+        """
+
+        return self.cells[x * self.height + y] == WalkabilityGrid.FREE
+
+
+    def set_walkable(self, position: tuple, walkable: bool) -> None:
+        """set_walkable
+
+        Mark the cell of a pixel position. Positions off the grid (like the
+        (-1, -1) of an entity that hasn't been placed yet) are ignored.
+
+        Args:
+            position (tuple): (x, y) pixel position
+            walkable (bool): If the cell is free
+        """
+
+        x, y = self.cell_of(position)
+        if not self.in_bounds(x, y):
+            return
+
+        self.set_cell(x, y, walkable)
+
+
+    def set_cell(self, x: int, y: int, walkable: bool) -> None:
+        """set_cell
+
+        Args:
+            x (int): Cell x
+            y (int): Cell y
+            walkable (bool): If the cell is free
+        """
+
+        self.occupancy[x, y] = WalkabilityGrid.FREE if walkable else WalkabilityGrid.BLOCKED
+
+        self.version += 1
+
+        # Log the change, the oldest half is forgotten once the log is full
+        self.changes.append(x * self.height + y)
+        if len(self.changes) > WalkabilityGrid.CHANGE_LOG_SIZE:
+            forgotten = len(self.changes) // 2
+            del self.changes[:forgotten]
+            self.changes_start += forgotten
+
+
+    def changes_since(self, version: int) -> list[int] | None:
+        """changes_since
+
+        Args:
+            version (int): A version seen before
+
+        Returns:
+            [list]: Flat indexes of the cells changed after version (may repeat),
+                None if the change log doesn't go back that far
+        """
+
+        if version < self.changes_start:
+            return None
+
+        return self.changes[version - self.changes_start:]
+
+
+    def walkable_mask(self) -> np.ndarray:
+        """walkable_mask
+
+        Returns:
+            [np.ndarray]: Bool array [x, y] of the free cells
+        """
+
+        return self.occupancy == WalkabilityGrid.FREE
+
+
+    # values a cell's occupancy can have.
+    #
+    # FREE: Nothing is in the cell, pathfinding can walk it
+    # BLOCKED: Something is in the cell
+    (FREE, BLOCKED) = range(2)
+
+    # Number of changes kept for changes_since
+    CHANGE_LOG_SIZE = 4096
+
+
+class GridColumn():
+    """GridColumn
+
+    Column x of a WalkabilityGrid, indexing it gives the GridNode at (x, y)
+    """
+
+    __slots__ = ("grid", "x")
+
+    def __init__(self, grid: WalkabilityGrid, x: int):
+        self.grid = grid
+        self.x = x
+
+
+    def __getitem__(self, y: int) -> "GridNode":
+        return GridNode(self.grid, self.x, y)
+
+
+    def __iter__(self):
+        for y in range(self.grid.height):
+            yield GridNode(self.grid, self.x, y)
+
+
+    def __len__(self) -> int:
+        return self.grid.height
+
+
+class GridNode():
+    """GridNode
+
+    Node compatible view of a single cell of a WalkabilityGrid
+    """
+
+    __slots__ = ("grid", "x", "y")
+
+    def __init__(self, grid: WalkabilityGrid, x: int, y: int):
+        self.grid = grid
+        self.x = x
+        self.y = y
+
+
+    @property
+    def walkable(self) -> bool:
+        return bool(self.grid.occupancy[self.x, self.y] == WalkabilityGrid.FREE)
+
+
+    @walkable.setter
+    def walkable(self, walkable: bool) -> None:
+        self.grid.set_cell(self.x, self.y, walkable)
+
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, GridNode)
+            and other.grid is self.grid
+            and other.x == self.x
+            and other.y == self.y
+        )
+
+
+    def __hash__(self) -> int:
+        return hash((id(self.grid), self.x, self.y))
@@ -42,15 +42,19 @@ def game_over_menu(self: "menus"):
     if self.app.is_audio:
         mixer.music.stop()
 
+    return self.retained(MENU_GAME_OVER, _draw_game_over_menu, self.app.game.player_score())
+
+
+def _draw_game_over_menu(self: "menus", score: int) -> list:
+    """_draw_game_over_menu
+
+    Returns:
+        [list]: The menu obj of the drawn menu
+    """
+
     # Render the Game Over text
     self.render_text("Game Over", 10, color=COLOR_RED)
 
-    # Get the player score
-    score = 0
-    for _, value in self.app.game.entity_final_scores.items():
-        if value["is_player"]:
-            score = value["score"]
-
     # Render the score
     self.render_text('Score: ' + str(score), 8, color=COLOR_RED)
 
@@ -70,17 +74,11 @@ def game_over_menu(self: "menus"):
         _get_score(self)
         self.menu_options[MENU_HOME]()
 
-    self.menu = [
+    return [
         (restart_obj, restart, 3, None),
         (quit_obj, return_to_home, 3, None),
     ]
 
-    self.refresh = False
-
-    return self.menu
-
-
-
 
 def _get_score(self):
 
@@ -47,28 +47,36 @@ def home_menu(self: Menu):
             # just to prevent a check settings inf. loop
             self.prev_menu = MENU_SETTINGS
 
-        # Render the Home Menu text
-        self.render_text(GAME_TITLE, 8, color=COLOR_RED)
+        self.retained(MENU_HOME, _draw_home_menu)
 
-        # Render the play button
-        play_obj = self.render_button("Play", 2, has_outline=True)
+    return self.menu
 
-        # Render the leaderboard button
-        leaderboard_obj = self.render_button("Leaderboard", 0, has_outline=True)
 
-        # Render the settings button
-        settings_obj = self.render_button("Settings", -2, has_outline=True)
+def _draw_home_menu(self: Menu) -> list:
+    """_draw_home_menu
 
-        # Render the quit button
-        quit_obj = self.render_button("Quit", -4, has_outline=True)
+    Returns:
+        [list]: The menu obj of the drawn menu
+    """
 
-        self.menu = [
-            (play_obj, self.app.game.start, MENU_HOME, None),
-            (leaderboard_obj, self.menu_options[MENU_LEADERBOARD], MENU_HOME, None),
-            (settings_obj, self.menu_options[MENU_SETTINGS], MENU_HOME, None),
-            (quit_obj, self.app.game.quit_game, MENU_HOME, None),
-        ]
+    # Render the Home Menu text
+    self.render_text(GAME_TITLE, 8, color=COLOR_RED)
 
-        self.refresh = False
+    # Render the play button
+    play_obj = self.render_button("Play", 2, has_outline=True)
 
-    return self.menu
+    # Render the leaderboard button
+    leaderboard_obj = self.render_button("Leaderboard", 0, has_outline=True)
+
+    # Render the settings button
+    settings_obj = self.render_button("Settings", -2, has_outline=True)
+
+    # Render the quit button
+    quit_obj = self.render_button("Quit", -4, has_outline=True)
+
+    return [
+        (play_obj, self.app.game.start, MENU_HOME, None),
+        (leaderboard_obj, self.menu_options[MENU_LEADERBOARD], MENU_HOME, None),
+        (settings_obj, self.menu_options[MENU_SETTINGS], MENU_HOME, None),
+        (quit_obj, self.app.game.quit_game, MENU_HOME, None),
+    ]
@@ -34,37 +34,48 @@ def keybinding_menu(self: Menu):
         # Make sure the right menu option is selected
         self.menu_option = MENU_KEYBINDING
 
-        # Render the Display text
-        self.render_button("Keybindings", 10, color=COLOR_RED)
+        # The keybindings shown
+        keybinding_state = tuple(self.app.game.game_config["settings"]["keybindings"].items())
 
-        # initilize menu
-        menu_builder = []
+        self.retained(MENU_KEYBINDING, _draw_keybinding_menu, keybinding_state)
 
-        # Render the Save button
-        save_obj = self.render_button("Save", -8, h_offset=125, has_outline=True)
-        menu_builder.append((save_obj, self.save_settings, MENU_KEYBINDING, None))
+    return self.menu
 
-        # Render the Return button
-        back_obj = self.render_button("Back", -8, h_offset=-125, has_outline=True)
 
-        def back_action():
-            self.reload_settings()
-            self.menu_options[MENU_SETTINGS]()
+def _draw_keybinding_menu(self: Menu, keybinding_state: tuple) -> list:
+    """_draw_keybinding_menu
 
-        menu_builder.append((back_obj, back_action, MENU_KEYBINDING, None))
+    Returns:
+        [list]: The menu obj of the drawn menu
+    """
+
+    # Render the Display text
+    self.render_button("Keybindings", 10, color=COLOR_RED)
+
+    # initilize menu
+    menu_builder = []
+
+    # Render the Save button
+    save_obj = self.render_button("Save", -8, h_offset=125, has_outline=True)
+    menu_builder.append((save_obj, self.save_settings, MENU_KEYBINDING, None))
+
+    # Render the Return button
+    back_obj = self.render_button("Back", -8, h_offset=-125, has_outline=True)
 
-        # Render all the keybinding buttons
-        keybindings = self.app.game.game_config["settings"]["keybindings"]
+    def back_action():
+        self.reload_settings()
+        self.menu_options[MENU_SETTINGS]()
 
-        index = 4
-        for action, key in keybindings.items():
-            self.render_text(f"{action.replace('_', ' ')}:", index, h_offset=-110, w_offset=35)
-            button = self.render_button(key, index, color=COLOR_PURPLE, h_offset=145, w_offset=35)
-            menu_builder.append((button, self.select_keybinding, MENU_KEYBINDING, action))
-            index -= 1.5
+    menu_builder.append((back_obj, back_action, MENU_KEYBINDING, None))
 
-        self.menu = menu_builder
+    # Render all the keybinding buttons
+    keybindings = dict(keybinding_state)
 
-        self.refresh = False
+    index = 4
+    for action, key in keybindings.items():
+        self.render_text(f"{action.replace('_', ' ')}:", index, h_offset=-110, w_offset=35)
+        button = self.render_button(key, index, color=COLOR_PURPLE, h_offset=145, w_offset=35)
+        menu_builder.append((button, self.select_keybinding, MENU_KEYBINDING, action))
+        index -= 1.5
 
-    return self.menu
\ No newline at end of file
+    return menu_builder
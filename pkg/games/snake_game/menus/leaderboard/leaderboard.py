@@ -32,31 +32,41 @@ def leaderboard_menu(self: Menu):
         # Make sure the right menu option is selected
         self.menu_option = MENU_LEADERBOARD
 
-        # Render the Leaderboard text
-        self.render_text("Leaderboard", 10, color=COLOR_RED)
+        # The scores shown
+        leaderboard_state = (self.app.game.leaderboard["highscore"], tuple(sorted(self.app.game.leaderboard["top_ten"], reverse=True)))
 
-        # Render the Return button
-        back_obj = self.render_button("Back", -9, has_outline=True)
+        self.retained(MENU_LEADERBOARD, _draw_leaderboard_menu, leaderboard_state)
+
+    return self.menu
 
-        # Render the highscore
-        highscore = self.app.game.leaderboard["highscore"]
-        _ = self.render_text(f"HIGH-SCORE: {highscore}", 8)
 
-        # Render the top 10 scores
-        self.app.game.leaderboard["top_ten"].sort(reverse=True)
+def _draw_leaderboard_menu(self: Menu, leaderboard_state: tuple) -> list:
+    """_draw_leaderboard_menu
 
-        index = 7
-        ranking = 1
-        for score in self.app.game.leaderboard["top_ten"]:
-            self.render_text(f"{ranking}:", index, w_offset=20, h_offset=-50)
-            self.render_text(score, index, w_offset=20, h_offset=50)
-            index -= 1.5
-            ranking += 1
+    Returns:
+        [list]: The menu obj of the drawn menu
+    """
 
-        self.menu = [
-            (back_obj, self.menu_options[MENU_HOME], MENU_LEADERBOARD, None)
-        ]
+    # Render the Leaderboard text
+    self.render_text("Leaderboard", 10, color=COLOR_RED)
 
-        self.refresh = False
+    # Render the Return button
+    back_obj = self.render_button("Back", -9, has_outline=True)
 
-    return self.menu
+    highscore, top_ten = leaderboard_state
+
+    # Render the highscore
+    _ = self.render_text(f"HIGH-SCORE: {highscore}", 8)
+
+    # Render the top 10 scores, highest first
+    index = 7
+    ranking = 1
+    for score in top_ten:
+        self.render_text(f"{ranking}:", index, w_offset=20, h_offset=-50)
+        self.render_text(score, index, w_offset=20, h_offset=50)
+        index -= 1.5
+        ranking += 1
+
+    return [
+        (back_obj, self.menu_options[MENU_HOME], MENU_LEADERBOARD, None)
+    ]
@@ -47,15 +47,19 @@ def pause_menu(self: Menu):
     # Pause game music
     self.app.pause_game_music = True
 
+    return self.retained(MENU_PAUSE, _draw_pause_menu, self.app.game.player_score())
+
+
+def _draw_pause_menu(self: Menu, score: int) -> list:
+    """_draw_pause_menu
+
+    Returns:
+        [list]: The menu obj of the drawn menu
+    """
+
     # Render the paused text
     self.render_text("-Paused-", 10, color=COLOR_RED)
 
-    # Get the player score
-    score = 0
-    for obj in self.app.game.sprite_group.sprites():
-        if obj.is_player:
-            score = obj.score
-
     # Render the score
     self.render_text("Score: " + str(score), 8, color=COLOR_RED)
 
@@ -68,14 +72,8 @@ def pause_menu(self: Menu):
     # Render the main menu button
     return_obj = self.render_button("Main Menu", -3, has_outline=True)
 
-    self.menu = [
+    return [
         (resume_obj, self.app.game.unpause, MENU_PAUSE, None),
         (settings_obj, self.menu_options[MENU_SETTINGS], MENU_PAUSE, None),
         (return_obj, self.menu_options[MENU_HOME], MENU_PAUSE, None),
     ]
-
-    self.refresh = False
-
-    return self.menu
-
-
@@ -40,32 +40,40 @@ def settings_menu(self: Menu):
         if self.prev_menu in [MENU_HOME, MENU_PAUSE]:
             self.root_menu = self.prev_menu
 
-        # Render the Settings Menu text
-        self.render_text("Settings", 10, color=COLOR_RED)
+        self.retained(MENU_SETTINGS, _draw_settings_menu, self.root_menu)
 
-        # Render the display button
-        display_obj = self.render_button("Display", 5, has_outline=True)
+    return self.menu
 
-        # Render the Sound button
-        sound_obj = self.render_button("Sound", 3, has_outline=True)
 
-        # Render the Sound button
-        gameplay_obj = self.render_button("Gameplay", 1, has_outline=True)
+def _draw_settings_menu(self: Menu, root_menu: int) -> list:
+    """_draw_settings_menu
 
-        # Render the Sound button
-        keybinding_obj = self.render_button("Keybinding", -1, has_outline=True)
+    Returns:
+        [list]: The menu obj of the drawn menu
+    """
 
-        # Render the Return button
-        back_obj = self.render_button("Back", -8, has_outline=True)
+    # Render the Settings Menu text
+    self.render_text("Settings", 10, color=COLOR_RED)
 
-        self.menu = [
-            (display_obj, self.menu_options[MENU_DISPLAY], MENU_SETTINGS, None),
-            (sound_obj, self.menu_options[MENU_SOUND], MENU_SETTINGS, None),
-            (gameplay_obj, self.menu_options[MENU_GAMEPLAY], MENU_SETTINGS, None),
-            (keybinding_obj, self.menu_options[MENU_KEYBINDING], MENU_SETTINGS, None),
-            (back_obj, self.menu_options[self.root_menu], MENU_SETTINGS, None),
-        ]
+    # Render the display button
+    display_obj = self.render_button("Display", 5, has_outline=True)
 
-        self.refresh = False
+    # Render the Sound button
+    sound_obj = self.render_button("Sound", 3, has_outline=True)
 
-    return self.menu
+    # Render the Sound button
+    gameplay_obj = self.render_button("Gameplay", 1, has_outline=True)
+
+    # Render the Sound button
+    keybinding_obj = self.render_button("Keybinding", -1, has_outline=True)
+
+    # Render the Return button
+    back_obj = self.render_button("Back", -8, has_outline=True)
+
+    return [
+        (display_obj, self.menu_options[MENU_DISPLAY], MENU_SETTINGS, None),
+        (sound_obj, self.menu_options[MENU_SOUND], MENU_SETTINGS, None),
+        (gameplay_obj, self.menu_options[MENU_GAMEPLAY], MENU_SETTINGS, None),
+        (keybinding_obj, self.menu_options[MENU_KEYBINDING], MENU_SETTINGS, None),
+        (back_obj, self.menu_options[root_menu], MENU_SETTINGS, None),
+    ]
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+"""
+    Player Input
+
+    Key presses to queued turns for the player snakes
+
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+from pkg.games.snake_game.constants import (
+    INPUT_KEY_MAP,
+    UP,
+    RIGHT,
+    DOWN,
+    LEFT,
+)
+
+if TYPE_CHECKING:
+    from pkg.games.snake_game.game import SnakeGame
+
+
+class PlayerInput():
+    """PlayerInput
+
+    Takes the KEYDOWN events of gameplay and queues the direction each one
+    asks for on every player snake, so turns pressed quicker than the snake
+    moves are played one per move instead of only the key held at the move.
+
+    The keybindings are resolved to pygame key codes once, and again only
+    when the keybindings config changed.
+    """
+
+    def __init__(self, game: "SnakeGame", max_queued: int = 3):
+        """PlayerInput initilizer
+
+        Args:
+            game (SnakeGame): The game, for it's keybindings config
+            max_queued (int, optional): Turns kept per player, presses past it are dropped. Defaults to 3.
+        """
+
+        self.game = game
+        self.max_queued = max_queued
+
+        # pygame key code -> direction
+        self.key_directions: dict[int, int] = {}
+
+        # Keybindings the key codes were resolved from
+        self.keybindings: tuple = ()
+
+        # player entity id -> directions waiting for the next moves, oldest first
+        self.queues: dict[str, deque[int]] = {}
+
+
+    def key_directions_for(self, keybindings: dict) -> dict[int, int]:
+        """key_directions_for
+
+        Returns:
+            [dict]: pygame key code -> direction of keybindings, rebuilt only if they changed
+        """
+
+        bindings = tuple(keybindings.items())
+        if bindings != self.keybindings:
+            self.keybindings = bindings
+            self.key_directions = {
+                INPUT_KEY_MAP[key]: PlayerInput.ACTION_DIRECTIONS[action]
+                for action, key in bindings
+                if action in PlayerInput.ACTION_DIRECTIONS and key in INPUT_KEY_MAP
+            }
+
+        return self.key_directions
+
+
+    def add_player(self, player_id: str) -> None:
+        """add_player
+
+        Args:
+            player_id (str): Entity id of a snake played with the keyboard
+        """
+
+        self.queues[player_id] = deque()
+
+
+    def key_down(self, key: int) -> bool:
+        """key_down
+
+        Args:
+            key (int): pygame key code pressed
+
+        Returns:
+            [bool]: If the key is a movement key
+        """
+
+        direction = self.key_directions_for(self.game.game_config["settings"]["keybindings"]).get(key)
+        if direction is None:
+            return False
+
+        for queue in self.queues.values():
+            # Pressing the same way twice is one turn
+            if len(queue) < self.max_queued and (not queue or queue[-1] != direction):
+                queue.append(direction)
+
+        return True
+
+
+    def next_direction(self, player_id: str, direction: int, prev_direction: int) -> int | None:
+        """next_direction
+
+        Take the oldest queued turn the snake can make, skipping ones it
+        can't (going the way it already goes or back into itself).
+
+        Args:
+            player_id (str): Entity id of the player snake
+            direction (int): Direction the snake will move next
+            prev_direction (int): Direction the snake last moved
+
+        Returns:
+            [int]: The new direction, None if there is no turn to make
+        """
+
+        queue = self.queues.get(player_id)
+        while queue:
+            queued = queue.popleft()
+            if queued != direction and queued != (prev_direction + 2) % 4:
+                return queued
+
+        return None
+
+
+    def clear(self) -> None:
+        """clear
+
+        Drop every queued turn
+        """
+
+        for queue in self.queues.values():
+            queue.clear()
+
+
+    def reset(self) -> None:
+        """reset
+
+        Forget the players, for a new game
+        """
+
+        self.queues = {}
+
+
+    # keybindings action -> direction
+    ACTION_DIRECTIONS = {
+        "move_up": UP,
+        "move_right": RIGHT,
+        "move_down": DOWN,
+        "move_left": LEFT,
+    }
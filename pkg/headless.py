@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""
+    Headless
+
+
+    Pieces for running a game without a real display or audio device
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from os import environ
+
+from pygame import (
+    Rect,
+    Surface,
+)
+
+
+def use_dummy_drivers() -> None:
+    """use_dummy_drivers
+
+    Point SDL at its dummy video and audio drivers. Has to happen before pygame is initilized.
+    """
+
+    environ["SDL_VIDEODRIVER"] = "dummy"
+    environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+class HeadlessSurface(Surface):
+    """HeadlessSurface
+
+    Game screen for headless runs. Blits and fills are skipped and only
+    report the area they would have touched, anything drawn directly
+    (pygame.draw) still lands in the pixel buffer so drawn rects stay
+    the same as on a real screen.
+    """
+
+    def blit(self, source, dest, area=None, special_flags=0) -> Rect:
+        if isinstance(dest, Rect):
+            dest = dest.topleft
+
+        size = area.size if isinstance(area, Rect) else (area[2:] if area else source.get_size())
+
+        return Rect(dest, size).clip(self.get_rect())
+
+
+    def blits(self, blit_sequence, doreturn=1):
+        if not doreturn:
+            return None
+
+        return [self.blit(*blit_args) for blit_args in blit_sequence]
+
+
+    def fill(self, color, rect=None, special_flags=0) -> Rect:
+        if rect is None:
+            return self.get_rect()
+
+        return Rect(rect).clip(self.get_rect())
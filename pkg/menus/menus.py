@@ -10,7 +10,7 @@
 """
 
 from json import dump as json_dump, load as json_load
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from pygame import (
     mixer,
@@ -87,6 +87,9 @@ class Menu():
         # If the menu display needs to be updated
         self.refresh = False
 
+        # menu option -> (drawn screen, menu obj, state it was drawn for) of the last drawing of each menu
+        self.retained_drawings: dict[int, tuple[Surface, list, tuple]] = {}
+
 
     def _draw_rect_outline(self, rect: Rect, color: tuple, width=1) -> None:
         """_draw_rect_outline
@@ -171,14 +174,17 @@ class Menu():
 
         # clear out first
         if clear_background:
-            chosen_screen.fill(COLOR_BLACK, (position[X], position[Y], (len(content) * self.app.game.game_font.size), self.app.game.game_font.size))
+            cleared = chosen_screen.fill(COLOR_BLACK, (position[X], position[Y], (len(content) * self.app.game.game_font.size), self.app.game.game_font.size))
+            self._mark_dirty(chosen_screen, cleared)
 
-        obj: Rect = self.app.game.game_font.render_to(
+        obj: Rect = self.app.text_cache.render_to(
             chosen_screen,
             position,
+            self.app.game.game_font,
             content,
             color
         )
+        self._mark_dirty(chosen_screen, obj)
 
         if has_outline:
             outline_offset = 10
@@ -200,6 +206,7 @@ class Menu():
         h_offset: int = 0,
         w_offset: int = 0,
         screen = None,
+        is_changing: bool = False,
     ) -> None:
         """render_text
 
@@ -209,6 +216,7 @@ class Menu():
             color (tuple, optional): [description]. Defaults to WHITE.
             h_offset (int, optional): [description]. Defaults to 0.
             screen ([type], optional): [description]. Defaults to None.
+            is_changing (bool, optional): Text that changes often (scores), drawn from glyphs instead of cached whole. Defaults to False.
 
         Returns:
             [type]: [description]
@@ -248,14 +256,92 @@ class Menu():
 
         # clear out first
         if clear_background:
-            chosen_screen.fill(COLOR_BLACK, (position[X], position[Y], (len(content) * self.app.game.game_font.size), self.app.game.game_font.size))
+            cleared = chosen_screen.fill(COLOR_BLACK, (position[X], position[Y], (len(content) * self.app.game.game_font.size), self.app.game.game_font.size))
+            self._mark_dirty(chosen_screen, cleared)
+
+        if is_changing:
+            render_to = self.app.text_cache.render_glyphs_to
+        else:
+            render_to = self.app.text_cache.render_to
 
-        self.app.game.game_font.render_to(
+        rendered = render_to(
             chosen_screen,
             position,
+            self.app.game.game_font,
             content,
             color
         )
+        self._mark_dirty(chosen_screen, rendered)
+
+
+    def _mark_dirty(self, chosen_screen: Surface, rect: Rect) -> None:
+        """_mark_dirty
+
+        Tell the renderer about text drawn straight onto the display surface.
+        """
+
+        if chosen_screen is self.app.renderer.screen:
+            self.app.renderer.mark(rect)
+
+
+    def retained(self, menu_option: int, draw: Callable, *state) -> list:
+        """retained
+
+        Draw a menu, or put back the drawing kept from the last time it was
+        drawn for the same state (the config values/scores shown on it) and
+        screen size, which is one blit. Either way the screen is pushed to
+        the display, menus are the whole screen.
+
+        Args:
+            menu_option (int): The menu to show
+            draw (Callable): draw(menu, *state) draws the menu on the screen and returns it's menu obj
+            state: Everything the menu's drawing depends on
+
+        Returns:
+            [list]: The menu obj
+        """
+
+        if not self._restore(menu_option, state):
+            self.menu = draw(self, *state)
+            self._retain(menu_option, state)
+
+        self.refresh = False
+
+        return self.menu
+
+
+    def _restore(self, menu_option: int, state: tuple) -> bool:
+        """_restore
+
+        Returns:
+            [bool]: If the retained drawing of the menu was put back on the screen
+        """
+
+        retained = self.retained_drawings.get(menu_option)
+        if self.refresh or retained is None:
+            return False
+
+        surface, menu, retained_state = retained
+        if retained_state != (self.app.game.screen.get_size(), *state):
+            return False
+
+        self.app.game.screen.blit(surface, (0, 0))
+        self.app.renderer.mark_all()
+
+        self.menu = menu
+
+        return True
+
+
+    def _retain(self, menu_option: int, state: tuple) -> None:
+        """_retain
+
+        Keep the drawing of a menu that was just drawn on the screen, with it's menu obj
+        """
+
+        screen = self.app.game.screen
+        self.retained_drawings[menu_option] = (screen.copy(), self.menu, (screen.get_size(), *state))
+        self.app.renderer.mark_all()
 
 
     def save_settings(self):
@@ -301,6 +387,8 @@ class Menu():
         with open(self.app.game.game_config_file_path, encoding="utf8") as json_data_file:
             self.app.game.game_config = json_load(json_data_file)
 
+        self.app.voices.set_volumes(self.app.app_config["settings"]["sound"])
+
 
     def toggle_setting(self, config, page, setting_name):
        config["settings"][page][setting_name] = not config["settings"][page][setting_name]
@@ -347,6 +435,7 @@ class Menu():
 
         effect_volume = self.app.app_config["settings"]["sound"]["effect_volume"]
         self.app.app_config["settings"]["sound"]["effect_volume"] = round(float(effect_volume) + .05, 2)
+        self.app.voices.set_volumes(self.app.app_config["settings"]["sound"])
         self.refresh = True
 
 
@@ -358,6 +447,7 @@ class Menu():
 
         effect_volume = self.app.app_config["settings"]["sound"]["effect_volume"]
         self.app.app_config["settings"]["sound"]["effect_volume"] = round(float(effect_volume) - .05, 2)
+        self.app.voices.set_volumes(self.app.app_config["settings"]["sound"])
         self.refresh = True
 
 
@@ -371,6 +461,7 @@ class Menu():
         self.app.app_config["settings"]["sound"]["menu_volume"] = (
             str(float(menu_volume) + .05)
         )
+        self.app.voices.set_volumes(self.app.app_config["settings"]["sound"])
         self.refresh = True
 
 
@@ -384,6 +475,7 @@ class Menu():
         self.app.app_config["settings"]["sound"]["menu_volume"] = (
             str(float(menu_volume) - .05)
         )
+        self.app.voices.set_volumes(self.app.app_config["settings"]["sound"])
         self.refresh = True
 
 
@@ -491,6 +583,7 @@ class Menu():
         )
 
         self.app.game.screen.set_alpha(None)
+        self.app.renderer.set_screen(self.app.game.screen)
 
         self.app.debug_screen = Surface(
             (self.app.screen_width, self.app.screen_height)
@@ -37,79 +37,92 @@ def sound_menu(self: "Menu"):
         # Make sure the right menu option is selected
         self.menu_option = MENU_SOUND
 
-        # Render the Display text
-        self.render_button("Sound", 10, color=COLOR_RED)
-
-        # Render the music button
-        self.render_text('Music:', 7, h_offset=-100)
-        text_str = str(self.app.app_config["settings"]["sound"]["music"])
-        music_obj = self.render_button(text_str, 7, color=COLOR_PURPLE, h_offset=100)
-
-        # Render the Volume view button
-        volume_num = round(
-            100 * float(self.app.app_config["settings"]["sound"]["music_volume"]),
-            2,
-        )
-        text_str = "Music Volume: " + str(volume_num)
-        self.render_text(text_str, 5)
-
-        # Render the Volume Up button
-        music_volume_up_obj = self.render_button("Up", 4, color=COLOR_PURPLE, w_offset=10, h_offset=100)
-
-        # Render the Volume Down button
-        music_volume_down_obj = self.render_button("Down", 4, color=COLOR_PURPLE, w_offset=10, h_offset=-100)
-
-        # Render the Volume view button
-        volume_num = round(
-            100 * float(self.app.app_config["settings"]["sound"]["effect_volume"]),
-            2,
-        )
-        text_str = "Effect Volume: " + str(volume_num)
-        self.render_text(text_str, 2)
-
-        # Render the Volume Up button
-        effect_volume_up_obj = self.render_button("Up", 1, color=COLOR_PURPLE, w_offset=10, h_offset=100)
-
-        # Render the Volume Down button
-        effect_volume_down_obj = self.render_button("Down", 1, color=COLOR_PURPLE, w_offset=10, h_offset=-100)
-
-        # Render the Volume view button
-        volume_num = round(100 * float(self.app.app_config["settings"]["sound"]["menu_volume"]))
-        text_str = "Menu Volume: " + str(volume_num)
-        self.render_text(text_str, -1)
-
-        # Render the Volume Up button
-        menu_volume_up_obj = self.render_button("Up", -2, color=COLOR_PURPLE, w_offset=10, h_offset=100)
-
-        # Render the Volume Down button
-        menu_volume_down_obj = self.render_button("Down", -2, color=COLOR_PURPLE, w_offset=10, h_offset=-100)
-
-        # Render the Save button
-        save_obj = self.render_button("Save", -8, h_offset=125, has_outline=True)
-
-        # Render the Return button
-        back_obj = self.render_button("Back", -8, h_offset=-125, has_outline=True)
-
-        def back_action():
-            self.reload_settings()
-            self.menu_options[MENU_SETTINGS]()
-
-        def sound_save():
-            self.save_settings()
-            self.app.settings_checks()
-
-        self.menu = [
-            (music_obj, self.toggle_game_music, MENU_SOUND, None),
-            (music_volume_up_obj, self.increase_music_volume, MENU_SOUND, None),
-            (music_volume_down_obj, self.decrease_music_volume, MENU_SOUND, None),
-            (effect_volume_up_obj, self.increase_effect_volume, MENU_SOUND, None),
-            (effect_volume_down_obj, self.decrease_effect_volume, MENU_SOUND, None),
-            (menu_volume_up_obj, self.increase_menu_volume, MENU_SOUND, None),
-            (menu_volume_down_obj, self.decrease_menu_volume, MENU_SOUND, None),
-            (save_obj, sound_save, MENU_SOUND, None),
-            (back_obj, back_action, MENU_SOUND, None),
-        ]
-
-        self.refresh = False
+        # The sound settings shown
+        sound_state = tuple(self.app.app_config["settings"]["sound"].items())
+
+        self.retained(MENU_SOUND, _draw_sound_menu, sound_state)
 
     return self.menu
+
+
+def _draw_sound_menu(self: "Menu", sound_state: tuple) -> list:
+    """_draw_sound_menu
+
+    Returns:
+        [list]: The menu obj of the sound menu drawn for sound_state
+    """
+
+    sound_settings = dict(sound_state)
+
+    # Render the Display text
+    self.render_button("Sound", 10, color=COLOR_RED)
+
+    # Render the music button
+    self.render_text('Music:', 7, h_offset=-100)
+    text_str = str(sound_settings["music"])
+    music_obj = self.render_button(text_str, 7, color=COLOR_PURPLE, h_offset=100)
+
+    # Render the Volume view button
+    volume_num = round(
+        100 * float(sound_settings["music_volume"]),
+        2,
+    )
+    text_str = "Music Volume: " + str(volume_num)
+    self.render_text(text_str, 5)
+
+    # Render the Volume Up button
+    music_volume_up_obj = self.render_button("Up", 4, color=COLOR_PURPLE, w_offset=10, h_offset=100)
+
+    # Render the Volume Down button
+    music_volume_down_obj = self.render_button("Down", 4, color=COLOR_PURPLE, w_offset=10, h_offset=-100)
+
+    # Render the Volume view button
+    volume_num = round(
+        100 * float(sound_settings["effect_volume"]),
+        2,
+    )
+    text_str = "Effect Volume: " + str(volume_num)
+    self.render_text(text_str, 2)
+
+    # Render the Volume Up button
+    effect_volume_up_obj = self.render_button("Up", 1, color=COLOR_PURPLE, w_offset=10, h_offset=100)
+
+    # Render the Volume Down button
+    effect_volume_down_obj = self.render_button("Down", 1, color=COLOR_PURPLE, w_offset=10, h_offset=-100)
+
+    # Render the Volume view button
+    volume_num = round(100 * float(sound_settings["menu_volume"]))
+    text_str = "Menu Volume: " + str(volume_num)
+    self.render_text(text_str, -1)
+
+    # Render the Volume Up button
+    menu_volume_up_obj = self.render_button("Up", -2, color=COLOR_PURPLE, w_offset=10, h_offset=100)
+
+    # Render the Volume Down button
+    menu_volume_down_obj = self.render_button("Down", -2, color=COLOR_PURPLE, w_offset=10, h_offset=-100)
+
+    # Render the Save button
+    save_obj = self.render_button("Save", -8, h_offset=125, has_outline=True)
+
+    # Render the Return button
+    back_obj = self.render_button("Back", -8, h_offset=-125, has_outline=True)
+
+    def back_action():
+        self.reload_settings()
+        self.menu_options[MENU_SETTINGS]()
+
+    def sound_save():
+        self.save_settings()
+        self.app.settings_checks()
+
+    return [
+        (music_obj, self.toggle_game_music, MENU_SOUND, None),
+        (music_volume_up_obj, self.increase_music_volume, MENU_SOUND, None),
+        (music_volume_down_obj, self.decrease_music_volume, MENU_SOUND, None),
+        (effect_volume_up_obj, self.increase_effect_volume, MENU_SOUND, None),
+        (effect_volume_down_obj, self.decrease_effect_volume, MENU_SOUND, None),
+        (menu_volume_up_obj, self.increase_menu_volume, MENU_SOUND, None),
+        (menu_volume_down_obj, self.decrease_menu_volume, MENU_SOUND, None),
+        (save_obj, sound_save, MENU_SOUND, None),
+        (back_obj, back_action, MENU_SOUND, None),
+    ]
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+"""
+    Profiler
+
+
+    Named timing spans of the frame phases
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from logging import info as logging_info
+from os import path, makedirs
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class Profiler():
+    """Profiler
+
+    Times named spans of code (with profiler.span("name"): ...) and keeps
+    the last samples of each span in a ring buffer for percentiles. While
+    disabled span hands back a shared do nothing span, so instrumented code
+    costs one attribute check and a method call per span.
+    """
+
+    def __init__(self, enabled: bool = False, samples: int = 600):
+        """Profiler initilizer
+
+        Args:
+            enabled (bool, optional): If spans get timed. Defaults to False.
+            samples (int, optional): Number of samples kept per span. Defaults to 600.
+        """
+
+        self.enabled = enabled
+        self.samples = samples
+
+        # span name -> ring buffer of durations in ms, slot the next sample goes in and samples recorded
+        self.durations: dict[str, "np.ndarray"] = {}
+        self.slots: dict[str, int] = {}
+        self.counts: dict[str, int] = {}
+
+
+    def span(self, name: str) -> "Span":
+        """span
+
+        Returns:
+            [Span]: Context manager timing the code it wraps under name
+        """
+
+        if not self.enabled:
+            return NULL_SPAN
+
+        return Span(self, name)
+
+
+    def record(self, name: str, duration_ms: float) -> None:
+        """record
+
+        Args:
+            name (str): Name of the span
+            duration_ms (float): How long it took
+        """
+
+        durations = self.durations.get(name)
+        if durations is None:
+            # numpy only comes in once something is timed
+            import numpy as np
+
+            durations = self.durations[name] = np.zeros(self.samples, dtype=np.float64)
+            self.slots[name] = 0
+            self.counts[name] = 0
+
+        slot = self.slots[name]
+        durations[slot] = duration_ms
+        self.slots[name] = (slot + 1) % self.samples
+        self.counts[name] += 1
+
+
+    def set_enabled(self, enabled: bool) -> None:
+        """set_enabled
+
+        Args:
+            enabled (bool): If spans get timed, turning it on starts from no samples
+        """
+
+        if enabled and not self.enabled:
+            self.reset()
+
+        self.enabled = enabled
+
+
+    def reset(self) -> None:
+        """reset
+
+        Forget every sample
+        """
+
+        self.durations.clear()
+        self.slots.clear()
+        self.counts.clear()
+
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """stats
+
+        Returns:
+            [dict]: span name -> count/mean/p50/p95/p99/max in ms over the samples kept
+        """
+
+        kept = {
+            name: durations[:min(self.counts[name], self.samples)].copy()
+            for name, durations in self.durations.items()
+        }
+        counts = dict(self.counts)
+
+        import numpy as np
+
+        stats = {}
+        for name, durations in kept.items():
+            p50, p95, p99 = np.percentile(durations, (50, 95, 99))
+            stats[name] = {
+                "count": counts[name],
+                "mean": float(durations.mean()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "max": float(durations.max()),
+            }
+
+        return stats
+
+
+    def report(self) -> str:
+        """report
+
+        Returns:
+            [str]: Table of the span stats, slowest p99 first
+        """
+
+        stats = self.stats()
+
+        lines = [f"{'span':<28}{'count':>9}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)"]
+        for name, span_stats in sorted(stats.items(), key=lambda item: item[1]["p99"], reverse=True):
+            lines.append(
+                f"{name:<28}{span_stats['count']:>9}{span_stats['mean']:>9.3f}{span_stats['p50']:>9.3f}"
+                f"{span_stats['p95']:>9.3f}{span_stats['p99']:>9.3f}{span_stats['max']:>9.3f}"
+            )
+
+        return "\n".join(lines)
+
+
+    def dump(self, file_path: str) -> None:
+        """dump
+
+        Args:
+            file_path (str): Text file to write the report to
+        """
+
+        makedirs(path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w+", encoding="utf8") as output_file:
+            output_file.write(self.report() + "\n")
+
+        logging_info(f"Profile written to {file_path}")
+
+
+class Span():
+    """Span
+
+    Times one run of the code it wraps
+    """
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: Profiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+
+    def __enter__(self) -> "Span":
+        self.start = perf_counter()
+        return self
+
+
+    def __exit__(self, *_) -> None:
+        self.profiler.record(self.name, (perf_counter() - self.start) * 1000)
+
+
+class NullSpan():
+    """NullSpan
+
+    Span of a disabled profiler, times nothing
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "NullSpan":
+        return self
+
+
+    def __exit__(self, *_) -> None:
+        pass
+
+
+NULL_SPAN = NullSpan()
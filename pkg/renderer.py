@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+
+"""
+    Renderer
+
+
+    Dirty rectangle tracking for pushing frames to the display
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from collections import deque
+from itertools import islice
+
+from pygame import (
+    display,
+    Rect,
+    Surface,
+)
+
+from pkg.profiler import Profiler
+
+
+class Renderer():
+    """Renderer
+
+    Collects the areas of the screen changed during a frame so only those
+    get pushed to the display. Once the changed area passes full_update_ratio
+    of the screen (or mark_all is called) the frame is pushed with a full flip.
+
+    Blits and clears are queued in draw order and drawn together with a
+    single Surface.blits call on flush, clears being blits of a solid
+    color surface so they keep their place in the order.
+
+    The areas of the queued blits and clears are also numbered in a
+    bounded log, so something only redrawing part of itself can ask what
+    was drawn over it since it last drew (painted_since).
+    """
+
+    def __init__(self, screen: Surface = None, full_update_ratio: float = 0.5, headless: bool = False, profiler: Profiler = None):
+        """Renderer initilizer
+
+        Args:
+            screen (Surface, optional): The display surface. Defaults to None.
+            full_update_ratio (float, optional): Dirty fraction of the screen past which a full flip is used. Defaults to 0.5.
+            headless (bool, optional): If there is no display to push to. Defaults to False.
+            profiler (Profiler, optional): Times the blits and display pushes. Defaults to None (a disabled one).
+        """
+
+        self.headless = headless
+        self.profiler = profiler or Profiler()
+        self.full_update_ratio = full_update_ratio
+
+        # Areas changed since the last present
+        self.dirty_rects: list[Rect] = []
+
+        # (source, position[, area]) blits waiting for the next flush
+        self.queue: list[tuple] = []
+
+        # color -> screen sized surface of that color, the source of queued clears
+        self.solids: dict[tuple, Surface] = {}
+
+        # Areas of the latest blits and clears, painted_start is the number of the oldest one kept
+        self.painted: deque[Rect] = deque(maxlen=Renderer.PAINT_LOG_SIZE)
+        self.painted_start = 0
+        self.painted_count = 0
+
+        # If the whole screen has to be pushed next present
+        self.full_update = True
+
+        # What the last present did, for the debug/fps displays
+        self.last_rect_count = 0
+        self.last_was_full = True
+
+        self.screen = None
+        self.screen_rect = Rect(0, 0, 0, 0)
+        self.full_update_area = 0
+        if screen is not None:
+            self.set_screen(screen)
+
+
+    def set_screen(self, screen: Surface) -> None:
+        """set_screen
+
+        Args:
+            screen (Surface): The (new) display surface
+        """
+
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.queue = []
+        self.solids = {}
+        self._forget_painted()
+        self.full_update_area = self.screen_rect.width * self.screen_rect.height * self.full_update_ratio
+        self.mark_all()
+
+
+    def blit(self, image: Surface, position: tuple) -> None:
+        """blit
+
+        Queue drawing image on the screen at position.
+        """
+
+        self.queue.append((image, position))
+        self._painted(Rect(position, image.get_size()))
+
+
+    def fill(self, color: tuple, rect: tuple = None) -> None:
+        """fill
+
+        Queue filling an area of the screen with color. Filling the whole
+        screen (rect None) happens right away and drops anything queued.
+        """
+
+        if rect is None:
+            self.queue = []
+            self.screen.fill(color)
+            self.mark_all()
+            self._forget_painted()
+
+            return
+
+        rect = Rect(rect)
+        self.queue.append((self._solid(color), rect.topleft, Rect(0, 0, rect.width, rect.height)))
+        self._painted(rect)
+
+
+    def painted_since(self, number: int) -> list[Rect] | None:
+        """painted_since
+
+        Args:
+            number (int): painted_count as seen before
+
+        Returns:
+            [list]: Areas blitted or cleared since, None if the log doesn't go back
+                that far (or the whole screen was redrawn) and anything may have been
+        """
+
+        if number < self.painted_start:
+            return None
+
+        return list(islice(self.painted, number - self.painted_start, None))
+
+
+    def flush(self) -> None:
+        """flush
+
+        Draw everything queued, in the order it was queued, and mark it.
+        """
+
+        if not self.queue:
+            return
+
+        queue = self.queue
+        self.queue = []
+
+        with self.profiler.span("render.blits"):
+            for rect in self.screen.blits(queue):
+                self.mark(rect)
+
+
+    def _solid(self, color: tuple) -> Surface:
+        """_solid
+
+        Returns:
+            [Surface]: Screen sized surface filled with color
+        """
+
+        color = tuple(color)
+        solid = self.solids.get(color)
+        if solid is None:
+            solid = Surface(self.screen_rect.size)
+            solid.fill(color)
+            self.solids[color] = solid
+
+        return solid
+
+
+    def mark(self, rect: Rect) -> None:
+        """mark
+
+        Args:
+            rect (Rect): An area of the screen that changed
+        """
+
+        if self.full_update or not rect:
+            return
+
+        self.dirty_rects.append(Rect(rect))
+
+
+    def mark_all(self) -> None:
+        """mark_all
+
+        Push the whole screen next present.
+        """
+
+        self.full_update = True
+        self.dirty_rects.clear()
+
+
+    def present(self) -> None:
+        """present
+
+        Push the changed areas of the screen to the display.
+        """
+
+        self.flush()
+
+        if self.full_update or self._dirty_area() > self.full_update_area:
+            self.last_rect_count = 0
+            self.last_was_full = True
+            if not self.headless:
+                with self.profiler.span("display.flip"):
+                    display.flip()
+
+        elif self.dirty_rects:
+            self.last_rect_count = len(self.dirty_rects)
+            self.last_was_full = False
+            if not self.headless:
+                with self.profiler.span("display.update"):
+                    display.update(self.dirty_rects)
+
+        else:
+            self.last_rect_count = 0
+            self.last_was_full = False
+
+        self.dirty_rects = []
+        self.full_update = False
+
+
+    def _painted(self, rect: Rect) -> None:
+        # The oldest area is about to fall off the log
+        if len(self.painted) == Renderer.PAINT_LOG_SIZE:
+            self.painted_start += 1
+
+        self.painted.append(rect)
+        self.painted_count += 1
+
+
+    def _forget_painted(self) -> None:
+        # Everything may have changed, nobody can tell what from the log
+        self.painted.clear()
+        self.painted_start = self.painted_count
+
+
+    def _dirty_area(self) -> int:
+        """_dirty_area
+
+        Returns:
+            [int]: Summed area of the dirty rects (overlaps counted twice)
+        """
+
+        area = 0
+        for rect in self.dirty_rects:
+            area += rect.width * rect.height
+
+        return area
+
+
+    # Number of blit/clear areas kept for painted_since
+    PAINT_LOG_SIZE = 4096
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+"""
+    Tick Scheduler
+
+
+    Persistent executor for the per-tick entity actions of a game
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from logging import (
+    warning as logging_warning,
+)
+from time import perf_counter
+from typing import Callable, Iterable
+
+
+class TickScheduler():
+    """TickScheduler
+
+    Hands the live entities of a tick to the update, draw and collision actions
+    of a game using one of the scheduler modes, and keeps track of how long
+    each phase of the last tick took.
+
+    Everything runs on the calling thread, the entity actions change shared
+    game state (spatial hash, free cells, walkability grid, renderer queue)
+    that isn't safe to touch from more than one thread.
+
+    The modes don't check collisions in the same order. Serial checks each
+    entity right after it moved, before the entities after it move. Phased
+    moves every entity first and checks collisions against where all of
+    them ended up, so the same seed can play out differently per mode.
+    """
+
+    def __init__(self, mode: str = "phased"):
+        """TickScheduler initilizer
+
+        Args:
+            mode (str): One of TickScheduler.MODES. Defaults to "phased".
+        """
+
+        if mode not in TickScheduler.MODES:
+            logging_warning(f"Unknown scheduler mode '{mode}', using '{TickScheduler.PHASED}'")
+            mode = TickScheduler.PHASED
+
+        # How the entity actions are executed
+        self.mode = mode
+
+        # Seconds spent in each phase during the last tick
+        self.timings = {phase: 0.0 for phase in TickScheduler.PHASES}
+
+        # Seconds spent running all the phases of the last tick
+        self.frame_time = 0.0
+
+        # Number of entities handed over during the last tick
+        self.entity_count = 0
+
+        # Mode dispatch
+        self.mode_options = {
+            TickScheduler.SERIAL: lambda *args: self._run_serial(*args),
+            TickScheduler.PHASED: lambda *args: self._run_phased(*args),
+        }
+
+
+    def run(
+        self,
+        entities: Iterable,
+        update: Callable,
+        draw: Callable,
+        collide: Callable,
+    ) -> None:
+        """run
+
+        Runs one tick of entity actions.
+
+        Args:
+            entities (Iterable): The entities to act this tick
+            update (Callable): update(entity) -> result of the update phase
+            draw (Callable): draw(entity, result)
+            collide (Callable): collide(entity, result)
+        """
+
+        entities = list(entities)
+        self.entity_count = len(entities)
+
+        for phase in TickScheduler.PHASES:
+            self.timings[phase] = 0.0
+
+        start = perf_counter()
+
+        self.mode_options.get(self.mode)(entities, update, draw, collide)
+
+        self.frame_time = perf_counter() - start
+
+
+    def timing_report(self) -> str:
+        """timing_report
+
+        Returns:
+            [str]: Human readable per-phase timing of the last tick in milliseconds
+        """
+
+        phases = " ".join(
+            f"{phase}:{self.timings[phase] * 1000:.2f}ms" for phase in TickScheduler.PHASES
+        )
+
+        return f"{self.mode} entities:{self.entity_count} {phases} total:{self.frame_time * 1000:.2f}ms"
+
+
+    def _run_serial(self, entities: list, update: Callable, draw: Callable, collide: Callable) -> None:
+        """_run_serial
+
+        Every entity runs all of its actions before the next entity starts.
+        """
+
+        for entity in entities:
+            update_time, draw_time, collide_time = self._run_entity(entity, update, draw, collide)
+            self.timings["update"] += update_time
+            self.timings["draw"] += draw_time
+            self.timings["collision"] += collide_time
+
+
+    def _run_phased(self, entities: list, update: Callable, draw: Callable, collide: Callable) -> None:
+        """_run_phased
+
+        Deterministic single threaded execution: all updates, then all draws,
+        then all collision checks.
+        """
+
+        start = perf_counter()
+        results = [update(entity) for entity in entities]
+        update_end = perf_counter()
+
+        for entity, result in zip(entities, results):
+            draw(entity, result)
+        draw_end = perf_counter()
+
+        for entity, result in zip(entities, results):
+            collide(entity, result)
+        collide_end = perf_counter()
+
+        self.timings["update"] = update_end - start
+        self.timings["draw"] = draw_end - update_end
+        self.timings["collision"] = collide_end - draw_end
+
+
+    @staticmethod
+    def _run_entity(entity, update: Callable, draw: Callable, collide: Callable) -> tuple[float, float, float]:
+        """_run_entity
+
+        Returns:
+            [tuple]: Seconds spent in the update, draw and collision actions of the entity
+        """
+
+        start = perf_counter()
+        result = update(entity)
+        update_end = perf_counter()
+        draw(entity, result)
+        draw_end = perf_counter()
+        collide(entity, result)
+        collide_end = perf_counter()
+
+        return update_end - start, draw_end - update_end, collide_end - draw_end
+
+
+    # modes the scheduler can run in.
+    #
+    # SERIAL: Each entity runs update, draw and collision in turn, collisions see the entities after it unmoved
+    # PHASED: Update all, draw all, then collide all, collisions see every entity moved
+    (SERIAL, PHASED) = ("serial", "phased")
+    MODES = (SERIAL, PHASED)
+
+    # phases of a tick that are timed
+    PHASES = ("update", "draw", "collision")
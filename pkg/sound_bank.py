@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+"""
+    Sound Bank
+
+
+    Sound effects loaded once and shared by path
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from logging import info as logging_info
+
+from pygame import (
+    error as pygame_error,
+    mixer,
+)
+
+
+class SoundBank():
+    """SoundBank
+
+    Every sound effect file decoded once and shared by everything playing
+    it. Users acquire a path (loading it the first time) and release it when
+    done, the sound is dropped once nothing holds it anymore.
+
+    Without a running mixer there is nothing to play, every lookup is None.
+    """
+
+    def __init__(self):
+        # path -> [sound, users holding it, bytes of samples]
+        self.entries: dict[str, list] = {}
+
+
+    def acquire(self, sound_path: str) -> mixer.Sound | None:
+        """acquire
+
+        Args:
+            sound_path (str): Sound file
+
+        Returns:
+            [Sound]: The shared sound of sound_path, None without a mixer
+        """
+
+        if not mixer.get_init():
+            return None
+
+        entry = self.entries.get(sound_path)
+        if entry is None:
+            sound = self._load(sound_path)
+            entry = self.entries[sound_path] = [sound, 0, len(sound.get_raw())]
+
+        entry[1] += 1
+
+        return entry[0]
+
+
+    def release(self, sound_path: str) -> None:
+        """release
+
+        Args:
+            sound_path (str): Sound file acquired before
+        """
+
+        entry = self.entries.get(sound_path)
+        if entry is None:
+            return
+
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self.entries[sound_path]
+
+
+    def get(self, sound_path: str) -> mixer.Sound | None:
+        """get
+
+        Lookup of a sound without holding it, one nobody acquired yet gets
+        acquired (and held) by the bank.
+
+        Returns:
+            [Sound]: The shared sound of sound_path, None without a mixer
+        """
+
+        entry = self.entries.get(sound_path)
+        if entry is not None:
+            return entry[0]
+
+        return self.acquire(sound_path)
+
+
+    def preload(self, sound_paths: list[str]) -> list[mixer.Sound | None]:
+        """preload
+
+        Acquire a set of sounds up front so nothing loads mid game
+
+        Returns:
+            [list]: The sounds, in sound_paths order
+        """
+
+        sounds = [self.acquire(sound_path) for sound_path in sound_paths]
+
+        stats = self.stats()
+        logging_info(f"Sound bank: {stats['sounds']} sounds, {stats['bytes'] / 1024:.0f}KiB held")
+
+        return sounds
+
+
+    def stats(self) -> dict[str, int]:
+        """stats
+
+        Returns:
+            [dict]: Number of sounds, users holding them and bytes of samples held
+        """
+
+        return {
+            "sounds": len(self.entries),
+            "users": sum(entry[1] for entry in self.entries.values()),
+            "bytes": sum(entry[2] for entry in self.entries.values()),
+        }
+
+
+    @staticmethod
+    def _load(sound_path: str) -> mixer.Sound:
+        """_load
+
+        Returns:
+            [Sound]: sound_path decoded, a second of noise if it can't be
+        """
+
+        try:
+            return mixer.Sound(sound_path)
+
+        except (FileNotFoundError, pygame_error):
+            # default fallback sound, numpy only comes in for a missing file
+            import numpy as np
+            from pygame import sndarray
+
+            size = 44100
+            sound_arr = np.random.randint(-32768, 32767, size=(size, mixer.get_init()[2]), dtype=np.int16)
+
+            return sndarray.make_sound(sound_arr)
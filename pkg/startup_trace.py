@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+
+"""
+    Startup Trace
+
+
+    Import and init times from launch to the first frame
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+import sys
+from importlib.abc import MetaPathFinder
+from importlib.machinery import (
+    ExtensionFileLoader,
+    SourceFileLoader,
+    SourcelessFileLoader,
+)
+from logging import info as logging_info
+from os import path, makedirs
+from time import perf_counter
+
+
+class StartupTrace():
+    """StartupTrace
+
+    Times every module imported while tracing imports (like python -X
+    importtime, cumulative and self time per module) and named init steps
+    (with trace.step("name"): ...), and marks points like the first frame
+    against the time the trace started. While disabled step hands back a
+    shared do nothing step and no imports are traced.
+
+    Only stdlib imports here, it's imported before everything it times.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """StartupTrace initilizer
+
+        Args:
+            enabled (bool, optional): If anything gets timed. Defaults to False.
+        """
+
+        self.enabled = enabled
+        self.start = perf_counter()
+
+        # (module, import depth, cumulative ms, self ms) in the order the imports finished
+        self.imports: list[tuple[str, int, float, float]] = []
+
+        # [step, step depth, ms] in the order the steps started
+        self.steps: list[list] = []
+
+        # mark -> ms since the start, of the first time it was reached
+        self.marks: dict[str, float] = {}
+
+        # Nesting of the imports and steps running, time of the imports done inside each import running
+        self.import_depth = 0
+        self.step_depth = 0
+        self.child_ms: list[float] = []
+
+        self.finder: ImportTimer | None = None
+
+
+    def trace_imports(self) -> None:
+        """trace_imports
+
+        Time every import from now on, until stop_imports
+        """
+
+        if self.enabled and self.finder is None:
+            self.finder = ImportTimer(self)
+            sys.meta_path.insert(0, self.finder)
+
+
+    def stop_imports(self) -> None:
+        """stop_imports
+
+        Stop timing imports
+        """
+
+        if self.finder is not None:
+            sys.meta_path.remove(self.finder)
+            self.finder = None
+
+
+    def step(self, name: str) -> "Step":
+        """step
+
+        Returns:
+            [Step]: Context manager timing the code it wraps under name
+        """
+
+        if not self.enabled:
+            return NULL_STEP
+
+        return Step(self, name)
+
+
+    def mark(self, name: str) -> None:
+        """mark
+
+        Args:
+            name (str): Name of the point reached, only the first time counts
+        """
+
+        if self.enabled and name not in self.marks:
+            self.marks[name] = (perf_counter() - self.start) * 1000
+
+
+    def report(self, min_ms: float = 1.0) -> str:
+        """report
+
+        Args:
+            min_ms (float, optional): Imports quicker than this (cumulative) are left out. Defaults to 1.0.
+
+        Returns:
+            [str]: Table of the marks, steps and imports
+        """
+
+        lines = [f"{'mark':<44}{'at':>10}  (ms)"]
+        for name, at_ms in self.marks.items():
+            lines.append(f"{name:<44}{at_ms:>10.1f}")
+
+        lines.append("")
+        lines.append(f"{'init step':<44}{'ms':>10}")
+        for name, depth, duration_ms in self.steps:
+            lines.append(f"{'  ' * depth + name:<44}{duration_ms:>10.1f}")
+
+        lines.append("")
+        lines.append(f"{'import':<44}{'cumul':>10}{'self':>10}  (ms)")
+        for name, depth, cumulative_ms, self_ms in self.imports:
+            if cumulative_ms >= min_ms:
+                lines.append(f"{'  ' * depth + name:<44}{cumulative_ms:>10.1f}{self_ms:>10.1f}")
+
+        top_level_ms = sum(cumulative_ms for _, depth, cumulative_ms, _ in self.imports if depth == 0)
+        lines.append(f"{'total (' + str(len(self.imports)) + ' modules)':<44}{top_level_ms:>10.1f}")
+
+        return "\n".join(lines)
+
+
+    def dump(self, file_path: str) -> None:
+        """dump
+
+        Args:
+            file_path (str): Text file to write the report to
+        """
+
+        makedirs(path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w+", encoding="utf8") as output_file:
+            output_file.write(self.report() + "\n")
+
+        logging_info(f"Startup trace written to {file_path}")
+
+
+class ImportTimer(MetaPathFinder):
+    """ImportTimer
+
+    First finder on sys.meta_path, finds each module with the finders after
+    it and times the loader running the module. Only file loaders are timed,
+    they're made per module so timing one doesn't touch any other module.
+    """
+
+    def __init__(self, trace: StartupTrace):
+        self.trace = trace
+
+
+    def find_spec(self, fullname: str, search_path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, search_path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        if isinstance(loader, ImportTimer.TIMED_LOADERS):
+            loader.exec_module = self._timed(fullname, loader.exec_module)
+
+        return spec
+
+
+    def _timed(self, fullname: str, exec_module):
+        trace = self.trace
+
+        def timed_exec_module(module) -> None:
+            depth = trace.import_depth
+            trace.import_depth += 1
+            trace.child_ms.append(0.0)
+            start = perf_counter()
+            try:
+                exec_module(module)
+
+            finally:
+                cumulative_ms = (perf_counter() - start) * 1000
+                self_ms = cumulative_ms - trace.child_ms.pop()
+                trace.import_depth = depth
+                if trace.child_ms:
+                    trace.child_ms[-1] += cumulative_ms
+                trace.imports.append((fullname, depth, cumulative_ms, self_ms))
+
+        return timed_exec_module
+
+
+    # Loaders made per module
+    TIMED_LOADERS = (SourceFileLoader, SourcelessFileLoader, ExtensionFileLoader)
+
+
+class Step():
+    """Step
+
+    Times one init step
+    """
+
+    __slots__ = ("trace", "name", "start", "entry")
+
+    def __init__(self, trace: StartupTrace, name: str):
+        self.trace = trace
+        self.name = name
+        self.start = 0.0
+        self.entry = None
+
+
+    def __enter__(self) -> "Step":
+        # Listed when started, so steps inside it come after it
+        self.entry = [self.name, self.trace.step_depth, 0.0]
+        self.trace.steps.append(self.entry)
+        self.trace.step_depth += 1
+        self.start = perf_counter()
+        return self
+
+
+    def __exit__(self, *_) -> None:
+        self.entry[2] = (perf_counter() - self.start) * 1000
+        self.trace.step_depth = self.entry[1]
+
+
+class NullStep():
+    """NullStep
+
+    Step of a disabled trace, times nothing
+    """
+
+    __slots__ = ()
+
+
+    def __enter__(self) -> "NullStep":
+        return self
+
+
+    def __exit__(self, *_) -> None:
+        pass
+
+
+NULL_STEP = NullStep()
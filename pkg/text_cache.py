@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+"""
+    Text Cache
+
+
+    Pre-rendered text and glyph surfaces
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from collections import OrderedDict
+
+from pygame import (
+    freetype,
+    Rect,
+    Surface,
+)
+
+
+class TextCache():
+    """TextCache
+
+    Surfaces of rendered strings keyed by (string, font, size, color), the
+    least recently used dropped past max_entries. Blitting a cached surface
+    draws the same pixels as font.render_to at the same position.
+
+    Strings that change all the time (scores, fps) would just churn the
+    cache, those are drawn glyph by glyph from a GlyphAtlas instead.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """TextCache initilizer
+
+        Args:
+            max_entries (int, optional): Number of rendered strings kept. Defaults to 256.
+        """
+
+        self.max_entries = max_entries
+
+        # (string, font, size, color) -> rendered surface, least recently used first
+        self.entries: OrderedDict = OrderedDict()
+
+        # (font, size, color) -> glyph atlas
+        self.atlases: dict[tuple, GlyphAtlas] = {}
+
+        # Lookups answered from the cache and ones that had to render
+        self.hits = 0
+        self.misses = 0
+
+
+    def get(self, font: freetype.Font, content: str, color: tuple, size: float = 0) -> Surface:
+        """get
+
+        Args:
+            font (Font): Font to render with
+            content (str): The string
+            color (tuple): Text color
+            size (float, optional): Font size. Defaults to 0 (the font's size).
+
+        Returns:
+            [Surface]: content rendered, blit it where render_to would have drawn it
+        """
+
+        key = (content, font, size or font.size, tuple(color))
+
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface, _ = font.render(content, color, size=size)
+        self.entries[key] = surface
+
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+        return surface
+
+
+    def render_to(self, surface: Surface, position: tuple, font: freetype.Font, content: str, color: tuple, size: float = 0) -> Rect:
+        """render_to
+
+        Drop in for font.render_to(surface, position, content, color, size=size)
+
+        Returns:
+            [Rect]: Area drawn on
+        """
+
+        return surface.blit(self.get(font, content, color, size), position)
+
+
+    def atlas(self, font: freetype.Font, color: tuple, size: float = 0) -> "GlyphAtlas":
+        """atlas
+
+        Returns:
+            [GlyphAtlas]: The glyphs of font in color and size
+        """
+
+        key = (font, size or font.size, tuple(color))
+
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(font, color, size)
+
+        return atlas
+
+
+    def render_glyphs_to(self, surface: Surface, position: tuple, font: freetype.Font, content: str, color: tuple, size: float = 0) -> Rect:
+        """render_glyphs_to
+
+        Like render_to, for strings that change too often to be worth caching whole
+
+        Returns:
+            [Rect]: Area drawn on
+        """
+
+        return self.atlas(font, color, size).render_to(surface, position, content)
+
+
+    def clear(self) -> None:
+        """clear
+
+        Drop every rendered string and glyph
+        """
+
+        self.entries.clear()
+        self.atlases.clear()
+
+
+class GlyphAtlas():
+    """GlyphAtlas
+
+    Every character of a font in one size and color rendered once, strings
+    are drawn by blitting their glyphs along the baseline. Matches render_to
+    for fonts drawn without kerning (the freetype default).
+    """
+
+    def __init__(self, font: freetype.Font, color: tuple, size: float = 0):
+        """GlyphAtlas initilizer
+
+        Args:
+            font (Font): Font of the glyphs
+            color (tuple): Color of the glyphs
+            size (float, optional): Font size. Defaults to 0 (the font's size).
+        """
+
+        self.font = font
+        self.color = tuple(color)
+        self.size = size
+
+        # character -> (glyph surface, x offset from the pen, height above the baseline, advance)
+        self.glyphs: dict[str, tuple[Surface, int, int, float]] = {}
+
+
+    def glyph(self, character: str) -> tuple[Surface, int, int, float]:
+        """glyph
+
+        Returns:
+            [tuple]: (surface, x offset from the pen, height above the baseline, advance) of character
+        """
+
+        glyph = self.glyphs.get(character)
+        if glyph is None:
+            surface, rect = self.font.render(character, self.color, size=self.size)
+            metrics = self.font.get_metrics(character, size=self.size)[0]
+            advance = metrics[4] if metrics else rect.width
+            glyph = self.glyphs[character] = (surface, rect.x, rect.y, advance)
+
+        return glyph
+
+
+    def render_to(self, surface: Surface, position: tuple, content: str) -> Rect:
+        """render_to
+
+        Draw content with it's bounding box's top left at position, like font.render_to
+
+        Returns:
+            [Rect]: Area drawn on
+        """
+
+        if not content:
+            return Rect(int(position[0]), int(position[1]), 0, 0)
+
+        # Lay the glyphs out from a pen at 0 on a baseline at 0
+        placed = []
+        pen = 0.0
+        for character in content:
+            glyph_surface, offset_x, above, advance = self.glyph(character)
+            placed.append((glyph_surface, int(pen) + offset_x, -above))
+            pen += advance
+
+        # Shift so the bounding box starts at position
+        left = min(x for _, x, _ in placed)
+        top = min(y for _, _, y in placed)
+        origin_x = int(position[0]) - left
+        origin_y = int(position[1]) - top
+
+        drawn = surface.blits(
+            [(glyph_surface, (origin_x + x, origin_y + y)) for glyph_surface, x, y in placed]
+        )
+
+        area = drawn[0].unionall(drawn[1:])
+
+        return area
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+"""
+    Voices
+
+
+    Sound effect playback over a fixed pool of mixer channels
+    :copyright: (c) 2021 by Nicholas Murphy.
+    :license: GPLv3, see LICENSE for more details.
+"""
+
+from pygame import (
+    mixer,
+    time,
+)
+
+from pkg.app_config import SoundConfig
+
+
+class VoiceManager():
+    """VoiceManager
+
+    Plays sound effects on a pool of reserved mixer channels. A sound
+    played again within cooldown_ms of its last play is coalesced into the
+    play already going, and once every channel is busy the longest playing
+    one is cut off, so a tick with dozens of deaths still costs at most a
+    handful of plays.
+
+    Effect and menu volumes are parsed from the sound config when it
+    changes (set_volumes) instead of on every play.
+    """
+
+    def __init__(self, channels: int = 8, cooldown_ms: int = 40):
+        """VoiceManager initilizer
+
+        Args:
+            channels (int, optional): Mixer channels reserved for sound effects. Defaults to 8.
+            cooldown_ms (int, optional): Time a sound can't be played again for. Defaults to 40.
+        """
+
+        self.channel_count = channels
+        self.cooldown_ms = cooldown_ms
+
+        # The reserved channels and when each started playing, empty without a mixer
+        self.channels: list[mixer.Channel] = []
+        self.started_ms: list[int] = []
+
+        # Sound -> when it was last played
+        self.last_played: dict[mixer.Sound, int] = {}
+
+        # Volume group -> volume from the sound config
+        self.volumes = {"effect": 1.0, "menu": 1.0}
+
+        # Plays made and plays coalesced into one already going
+        self.played = 0
+        self.coalesced = 0
+
+
+    def setup(self) -> None:
+        """setup
+
+        Reserve the channels, again after every (re)start of the mixer
+        """
+
+        self.last_played = {}
+
+        if not mixer.get_init():
+            self.channels = []
+            self.started_ms = []
+            return
+
+        if mixer.get_num_channels() < self.channel_count:
+            mixer.set_num_channels(self.channel_count)
+        mixer.set_reserved(self.channel_count)
+
+        self.channels = [mixer.Channel(index) for index in range(self.channel_count)]
+        self.started_ms = [0] * self.channel_count
+
+
+    def set_volumes(self, sound_config: SoundConfig) -> None:
+        """set_volumes
+
+        Args:
+            sound_config (SoundConfig): The sound settings, after they changed
+        """
+
+        self.volumes["effect"] = float(sound_config["effect_volume"])
+        self.volumes["menu"] = float(sound_config["menu_volume"])
+
+
+    def play(self, sound: mixer.Sound, volume: float = 1.0, group: str = "effect") -> bool:
+        """play
+
+        Args:
+            sound (Sound): Sound to play
+            volume (float, optional): Scale of the group's volume. Defaults to 1.0.
+            group (str, optional): "effect" or "menu" volume. Defaults to "effect".
+
+        Returns:
+            [bool]: If it's played, False if coalesced or there is no mixer
+        """
+
+        if not self.channels or sound is None:
+            return False
+
+        now = time.get_ticks()
+
+        # Already playing from just now
+        last_played = self.last_played.get(sound)
+        if last_played is not None and now - last_played < self.cooldown_ms:
+            self.coalesced += 1
+            return False
+
+        self.last_played[sound] = now
+
+        # A free channel, or the one playing the longest
+        started_ms = self.started_ms
+        index = 0
+        for channel_index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                index = channel_index
+                break
+
+            if started_ms[channel_index] < started_ms[index]:
+                index = channel_index
+
+        channel = self.channels[index]
+        channel.set_volume(self.volumes[group] * volume)
+        channel.play(sound)
+        started_ms[index] = now
+        self.played += 1
+
+        return True